@@ -0,0 +1,376 @@
+"""
+DataManager 성능 측정 모듈입니다. 화면 없이 실행됩니다.
+
+합성 저장소(1k/10k/100k/1M 항목, 짧은 값부터 수십 KB 값까지 섞음)를 만들어
+로드, 추가, 수정, 삭제, 저장, 전체 조회의 처리량(ops/sec), p50/p99 지연,
+변경 한 번당 기록한 바이트 수, 최대 메모리(RSS)를 측정합니다.
+
+    python benchmark.py --save-baseline          # 기준값 저장
+    python benchmark.py                          # 기준값과 비교 (퇴행 시 종료 코드 1)
+    python benchmark.py --sizes 1000 10000 --modes journal indexed --tolerance 0.3
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+from constants import (
+    DEFAULT_FONT_SIZE_VALUE,
+    STORAGE_MODE_SNAPSHOT,
+    STORAGE_MODE_JOURNAL,
+    STORAGE_MODE_INDEXED,
+    STORAGE_MODE_SQLITE,
+)
+
+BENCHMARK_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+BENCHMARK_MODES = [
+    STORAGE_MODE_SNAPSHOT,
+    STORAGE_MODE_JOURNAL,
+    STORAGE_MODE_INDEXED,
+    STORAGE_MODE_SQLITE,
+]
+BENCHMARK_BASELINE_FILE = "benchmark_baseline.json"
+BENCHMARK_TOLERANCE = 0.25  # 기준값보다 25% 넘게 나빠지면 퇴행
+BENCHMARK_OPS = 200  # 연산 종류별 최대 반복 횟수
+BENCHMARK_MIN_OPS = 5  # 시간 예산을 넘어도 최소 이만큼은 반복
+BENCHMARK_MAX_SECONDS = 10.0  # 연산 종류별 시간 예산
+BENCHMARK_SEED = 1234
+
+# (비율, 최소 바이트, 최대 바이트): 대부분 짧고, 일부는 blob으로 분리될 만큼 큼
+VALUE_SIZE_MIX = [
+    (0.85, 8, 64),
+    (0.145, 128, 2048),
+    (0.005, 16 * 1024, 48 * 1024),
+]
+
+# 값이 클수록 좋은 지표 (나머지는 작을수록 좋음)
+HIGHER_IS_BETTER = {"ops_per_sec"}
+
+
+def _random_value(rng: random.Random) -> str:
+    """VALUE_SIZE_MIX 분포를 따르는 임의 길이의 값"""
+    roll = rng.random()
+    for ratio, low, high in VALUE_SIZE_MIX:
+        if roll < ratio:
+            break
+        roll -= ratio
+    length = rng.randint(low, high)
+    word = f"{rng.getrandbits(32):08x} "
+    return (word * (length // len(word) + 1))[:length]
+
+
+def build_store(path: str, mode: str, size: int, seed: int) -> None:
+    """size개 항목을 가진 합성 저장소를 만듭니다 (측정에는 포함하지 않음)."""
+    from data_manager import DataManager
+    from storage_backends import migrate_json_to_sqlite
+
+    rng = random.Random(seed)
+    json_path = path if mode != STORAGE_MODE_SQLITE else path + ".json"
+    data = {
+        "font_size": DEFAULT_FONT_SIZE_VALUE,
+        "list": [
+            {"key": f"key-{i}-{rng.getrandbits(24):06x}", "value": _random_value(rng)}
+            for i in range(size)
+        ],
+    }
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    del data
+
+    if mode == STORAGE_MODE_SQLITE:
+        migrate_json_to_sqlite(json_path, path)
+        os.remove(json_path)
+    elif mode == STORAGE_MODE_INDEXED:
+        # 처음 열 때 값 영역으로 옮기는 변환은 측정에서 제외
+        DataManager(path, mode).close()
+
+
+def _bytes_written() -> Optional[int]:
+    """지금까지 write 계열 시스템 호출로 기록한 바이트 수 (Linux 전용)"""
+    try:
+        with open("/proc/self/io", "rb") as f:
+            for line in f:
+                if line.startswith(b"wchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """프로세스 최대 RSS (MB)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _measure(
+    op: Callable[[int], Any], ops: int, max_seconds: float, mutation: bool
+) -> Dict[str, float]:
+    """op(i)를 반복 실행해 처리량과 지연 분포를 구합니다."""
+    samples: List[float] = []
+    written_before = _bytes_written()
+    started = time.perf_counter()
+    for i in range(ops):
+        t = time.perf_counter()
+        op(i)
+        samples.append(time.perf_counter() - t)
+        if i + 1 >= BENCHMARK_MIN_OPS and time.perf_counter() - started > max_seconds:
+            break
+    written_after = _bytes_written()
+
+    result = {
+        "ops": len(samples),
+        "ops_per_sec": len(samples) / sum(samples) if sum(samples) else 0.0,
+        "p50_ms": _percentile(samples, 0.50) * 1000,
+        "p99_ms": _percentile(samples, 0.99) * 1000,
+    }
+    if mutation and written_before is not None and written_after is not None:
+        result["bytes_per_op"] = (written_after - written_before) / len(samples)
+    return result
+
+
+def run_scenario(
+    path: str,
+    mode: str,
+    ops: int = BENCHMARK_OPS,
+    max_seconds: float = BENCHMARK_MAX_SECONDS,
+    write_behind: bool = False,
+    seed: int = BENCHMARK_SEED,
+) -> Dict[str, Any]:
+    """build_store()로 만든 저장소 하나에 대한 측정 결과를 반환합니다.
+
+    최대 RSS가 시나리오별 값이 되도록 저장소 생성과는 다른 새 프로세스에서
+    호출합니다.
+    """
+    from data_manager import DataManager
+
+    rng = random.Random(seed + 1)
+    values = [_random_value(rng) for _ in range(ops)]
+    # 오류 메시지 등 출력은 파일 쓰기 바이트에 섞이지 않도록 메모리로
+    with contextlib.redirect_stdout(io.StringIO()):
+        dm_holder: List[DataManager] = []
+
+        def load(_):
+            if dm_holder:
+                dm_holder.pop().close()
+            dm_holder.append(DataManager(path, mode, write_behind=write_behind))
+
+        results: Dict[str, Any] = {
+            "load_data": _measure(load, 3, max_seconds, mutation=False)
+        }
+        dm = dm_holder[0]
+        results["get_items"] = _measure(
+            lambda i: dm.get_items(), min(ops, 20), max_seconds, mutation=False
+        )
+        results["add_item"] = _measure(
+            lambda i: dm.add_item(f"bench-{i}", values[i]),
+            ops,
+            max_seconds,
+            mutation=True,
+        )
+        results["update_item"] = _measure(
+            lambda i: dm.update_item(
+                rng.randrange(dm.get_item_count()), f"bench-u{i}", values[i]
+            ),
+            ops,
+            max_seconds,
+            mutation=True,
+        )
+        results["delete_data"] = _measure(
+            lambda i: dm.delete_data(rng.randrange(dm.get_item_count())),
+            ops,
+            max_seconds,
+            mutation=True,
+        )
+        results["save_data"] = _measure(
+            lambda i: dm.save_data() and dm.flush(),
+            min(ops, 20),
+            max_seconds,
+            mutation=True,
+        )
+        dm.close()
+
+    results["peak_rss_mb"] = _peak_rss_mb()
+    return results
+
+
+def _run_in_subprocess(mode: str, size: int, args: argparse.Namespace) -> Dict[str, Any]:
+    """저장소 생성과 측정을 각각 새 파이썬 프로세스에서 실행합니다."""
+    script = os.path.abspath(__file__)
+    with tempfile.TemporaryDirectory(prefix="copyandpaste-bench-") as directory:
+        path = os.path.join(
+            directory, "data.db" if mode == STORAGE_MODE_SQLITE else "data.json"
+        )
+        result_file = os.path.join(directory, "result.json")
+        seed = str(args.seed)
+        subprocess.run(
+            [sys.executable, script, "--build", mode, str(size), path, "--seed", seed],
+            check=True,
+        )
+        command = [
+            sys.executable,
+            script,
+            "--worker",
+            mode,
+            path,
+            result_file,
+            "--ops",
+            str(args.ops),
+            "--max-seconds",
+            str(args.max_seconds),
+            "--seed",
+            seed,
+        ]
+        if args.write_behind:
+            command.append("--write-behind")
+        subprocess.run(command, check=True)
+        with open(result_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """기준값보다 tolerance 비율을 넘게 나빠진 지표 목록을 반환합니다."""
+    regressions = []
+    for scenario, metrics in current.items():
+        base_metrics = baseline.get(scenario)
+        if not base_metrics:
+            continue
+        for name, value in _flatten(metrics).items():
+            base = _flatten(base_metrics).get(name)
+            if base is None or value is None or not base:
+                continue
+            metric = name.rsplit(".", 1)[-1]
+            if metric == "ops":
+                continue
+            if metric in HIGHER_IS_BETTER:
+                worse = value < base * (1 - tolerance)
+            else:
+                worse = value > base * (1 + tolerance)
+            if worse:
+                regressions.append(f"{scenario} {name}: {base:.4g} -> {value:.4g}")
+    return regressions
+
+
+def _flatten(metrics: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    flat: Dict[str, Optional[float]] = {}
+    for name, value in metrics.items():
+        if isinstance(value, dict):
+            for metric, number in value.items():
+                flat[f"{name}.{metric}"] = number
+        else:
+            flat[name] = value
+    return flat
+
+
+def _print_results(scenario: str, metrics: Dict[str, Any]) -> None:
+    print(f"\n[{scenario}] 최대 RSS: {metrics.get('peak_rss_mb') or 0:.1f} MB")
+    for op, stats in metrics.items():
+        if not isinstance(stats, dict):
+            continue
+        line = (
+            f"  {op:<12} {stats['ops_per_sec']:>12.1f} ops/s"
+            f"  p50 {stats['p50_ms']:>9.3f} ms  p99 {stats['p99_ms']:>9.3f} ms"
+        )
+        if "bytes_per_op" in stats:
+            line += f"  {stats['bytes_per_op']:>12.0f} B/op"
+        print(line)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """벤치마크 실행 및 기준값 비교"""
+    parser = argparse.ArgumentParser(description="DataManager 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=BENCHMARK_SIZES)
+    parser.add_argument("--modes", nargs="+", default=BENCHMARK_MODES)
+    parser.add_argument("--ops", type=int, default=BENCHMARK_OPS)
+    parser.add_argument("--max-seconds", type=float, default=BENCHMARK_MAX_SECONDS)
+    parser.add_argument("--seed", type=int, default=BENCHMARK_SEED)
+    parser.add_argument(
+        "--write-behind",
+        action="store_true",
+        help="백그라운드 저장을 켜고 측정 (변경 지연은 예약 시간만 포함)",
+    )
+    parser.add_argument("--baseline", default=BENCHMARK_BASELINE_FILE)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="결과를 기준값 파일에 저장"
+    )
+    parser.add_argument("--tolerance", type=float, default=BENCHMARK_TOLERANCE)
+    parser.add_argument("--output", help="이번 결과를 저장할 JSON 파일")
+    parser.add_argument(
+        "--build", nargs=3, metavar=("MODE", "SIZE", "PATH"), help=argparse.SUPPRESS
+    )
+    parser.add_argument(
+        "--worker", nargs=3, metavar=("MODE", "PATH", "RESULT"), help=argparse.SUPPRESS
+    )
+    args = parser.parse_args(argv)
+
+    if args.build:
+        mode, size, path = args.build
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_store(path, mode, int(size), args.seed)
+        return 0
+    if args.worker:
+        mode, path, result_file = args.worker
+        result = run_scenario(
+            path, mode, args.ops, args.max_seconds, args.write_behind, args.seed
+        )
+        with open(result_file, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        return 0
+
+    results: Dict[str, Any] = {}
+    for mode in args.modes:
+        for size in args.sizes:
+            scenario = f"{mode}/{size}"
+            try:
+                results[scenario] = _run_in_subprocess(mode, size, args)
+            except Exception as e:
+                print(f"{scenario} 측정 중 오류 발생: {e}")
+                continue
+            _print_results(scenario, results[scenario])
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n기준값을 저장했습니다: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\n기준값 파일이 없어 비교를 건너뜁니다: {args.baseline}")
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(baseline, results, args.tolerance)
+    if regressions:
+        print(f"\n성능 퇴행 {len(regressions)}건 (허용 {args.tolerance:.0%}):")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print(f"\n기준값 대비 퇴행 없음 (허용 {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
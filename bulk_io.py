@@ -0,0 +1,317 @@
+"""
+대량 가져오기/내보내기를 담당하는 모듈입니다.
+CSV, TSV, JSONL 파일을 한 줄씩 읽고 써서 파일 크기와 관계없이 메모리를 적게
+쓰며, 가져온 항목은 저장소에 한 번만 저장합니다. wx에 의존하지 않습니다.
+
+UI에서는 작업 스레드에서 호출하고 dispatch에 wx.CallAfter를 넘기면,
+DataManager 호출만 메인 스레드에서 BULK_CHUNK_SIZE개씩 실행되므로 그 사이에
+이벤트 루프가 계속 돕니다. 앱을 닫은 상태에서는 명령줄로도 쓸 수 있습니다.
+
+    python bulk_io.py import data.json snippets.csv
+    python bulk_io.py export data.json backup.jsonl
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import tempfile
+import threading
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    TypeVar,
+)
+from constants import (
+    BULK_FORMAT_CSV,
+    BULK_FORMAT_TSV,
+    BULK_FORMAT_JSONL,
+    BULK_CHUNK_SIZE,
+    BULK_MAX_ERRORS,
+    BULK_FIELD_SIZE_LIMIT,
+)
+
+if TYPE_CHECKING:
+    from data_manager import DataManager
+
+T = TypeVar("T")
+
+# (처리한 개수, 전체 개수)를 받는 진행 상황 콜백
+ProgressCallback = Callable[[int, int], None]
+# 함수를 메인(UI) 스레드에서 실행하도록 넘기는 함수 (예: wx.CallAfter)
+Dispatcher = Callable[[Callable[[], None]], None]
+
+# 파일 확장자 -> 형식
+FORMAT_EXTENSIONS: Dict[str, str] = {
+    ".csv": BULK_FORMAT_CSV,
+    ".tsv": BULK_FORMAT_TSV,
+    ".tab": BULK_FORMAT_TSV,
+    ".jsonl": BULK_FORMAT_JSONL,
+    ".ndjson": BULK_FORMAT_JSONL,
+}
+
+_HEADER = ["key", "value"]
+
+
+class ImportResult:
+    """가져오기 결과"""
+
+    def __init__(self):
+        self.imported = 0
+        self.skipped = 0
+        self.errors: List[str] = []  # 건너뛴 줄 중 앞쪽 BULK_MAX_ERRORS개의 이유
+        self.duplicates = 0  # unique_keys 저장소에서 이미 있는 키라 건너뛴 항목 수
+        self.saved = False
+
+    def skip(self, line: int, reason: str) -> None:
+        self.skipped += 1
+        if len(self.errors) < BULK_MAX_ERRORS:
+            self.errors.append(f"{line}번째 줄: {reason}")
+
+
+def detect_format(path: str) -> str:
+    """파일 확장자로 형식을 정합니다."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMAT_EXTENSIONS:
+        raise ValueError(f"지원하지 않는 파일 형식입니다 (csv, tsv, jsonl): {path}")
+    return FORMAT_EXTENSIONS[extension]
+
+
+def _call(dispatch: Optional[Dispatcher], func: Callable[[], T]) -> T:
+    """func를 메인 스레드에서 실행하고(dispatch가 없으면 바로) 결과를 기다립니다."""
+    if dispatch is None:
+        return func()
+    done = threading.Event()
+    result: Dict[str, Any] = {}
+
+    def run() -> None:
+        try:
+            result["value"] = func()
+        except BaseException as e:
+            result["error"] = e
+        finally:
+            done.set()
+
+    dispatch(run)
+    done.wait()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+def _validate(key: Any, value: Any) -> Optional[str]:
+    """항목으로 쓸 수 없으면 이유를 반환합니다."""
+    if not isinstance(key, str) or not isinstance(value, str):
+        return "key와 value는 문자열이어야 합니다"
+    if not key.strip() and not value.strip():
+        # 입력창에서처럼 둘 다 비어 있으면 저장하지 않음
+        return "key와 value가 모두 비어 있습니다"
+    return None
+
+
+def _read_rows(
+    f: TextIO, fmt: str
+) -> Iterator[Tuple[int, Optional[Tuple[str, str]], str]]:
+    """파일을 한 줄씩 읽어 (줄 번호, (키, 값) 또는 None, 건너뛴 이유)를 냅니다.
+
+    CSV/TSV는 첫 줄이 key,value 머리글이면 건너뜁니다. 인코딩 오류나 깨진
+    따옴표처럼 파일 자체를 읽을 수 없으면 ValueError를 발생시킵니다.
+    """
+    try:
+        if fmt == BULK_FORMAT_JSONL:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_number, None, f"JSON 파싱 오류: {e}"
+                    continue
+                if not isinstance(record, dict):
+                    yield line_number, None, "객체가 아닙니다"
+                    continue
+                key, value = record.get("key"), record.get("value")
+                reason = _validate(key, value)
+                yield line_number, None if reason else (key, value), reason or ""
+            return
+
+        csv.field_size_limit(BULK_FIELD_SIZE_LIMIT)
+        delimiter = "\t" if fmt == BULK_FORMAT_TSV else ","
+        reader = csv.reader(f, delimiter=delimiter)
+        for row in reader:
+            if reader.line_num == 1 and [cell.lower() for cell in row] == _HEADER:
+                continue
+            if not row:
+                continue
+            if len(row) != 2:
+                yield reader.line_num, None, f"칸이 2개가 아닙니다 ({len(row)}개)"
+                continue
+            key, value = row
+            reason = _validate(key, value)
+            yield reader.line_num, None if reason else (key, value), reason or ""
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise ValueError(f"파일을 읽을 수 없습니다: {e}") from e
+
+
+def _open_for_read(path: str) -> TextIO:
+    # utf-8-sig: 엑셀 등이 붙이는 BOM을 무시
+    return open(path, "r", encoding="utf-8-sig", newline="")
+
+
+def import_file(
+    data_manager: "DataManager",
+    path: str,
+    fmt: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None,
+    dispatch: Optional[Dispatcher] = None,
+) -> ImportResult:
+    """파일의 항목들을 저장소 끝에 추가합니다.
+
+    먼저 파일 전체를 한 번 훑어 검사하므로, 파일을 읽을 수 없으면 저장소를
+    바꾸기 전에 ValueError가 발생합니다. 잘못된 줄은 건너뛰고 결과에
+    기록합니다. 항목은 BULK_CHUNK_SIZE개씩 메모리에 추가한 뒤 마지막에 한
+    번만 저장합니다. 키 중복을 막는 저장소면 이미 있는 키는 건너뛰고
+    result.duplicates에 셉니다.
+
+    도중에 예외가 나면 가져온 항목을 모두 되돌린 뒤 예외를 그대로 전달하고,
+    저장에 실패하면 되돌린 뒤 result.saved가 False인 결과를 반환합니다.
+    """
+    fmt = fmt or detect_format(path)
+    result = ImportResult()
+    total = 0
+    with _open_for_read(path) as f:
+        for line_number, pair, reason in _read_rows(f, fmt):
+            if pair is None:
+                result.skip(line_number, reason)
+            else:
+                total += 1
+    if not total:
+        return result
+
+    if not _call(dispatch, data_manager.begin_import):
+        raise RuntimeError("지금은 항목을 가져올 수 없습니다.")
+    try:
+        with _open_for_read(path) as f:
+            pairs = (pair for _, pair, _ in _read_rows(f, fmt) if pair is not None)
+            while True:
+                chunk = list(islice(pairs, BULK_CHUNK_SIZE))
+                if not chunk:
+                    break
+                added = _call(dispatch, lambda: data_manager.import_chunk(chunk))
+                result.imported += added
+                result.duplicates += len(chunk) - added
+                if progress is not None:
+                    progress(result.imported + result.duplicates, total)
+    except BaseException:
+        # 일부만 가져온 채 저장하지 않고 가져오기 전 상태로 되돌림
+        _call(dispatch, lambda: data_manager.end_import(commit=False))
+        raise
+    result.saved = _call(dispatch, data_manager.end_import)
+    return result
+
+
+def _write_record(writer: Any, f: TextIO, fmt: str, key: str, value: str) -> None:
+    if fmt == BULK_FORMAT_JSONL:
+        f.write(json.dumps({"key": key, "value": value}, ensure_ascii=False) + "\n")
+    else:
+        writer.writerow((key, value))
+
+
+def export_file(
+    data_manager: "DataManager",
+    path: str,
+    fmt: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None,
+    dispatch: Optional[Dispatcher] = None,
+) -> int:
+    """모든 항목을 파일로 내보내고 개수를 반환합니다.
+
+    BULK_CHUNK_SIZE개씩 읽어 임시 파일에 쓴 뒤 교체하므로, 도중에 실패해도
+    기존 파일은 그대로 남습니다. CSV/TSV에는 key,value 머리글을 씁니다.
+    """
+    fmt = fmt or detect_format(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp"
+    )
+    written = 0
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            writer = None
+            if fmt != BULK_FORMAT_JSONL:
+                delimiter = "\t" if fmt == BULK_FORMAT_TSV else ","
+                writer = csv.writer(f, delimiter=delimiter, lineterminator="\n")
+                writer.writerow(_HEADER)
+            total = _call(dispatch, data_manager.get_item_count)
+            while written < total:
+                start = written
+                items = _call(
+                    dispatch, lambda: data_manager.get_range(start, BULK_CHUNK_SIZE)
+                )
+                if not items:
+                    break
+                for item in items:
+                    _write_record(writer, f, fmt, item["key"], item["value"])
+                written += len(items)
+                if progress is not None:
+                    progress(written, total)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return written
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령줄 진입점 (앱을 닫은 상태에서 사용)"""
+    parser = argparse.ArgumentParser(description="복붙 저장소 가져오기/내보내기")
+    parser.add_argument("command", choices=["import", "export"])
+    parser.add_argument("data_file", help="저장소 파일 (data.json 또는 .db)")
+    parser.add_argument("path", help="CSV, TSV, JSONL 파일")
+    parser.add_argument(
+        "--unique-keys", action="store_true", help="이미 있는 키는 가져오지 않음"
+    )
+    args = parser.parse_args(argv)
+
+    # 저장소 모듈은 명령줄에서 쓸 때만 필요
+    from data_manager import DataManager
+    from storage_backends import detect_storage_mode
+
+    data_manager = DataManager(
+        args.data_file,
+        detect_storage_mode(args.data_file),
+        unique_keys=args.unique_keys,
+    )
+    try:
+        if args.command == "import":
+            result = import_file(data_manager, args.path)
+            print(f"{result.imported}개 가져옴, {result.skipped}개 건너뜀")
+            if result.duplicates:
+                print(f"  이미 있는 키 {result.duplicates}개")
+            for error in result.errors:
+                print(f"  {error}")
+            return 0 if result.saved or not result.imported else 1
+        count = export_file(data_manager, args.path)
+        print(f"{count}개 내보냄")
+        return 0
+    except (OSError, ValueError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+    finally:
+        data_manager.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
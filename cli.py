@@ -0,0 +1,125 @@
+"""
+복붙 저장소를 명령줄에서 쓰는 클라이언트입니다.
+실행 중인 앱(main.py --ipc)에 Unix 도메인 소켓으로 요청하므로 wx를 불러오거나
+저장소를 읽지 않고 바로 끝납니다. 앱이 실행 중이 아니면 조회(get, keys)만
+저장소를 직접 읽어 처리합니다.
+
+    python cli.py get 인사
+    python cli.py keys
+    python cli.py add 인사 "안녕하세요"
+    python cli.py set 인사 "안녕하세요"
+    python cli.py update 인사 "반갑습니다" --new-key 인사말
+    python cli.py delete 인사
+    python cli.py copy 인사
+"""
+
+import argparse
+import os
+import sys
+from typing import Optional
+from constants import (
+    DEFAULT_DATA_FILE,
+    STORAGE_MODE_JOURNAL,
+    IPC_OP_GET,
+    IPC_OP_KEYS,
+    IPC_OP_ADD,
+    IPC_OP_UPDATE,
+    IPC_OP_DELETE,
+    IPC_OP_COPY,
+    IPC_OP_SET,
+)
+from ipc_server import Request, RequestHandler, Response, ipc_supported, send_request
+
+
+def _read_directly(request: Request, data_file: str) -> Response:
+    """실행 중인 앱이 없을 때 저장소를 직접 읽어 조회 요청을 처리합니다.
+
+    변경 요청은 다른 곳에서 열려 있을지 모르는 저장소를 덮어쓸 수 있으므로
+    처리하지 않습니다. 저장 방식은 파일을 보고 정하며, 저장소는 읽기 전용으로
+    열어 잘린 저널을 고치거나 압축하는 등 파일을 바꾸는 일을 하지 않습니다.
+    """
+    if request["op"] not in (IPC_OP_GET, IPC_OP_KEYS):
+        return {
+            "ok": False,
+            "error": "실행 중인 앱이 없습니다 (python main.py --ipc로 실행하세요).",
+        }
+    # 서버에 요청할 때는 필요 없는 저장소 모듈을 여기서만 불러옴
+    from data_manager import DataManager
+    from storage_backends import create_backend, detect_storage_mode
+
+    storage_mode = detect_storage_mode(data_file)
+    # 저널 방식은 압축 전까지 스냅샷 없이 저널만 있을 수 있음
+    if storage_mode != STORAGE_MODE_JOURNAL and not os.path.exists(data_file):
+        return {"ok": False, "error": f"저장소가 없습니다: {data_file}"}
+    backend = create_backend(data_file, storage_mode, read_only=True)
+    data_manager = DataManager(data_file, storage_mode, backend=backend)
+    try:
+        return RequestHandler(data_manager).handle(request)
+    finally:
+        data_manager.close()
+
+
+def run(
+    request: Request, data_file: str, socket_path: Optional[str] = None
+) -> Response:
+    """실행 중인 앱에 요청하고, 앱이 없거나 아직 불러오는 중이면 직접 읽습니다."""
+    if ipc_supported():
+        try:
+            response = send_request(request, socket_path)
+        except OSError:
+            response = None
+        if response is not None and not response.get("loading"):
+            return response
+    return _read_directly(request, data_file)
+
+
+def main() -> int:
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="복붙 저장소 명령줄 클라이언트")
+    parser.add_argument(
+        "--data-file",
+        default=DEFAULT_DATA_FILE,
+        help="앱이 실행 중이 아닐 때 직접 읽을 저장소 파일",
+    )
+    parser.add_argument("--socket", help="IPC 소켓 경로 (기본: 사용자별 경로)")
+    commands = parser.add_subparsers(dest="op", required=True)
+    get_parser = commands.add_parser(IPC_OP_GET, help="키의 값을 출력")
+    get_parser.add_argument("key")
+    commands.add_parser(IPC_OP_KEYS, help="모든 키를 한 줄에 하나씩 출력")
+    add_parser = commands.add_parser(IPC_OP_ADD, help="항목 추가")
+    add_parser.add_argument("key")
+    add_parser.add_argument("value")
+    set_parser = commands.add_parser(IPC_OP_SET, help="키가 있으면 값 수정, 없으면 추가")
+    set_parser.add_argument("key")
+    set_parser.add_argument("value")
+    update_parser = commands.add_parser(IPC_OP_UPDATE, help="항목의 값(과 키) 수정")
+    update_parser.add_argument("key")
+    update_parser.add_argument("value")
+    update_parser.add_argument("--new-key", help="바꿀 키")
+    delete_parser = commands.add_parser(IPC_OP_DELETE, help="항목 삭제")
+    delete_parser.add_argument("key")
+    copy_parser = commands.add_parser(IPC_OP_COPY, help="앱이 값을 클립보드에 복사")
+    copy_parser.add_argument("key")
+    args = parser.parse_args()
+
+    request: Request = {"op": args.op}
+    for name in ("key", "value", "new_key"):
+        value = getattr(args, name, None)
+        if value is not None:
+            request[name] = value
+
+    response = run(request, args.data_file, args.socket)
+    if not response.get("ok"):
+        print(f"오류: {response.get('error')}", file=sys.stderr)
+        return 1
+    if args.op == IPC_OP_GET:
+        # 스크립트에서 그대로 쓸 수 있도록 줄바꿈을 붙이지 않음
+        sys.stdout.write(response["value"])
+    elif args.op == IPC_OP_KEYS:
+        for key in response["keys"]:
+            print(key)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+클립보드 기록을 담당하는 모듈입니다.
+다른 프로그램에서 복사한 텍스트를 정해진 개수까지만 최근 순으로 보관하고,
+같은 내용은 해시로 찾아 한 항목으로 합칩니다. wx에 의존하지 않으며,
+클립보드를 읽는 쪽(UIManager의 타이머)이 observe()에 텍스트를 넘겨줍니다.
+"""
+
+import hashlib
+import sys
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+from constants import (
+    CLIPBOARD_HISTORY_CAPACITY,
+    CLIPBOARD_HISTORY_MAX_CHARS,
+    CLIPBOARD_HISTORY_KEY_LENGTH,
+)
+
+
+def content_digest(text: str) -> bytes:
+    """중복 판별에 쓰는 내용 해시"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class HistoryEntry:
+    """기록 항목 하나"""
+
+    __slots__ = ("text", "digest", "copied_at", "copy_count")
+
+    def __init__(self, text: str, digest: bytes):
+        self.text = text
+        self.digest = digest
+        self.copied_at = time.time()
+        self.copy_count = 1
+
+    def suggested_key(self) -> str:
+        """저장소로 옮길 때 쓸 키 (첫 줄 앞부분)"""
+        lines = self.text.strip().splitlines()
+        return lines[0][:CLIPBOARD_HISTORY_KEY_LENGTH] if lines else ""
+
+
+class ClipboardHistory:
+    """개수가 제한된 클립보드 기록
+
+    해시 -> 항목의 OrderedDict를 링 버퍼처럼 사용합니다. 새 내용은 끝에
+    추가하고 개수를 넘으면 가장 오래된 항목을 버리며, 이미 있는 내용을 다시
+    복사하면 해당 항목만 끝으로 옮기므로 모두 O(1)입니다. 값이 max_chars보다
+    긴 텍스트는 기록하지 않아 메모리 사용량도 capacity * max_chars로 제한됩니다.
+    """
+
+    def __init__(
+        self,
+        capacity: int = CLIPBOARD_HISTORY_CAPACITY,
+        max_chars: int = CLIPBOARD_HISTORY_MAX_CHARS,
+        change_counter: Optional[Callable[[], int]] = None,
+    ):
+        self.capacity = capacity
+        self.max_chars = max_chars
+        # 운영체제의 클립보드 변경 번호 (clipboard_change_counter() 참고)
+        self.change_counter = change_counter
+        self._last_change: Optional[int] = None
+        self._entries: "OrderedDict[bytes, HistoryEntry]" = OrderedDict()
+        # 최근 것부터의 목록 (변경 시에만 다시 만듦)
+        self._newest_first: Optional[List[HistoryEntry]] = None
+        # 마지막으로 본 클립보드 텍스트의 (길이, hash())
+        self._last_seen: Optional[Tuple[int, int]] = None
+
+    def poll(self, read_text: Callable[[], Optional[str]]) -> bool:
+        """클립보드가 바뀌었으면 read_text()로 읽어 observe()에 넘깁니다.
+
+        change_counter가 있으면 번호가 그대로인 동안 클립보드를 읽지 않으므로
+        확인 한 번이 O(1)입니다. 없으면 매번 읽어 observe()로 비교합니다.
+        기록이 바뀌었으면 True를 반환합니다.
+        """
+        if self.change_counter is not None:
+            change = self.change_counter()
+            if change == self._last_change:
+                return False
+            self._last_change = change
+        return self.observe(read_text())
+
+    def observe(self, text: Optional[str]) -> bool:
+        """클립보드에서 읽은 텍스트를 넘겨받아 기록합니다.
+
+        직전에 본 텍스트와 (길이, hash())가 같으면 기록하지 않고 반환합니다.
+        다만 클립보드에서 새로 읽은 문자열은 hash()가 캐시되어 있지 않으므로,
+        내용이 그대로여도 호출마다 텍스트 길이에 비례하는 해시 계산을 합니다
+        (상수 시간이 아님). max_chars보다 긴 텍스트는 기록하지 않으므로 해시도
+        계산하지 않아, 한 번의 비용은 max_chars로 제한됩니다. 변경 번호를 주는
+        운영체제에서는 poll()이 이 호출 자체를 건너뜁니다.
+        기록이 바뀌었으면 True를 반환합니다.
+        """
+        if not text:
+            return False
+        if len(text) > self.max_chars:
+            self._last_seen = None
+            return False
+        seen = (len(text), hash(text))
+        if seen == self._last_seen:
+            return False
+        self._last_seen = seen
+        return self.add(text)
+
+    def ignore(self, text: str) -> None:
+        """이 앱이 직접 복사한 텍스트는 기록하지 않도록 미리 본 것으로 표시합니다."""
+        self._last_seen = (len(text), hash(text))
+
+    def add(self, text: str) -> bool:
+        """텍스트를 가장 최근 항목으로 기록합니다. 기록이 바뀌었으면 True."""
+        if not text.strip() or len(text) > self.max_chars:
+            return False
+        digest = content_digest(text)
+        entry = self._entries.get(digest)
+        if entry is not None:
+            entry.copied_at = time.time()
+            entry.copy_count += 1
+            if next(reversed(self._entries)) == digest:
+                return False
+            self._entries.move_to_end(digest)
+        else:
+            self._entries[digest] = HistoryEntry(text, digest)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+        self._newest_first = None
+        return True
+
+    def entries(self) -> List[HistoryEntry]:
+        """최근 항목부터의 목록"""
+        if self._newest_first is None:
+            self._newest_first = list(reversed(self._entries.values()))
+        return self._newest_first
+
+    def get(self, row: int) -> Optional[HistoryEntry]:
+        """최근 것부터 row번째 항목. 없으면 None."""
+        entries = self.entries()
+        if 0 <= row < len(entries):
+            return entries[row]
+        return None
+
+    def remove(self, entry: HistoryEntry) -> None:
+        if self._entries.pop(entry.digest, None) is not None:
+            self._newest_first = None
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._newest_first = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def clipboard_change_counter() -> Optional[Callable[[], int]]:
+    """운영체제의 클립보드 변경 번호를 읽는 함수를 반환합니다.
+
+    Windows(GetClipboardSequenceNumber)와 macOS(pyobjc가 있을 때
+    NSPasteboard.changeCount)에서만 제공되며, 없으면 None입니다. 이 번호가
+    그대로면 클립보드 내용을 읽지 않아도 됩니다 (ClipboardHistory.poll()).
+    """
+    if sys.platform == "win32":
+        import ctypes
+
+        return ctypes.windll.user32.GetClipboardSequenceNumber
+    if sys.platform == "darwin":
+        try:
+            from AppKit import NSPasteboard
+        except ImportError:
+            return None
+        pasteboard = NSPasteboard.generalPasteboard()
+        return pasteboard.changeCount
+    return None
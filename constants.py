@@ -3,6 +3,8 @@
 """
 
 # UI 관련 상수
+WINDOW_TITLE = "복붙"
+WINDOW_LOADING_TITLE = "복붙 (불러오는 중...)"
 WINDOW_WIDTH = 220
 WINDOW_HEIGHT = 500
 WINDOW_MIN_HEIGHT = 450
@@ -13,6 +15,12 @@ WINDOW_MARGIN_Y = 150
 KEY_COLUMN_RATIO = 0.6
 VALUE_COLUMN_RATIO = 0.4
 
+# VALUE 컬럼 말줄임 처리
+VALUE_COLUMN_PADDING = 10
+ELLIPSIS = "..."
+TRUNCATE_CACHE_SIZE = 4096  # (폰트, 너비, 값) 조합 캐시 항목 수
+RESIZE_SETTLE_DELAY = 120  # 크기 조정이 이만큼(ms) 멈추면 새 너비로 다시 자름
+
 # 입력 필드 크기
 INPUT_FIELD_WIDTH = 100
 
@@ -26,6 +34,26 @@ STATUS_FRAME_HEIGHT = 30
 STATUS_DISPLAY_TIME = 2000  # 2초
 STATUS_OFFSET_Y = 40
 
+# 성능 계측 (instrumentation.py)
+METRICS_ENV = "COPYANDPASTE_METRICS"  # 기록할 JSONL 경로, "-"는 표준 에러
+METRICS_MODE_ENV = "COPYANDPASTE_METRICS_MODE"
+METRICS_MODE_SUMMARY = "summary"  # 주기적인 요약만 기록
+METRICS_MODE_EVENTS = "events"  # 구간마다 한 줄씩 + 요약
+METRICS_SUMMARY_INTERVAL = 10.0  # 요약 기록 주기 (초)
+
+# 빠른 붙여넣기 팔레트
+PALETTE_WIDTH = 360
+PALETTE_HEIGHT = 280
+PALETTE_MAX_RESULTS = 50
+PALETTE_HOTKEY_KEY = "V"  # Ctrl(macOS는 Cmd)+Shift와 함께 누름
+
+# 클립보드 기록
+CLIPBOARD_HISTORY_CAPACITY = 200  # 보관할 최대 항목 수 (오래된 것부터 버림)
+CLIPBOARD_HISTORY_MAX_CHARS = 20000  # 이보다 긴 텍스트는 기록하지 않음
+CLIPBOARD_HISTORY_KEY_LENGTH = 30  # 저장소로 옮길 때 키로 쓸 첫 줄 글자 수
+CLIPBOARD_POLL_INTERVAL = 500  # 클립보드 확인 주기 (ms)
+HISTORY_LIST_HEIGHT = 120
+
 # 패널 여백
 PANEL_MARGIN = 5
 ROUNDED_PANEL_RADIUS = 10
@@ -35,3 +63,80 @@ STATUS_PANEL_RADIUS = 8
 DEFAULT_DATA_FILE = "./data.json"
 DEFAULT_FONT_SIZE_VALUE = 15
 DEFAULT_INIT_DATA = {"font_size": DEFAULT_FONT_SIZE_VALUE, "list": []}
+
+# 저장 방식
+STORAGE_MODE_SNAPSHOT = "snapshot"  # 변경마다 전체 JSON 파일 저장
+STORAGE_MODE_JOURNAL = "journal"  # 변경마다 저널에 레코드 한 줄 추가
+STORAGE_MODE_SQLITE = "sqlite"  # SQLite(WAL) 데이터베이스, 변경마다 한 행 트랜잭션
+# 키/오프셋 색인만 메모리에 올리고 값은 모두 값 영역(blob 파일)에서 필요할 때 읽음
+STORAGE_MODE_INDEXED = "indexed"
+SQLITE_FILE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+SQLITE_FILE_HEADER = b"SQLite format 3\x00"  # 확장자가 다른 SQLite 파일을 알아볼 때
+SQLITE_PAGE_SIZE = 200  # 리스트 표시용으로 한 번에 읽어 오는 행 수
+SQLITE_PAGE_CACHE_PAGES = 8
+
+# 저널 관련
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_COMPACTING_SUFFIX = ".compacting"
+JOURNAL_GENERATION_KEY = "journal_generation"
+JOURNAL_COMPACT_MIN_BYTES = 1024 * 1024  # 저널이 이 크기를 넘고
+JOURNAL_COMPACT_RATIO = 0.5  # 스냅샷 크기의 이 비율을 넘으면 압축
+JOURNAL_OP_ADD = "add"
+JOURNAL_OP_UPDATE = "update"
+JOURNAL_OP_DELETE = "delete"
+JOURNAL_OP_CLEAR = "clear"
+JOURNAL_OP_FONT_SIZE = "font_size"
+JOURNAL_OP_SETTING = "setting"
+JOURNAL_OP_BATCH = "batch"  # 배치 하나의 레코드들을 한 줄로 묶음 (함께 적용되거나 버려짐)
+
+# 여러 인스턴스가 같은 저장소를 공유할 때
+STORE_LOCK_SUFFIX = ".lock"  # 변경 시 advisory 잠금을 거는 파일
+SHARED_POLL_INTERVAL = 1000  # 다른 인스턴스의 변경(저널 크기)을 확인하는 주기 (ms)
+
+# 로컬 IPC 서버 (ipc_server.py, cli.py)
+IPC_SOCKET_ENV = "COPYANDPASTE_SOCKET"  # 소켓 경로를 바꿀 때 쓰는 환경 변수
+IPC_SOCKET_NAME = "copyandpaste"  # XDG_RUNTIME_DIR(없으면 임시 디렉토리)의 소켓 이름
+IPC_TIMEOUT = 5.0  # 연결과 응답을 기다리는 시간 (초)
+IPC_DISPATCH_TIMEOUT = 4.0  # 서버가 메인 스레드의 처리를 기다리는 시간 (IPC_TIMEOUT보다 짧게)
+IPC_MAX_REQUEST_BYTES = 64 * 1024 * 1024  # 요청 한 줄의 최대 크기
+IPC_OP_GET = "get"
+IPC_OP_KEYS = "keys"
+IPC_OP_ADD = "add"
+IPC_OP_UPDATE = "update"
+IPC_OP_DELETE = "delete"
+IPC_OP_COPY = "copy"
+IPC_OP_SET = "set"  # 키가 있으면 값 수정, 없으면 추가
+
+# 대량 가져오기/내보내기 (bulk_io.py)
+BULK_FORMAT_CSV = "csv"
+BULK_FORMAT_TSV = "tsv"
+BULK_FORMAT_JSONL = "jsonl"
+BULK_CHUNK_SIZE = 2000  # 메인 스레드에서 한 번에 적용하거나 읽는 항목 수
+BULK_MAX_ERRORS = 20  # 결과에 남길 잘못된 줄 메시지 수
+BULK_FIELD_SIZE_LIMIT = 2**31 - 1  # CSV 필드 최대 길이 (큰 값도 읽도록)
+# 파일 대화상자 형식 목록 (순서는 BULK_FILE_EXTENSIONS와 같음)
+BULK_FILE_WILDCARD = "CSV (*.csv)|*.csv|TSV (*.tsv)|*.tsv|JSON Lines (*.jsonl)|*.jsonl"
+BULK_FILE_EXTENSIONS = (".csv", ".tsv", ".jsonl")
+
+# 백그라운드 저장: 연속된 변경을 한 번의 쓰기로 합치기 위해 기다리는 시간(초)
+WRITE_BEHIND_DELAY = 0.2
+
+# 큰 값 분리 저장 (blob 파일)
+BLOB_SUFFIX = ".blobs"
+BLOB_GENERATION_KEY = "blob_generation"
+BLOB_THRESHOLD = 16 * 1024  # 이 바이트 수 이상인 값은 blob 파일에 저장
+BLOB_COMPACT_MIN_BYTES = 1024 * 1024  # 버려진 공간이 이보다 크고
+BLOB_COMPACT_RATIO = 1.0  # 살아 있는 값 크기의 이 비율을 넘으면 시작 시 정리
+VALUE_PREVIEW_LENGTH = 256  # 리스트 표시용 값 미리보기 글자 수
+VALUE_CACHE_BYTES = 8 * 1024 * 1024  # blob에서 읽은 값 LRU 캐시 예산 (바이트)
+
+# 검색 인덱스
+SEARCH_VALUE_LIMIT = 4096  # 값은 앞쪽 이 글자 수까지만 색인
+SEARCH_NARROW_LIMIT = 2000  # 이전 결과가 이보다 작을 때만 그 안에서 좁혀 나감
+TRIE_FUZZY_VISIT_LIMIT = 20000  # 퍼지 키 검색 시 방문할 최대 트라이 노드 수
+
+# 데이터 변경 이벤트 (DataManager 리스너에 전달)
+CHANGE_ADD = "add"
+CHANGE_UPDATE = "update"
+CHANGE_DELETE = "delete"
+CHANGE_RESET = "reset"  # 일괄 변경: 전체 다시 그리기
@@ -1,123 +1,733 @@
 """
 데이터 관리 기능을 담당하는 모듈입니다.
-JSON 파일을 통한 데이터 저장 및 로드를 처리합니다.
+저장소 백엔드(JSON 파일, SQLite)를 통한 데이터 저장 및 로드를 처리하고,
+변경 사항을 리스너와 항목 인덱스(검색 등)에 반영합니다.
 """
 
-import json
-import os
-from typing import List, Dict, Any, Optional
-from constants import DEFAULT_DATA_FILE, DEFAULT_INIT_DATA, DEFAULT_FONT_SIZE_VALUE
+import threading
+from contextlib import contextmanager
+from itertools import islice
+from typing import (
+    Callable,
+    ContextManager,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from constants import (
+    DEFAULT_DATA_FILE,
+    DEFAULT_FONT_SIZE_VALUE,
+    CHANGE_ADD,
+    CHANGE_UPDATE,
+    CHANGE_DELETE,
+    CHANGE_RESET,
+    STORAGE_MODE_SNAPSHOT,
+    SEARCH_VALUE_LIMIT,
+    VALUE_PREVIEW_LENGTH,
+    VALUE_CACHE_BYTES,
+    BULK_CHUNK_SIZE,
+    JOURNAL_OP_BATCH,
+)
+from storage_backends import ChangeFeed, StorageBackend, create_backend
+from journal import JournalRecord
+from instrumentation import timed
+from indexes import ItemIndex, KeyIndex, KeyTrie, Row, RowIdMap, SearchIndex
+
+# (이벤트 종류, 행 인덱스)를 받는 변경 리스너
+ChangeListener = Callable[[str, int], None]
+# 백그라운드 로드가 끝나면 (실패 시 예외, 성공 시 None)으로 호출되는 콜백
+LoadCallback = Callable[[Optional[Exception]], None]
 
 
 class DataManager:
-    """JSON 파일을 통한 데이터 관리 클래스"""
+    """저장소 백엔드를 통한 데이터 관리 클래스
+
+    메모리(백엔드)의 상태가 기준이며, 디스크는 외부에서 실제로 바뀐 경우에만
+    다시 읽습니다.
+
+    load=False로 만들면 저장소를 읽지 않은 채 빈 상태로 시작하고,
+    load_in_background()로 작업 스레드에서 불러올 수 있습니다. 불러오기가
+    끝나기 전에는 항목 수가 0이며 변경 요청은 거부됩니다.
+
+    shared=True면 여러 인스턴스(창, 도우미 프로세스)가 같은 저장소를 씁니다.
+    변경은 저장소 잠금 안에서 다른 인스턴스의 변경을 먼저 반영한 뒤 기록하므로
+    서로의 변경을 덮어쓰지 않고, reload_if_changed()는 전체를 다시 읽지 않고
+    새로 기록된 변경만 적용합니다.
 
-    def __init__(self, json_file: str = DEFAULT_DATA_FILE):
+    unique_keys=True면 이미 다른 항목이 쓰는 키로 추가하거나 바꾸는 요청을
+    거부합니다 (이미 저장된 중복은 그대로 두며 find_duplicate_keys()로 찾음).
+    """
+
+    def __init__(
+        self,
+        json_file: str = DEFAULT_DATA_FILE,
+        storage_mode: str = STORAGE_MODE_SNAPSHOT,
+        write_behind: bool = False,
+        backend: Optional[StorageBackend] = None,
+        value_cache_bytes: int = VALUE_CACHE_BYTES,
+        load: bool = True,
+        shared: bool = False,
+        unique_keys: bool = False,
+    ):
         self.json_file = json_file
-        self.data = self.load_data()
-
-    def load_data(self) -> Dict[str, Any]:
-        """JSON 파일에서 데이터를 로드합니다. 없으면 자동 생성."""
-        if not os.path.exists(self.json_file):
-            # 파일이 없으면 기본 데이터로 생성
-            self.data = DEFAULT_INIT_DATA.copy()
-            self.save_data()
-            return self.data
-        if os.path.exists(self.json_file):
+        self.storage_mode = storage_mode
+        self.shared = shared
+        self.unique_keys = unique_keys
+        self.backend = backend or create_backend(
+            json_file, storage_mode, write_behind, value_cache_bytes, shared
+        )
+        self._listeners: List[ChangeListener] = []
+        # 행 위치가 바뀌어도 유지되는 행 ID와, 이를 기준으로 갱신되는 인덱스들
+        self.row_ids = RowIdMap()
+        self._indexes: List[ItemIndex] = []
+        self._search_index: Optional[SearchIndex] = None
+        self._key_trie: Optional[KeyTrie] = None
+        self._key_index: Optional[KeyIndex] = None
+        self.loaded = False
+        # 대량 가져오기 중에 잡고 있는 저장소 잠금 (begin_import ~ end_import)
+        self._import_lock: Optional[ContextManager] = None
+        # batch() 중첩 깊이와, 배치 중에 미뤄 둔 변경 알림이 있는지 여부
+        self._batch_depth = 0
+        self._batch_changed = False
+        if load:
+            self.load_data()
+
+    def add_listener(self, listener: ChangeListener) -> None:
+        """항목 변경 시 호출될 리스너를 등록합니다."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: ChangeListener) -> None:
+        """등록된 리스너를 제거합니다."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, event: str, index: int = -1) -> None:
+        """등록된 리스너들에게 변경 사항을 알립니다.
+
+        배치 중에는 알리지 않고, 배치가 커밋될 때 CHANGE_RESET을 한 번 알립니다.
+        """
+        if self._batch_depth:
+            self._batch_changed = True
+            return
+        for listener in list(self._listeners):
             try:
-                with open(self.json_file, "r", encoding="utf-8") as f:
-                    loaded_data = json.load(f)
-                    # 데이터 구조 검증 및 보정
-                    if not isinstance(loaded_data, dict):
-                        print(f"잘못된 데이터 구조: {self.json_file}")
-                        return DEFAULT_INIT_DATA.copy()
-                    if "list" not in loaded_data:
-                        loaded_data["list"] = []
-                    if "font_size" not in loaded_data:
-                        loaded_data["font_size"] = DEFAULT_FONT_SIZE_VALUE
-                    return loaded_data
-            except json.JSONDecodeError as e:
-                print(f"JSON 파싱 오류: {e}")
-                return DEFAULT_INIT_DATA.copy()
+                listener(event, index)
+            except Exception as e:
+                print(f"변경 리스너 처리 중 오류 발생: {e}")
+
+    @timed("data.load")
+    def load_data(self) -> None:
+        """저장소에서 데이터를 로드합니다. 없으면 자동 생성.
+
+        다시 로드하는 경우 내용이 그대로인 행은 이전 행 ID로도 찾을 수 있습니다.
+        """
+        previous = self.backend.row_identities() if self.loaded else None
+        self.backend.load()
+        self._rebuild_indexes(previous)
+        self.loaded = True
+
+    def load_in_background(self, on_done: LoadCallback) -> threading.Thread:
+        """작업 스레드에서 저장소를 로드합니다.
+
+        끝나면 작업 스레드에서 on_done을 호출하므로, UI에서는 wx.CallAfter 등으로
+        메인 스레드에 넘겨서 처리해야 합니다.
+        """
+
+        def run() -> None:
+            try:
+                self.load_data()
             except Exception as e:
                 print(f"데이터 로드 중 오류 발생: {e}")
-                return DEFAULT_INIT_DATA.copy()
-        return DEFAULT_INIT_DATA.copy()
+                on_done(e)
+                return
+            on_done(None)
 
-    def save_data(self) -> bool:
-        """데이터를 JSON 파일에 저장합니다."""
-        try:
-            # 디렉토리가 존재하지 않으면 생성
-            os.makedirs(os.path.dirname(self.json_file), exist_ok=True)
-            with open(self.json_file, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
-            print(f"데이터가 성공적으로 저장되었습니다: {self.json_file}")
+        thread = threading.Thread(target=run, name="data-load", daemon=True)
+        thread.start()
+        return thread
+
+    def _check_loaded(self) -> bool:
+        """아직 로드 중이거나 대량 가져오기 중이면 변경 요청을 거부합니다."""
+        if not self.loaded:
+            print("데이터를 불러오는 중에는 변경할 수 없습니다.")
+            return False
+        if self.importing:
+            print("항목을 가져오는 중에는 변경할 수 없습니다.")
+            return False
+        return True
+
+    @property
+    def batching(self) -> bool:
+        """batch() 블록 안인지 여부"""
+        return self._batch_depth > 0
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """여러 변경을 하나의 트랜잭션으로 묶습니다.
+
+            with data_manager.batch():
+                data_manager.delete_data(3)
+                data_manager.add_item("키", "값")
+
+        블록 안의 변경은 메모리(와 인덱스)에만 적용되고, 블록이 끝나면 한 번에
+        저장한 뒤 리스너에 CHANGE_RESET을 한 번만 알립니다. 블록에서 예외가
+        나면 블록 전 상태로 되돌리고 아무것도 저장하지 않습니다. 저장에
+        실패하면 되돌린 뒤 RuntimeError를 발생시킵니다.
+
+        중첩된 batch()는 가장 바깥 블록에 합쳐집니다. 공유 저장소면 블록이
+        끝날 때까지 저장소 잠금을 잡고 있습니다.
+        """
+        if self._batch_depth:
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+            return
+        if not self._check_loaded():
+            raise RuntimeError("지금은 변경할 수 없습니다.")
+        with self.backend.lock():
+            self._catch_up()
+            self.backend.begin_batch()
+            self._batch_depth = 1
+            self._batch_changed = False
+            try:
+                yield
+            except BaseException:
+                self._batch_depth = 0
+                # 되돌린 뒤에도 그대로인 행은 같은 행 ID로 이어 줌
+                previous = self.backend.row_identities()
+                self.backend.rollback_batch()
+                if self._batch_changed:
+                    self._rebuild_indexes(previous)
+                raise
+            self._batch_depth = 0
+            previous = self.backend.row_identities() if self._batch_changed else None
+            committed = self.backend.commit_batch()
+        if not committed:
+            if self._batch_changed:
+                self._rebuild_indexes(previous)
+            raise RuntimeError("변경 사항을 저장하지 못했습니다.")
+        if self._batch_changed:
+            self._notify(CHANGE_RESET)
+
+    @property
+    def importing(self) -> bool:
+        """대량 가져오기 중인지 여부"""
+        return self._import_lock is not None
+
+    def _catch_up(self, index: int = -1) -> Optional[int]:
+        """공유 저장소면 다른 인스턴스의 변경을 먼저 반영합니다 (잠금 안에서 호출).
+
+        그 사이 index 위치의 행이 옮겨졌으면 새 위치를, 삭제되었으면 None을
+        반환합니다.
+        """
+        if not self.shared:
+            return index
+        row_id = None
+        if 0 <= index < len(self.row_ids.ids):
+            row_id = self.row_ids.id_at(index)
+        if not self.apply_external_changes() or row_id is None:
+            return index
+        return self.row_ids.position(row_id)
+
+    def apply_external_changes(self) -> bool:
+        """다른 인스턴스가 기록한 변경만 읽어 반영하고 리스너에 알립니다.
+
+        저널이 압축되어 새 파일로 바뀌었거나 레코드를 적용할 수 없으면 전체를
+        다시 로드합니다. 반영한 변경이 있으면 True를 반환합니다.
+        """
+        if isinstance(self.backend, ChangeFeed):
+            records = self.backend.read_external_changes()
+        else:
+            # 변경 레코드가 없는 백엔드는 바뀌었으면 다시 로드
+            records = None if self.backend.has_external_change() else []
+        if records is None:
+            self.load_data()
+            self._notify(CHANGE_RESET)
             return True
-        except Exception as e:
-            print(f"데이터 저장 중 오류 발생: {e}")
+        for record in records:
+            try:
+                self._apply_external_record(record)
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                print(f"외부 변경 적용 중 오류 발생: {e}")
+                self.load_data()
+                self._notify(CHANGE_RESET)
+                return True
+        return bool(records)
+
+    def _apply_external_record(self, record: JournalRecord) -> None:
+        """다른 인스턴스의 변경 하나를 백엔드와 인덱스에 반영합니다."""
+        # 배치는 통째로 다시 색인하므로 적용 전 행들로 행 ID를 이어 줌
+        previous = None
+        if record.get("op") == JOURNAL_OP_BATCH:
+            previous = self.backend.row_identities()
+        event, index, old_key = self.backend.apply_external(record)
+        if event is None:
+            return
+        if event == CHANGE_RESET:
+            self._rebuild_indexes(previous)
+        elif event == CHANGE_DELETE:
+            row_id = self.row_ids.remove(index)
+            for item_index in self._indexes:
+                item_index.on_delete(row_id, old_key)
+        else:
+            if event == CHANGE_ADD:
+                row_id = self.row_ids.append()
+            else:
+                row_id = self.row_ids.id_at(index)
+            if self._indexes:
+                item = self.backend.get_previews(index, 1, SEARCH_VALUE_LIMIT)[0]
+                for item_index in self._indexes:
+                    if event == CHANGE_ADD:
+                        item_index.on_insert(row_id, item["key"], item["value"])
+                    else:
+                        item_index.on_update(
+                            row_id, old_key, item["key"], item["value"]
+                        )
+        self._notify(event, index)
+
+    def _iter_rows(self, chunk_size: int = 1000) -> Iterator[Row]:
+        """모든 행을 (행 ID, 키, 값)으로 순회합니다.
+
+        값은 검색 색인에 쓰이는 앞부분(SEARCH_VALUE_LIMIT)까지만 읽습니다.
+        """
+        ids = self.row_ids.ids
+        for start in range(0, self.backend.count(), chunk_size):
+            items = self.backend.get_previews(start, chunk_size, SEARCH_VALUE_LIMIT)
+            for offset, item in enumerate(items):
+                yield ids[start + offset], item["key"], item["value"]
+
+    def _rebuild_indexes(self, previous: Optional[List[Hashable]] = None) -> None:
+        """행 ID를 새로 부여하고 모든 인덱스를 다시 만듭니다.
+
+        previous(바뀌기 전 행들의 row_identities())를 주면 내용이 같은 행은
+        이전 ID로도 찾을 수 있게 합니다.
+        """
+        if previous is None:
+            self.row_ids.reset(self.backend.count())
+        else:
+            self.row_ids.reset_matching(previous, self.backend.row_identities())
+        for index in self._indexes:
+            index.rebuild(self._iter_rows())
+
+    def attach_index(self, index: ItemIndex) -> None:
+        """인덱스를 등록합니다. 현재 항목으로 만든 뒤 변경마다 갱신합니다."""
+        index.rebuild(self._iter_rows())
+        self._indexes.append(index)
+
+    def filter_items(self, query: str) -> Optional[List[int]]:
+        """키나 값에 query를 포함하는 항목들의 인덱스를 반환합니다.
+
+        query가 비어 있으면 None(필터 없음)을 반환합니다. 검색 인덱스는 처음
+        호출될 때 만들어지고 이후에는 변경마다 갱신됩니다.
+        """
+        if not query:
+            return None
+        if not self.loaded:
+            return []
+        if self._search_index is None:
+            self._search_index = SearchIndex(self.row_ids)
+            self.attach_index(self._search_index)
+        return self._search_index.search(query)
+
+    def match_keys(self, query: str, limit: int) -> List[int]:
+        """키가 query로 시작하거나 query 글자들을 순서대로 포함하는 항목들의
+        인덱스를 최대 limit개 반환합니다 (접두사 일치가 먼저).
+
+        키 트라이는 처음 호출될 때 만들어지고 이후에는 변경마다 갱신됩니다.
+        """
+        if not self.loaded:
+            return []
+        return self._get_key_trie().search(query, limit)
+
+    def find_key(self, key: str) -> Optional[int]:
+        """키가 정확히 key인 첫 항목의 인덱스를 반환합니다. 없으면 None.
+
+        키 색인은 처음 호출될 때 만들어지고 이후에는 변경마다 갱신되므로,
+        항목 수와 관계없이 O(1)입니다.
+        """
+        if not self.loaded:
+            return None
+        return self._get_key_index().first(key)
+
+    def get_by_key(self, key: str) -> Optional[Dict[str, str]]:
+        """키가 key인 첫 항목을 반환합니다. 없으면 None."""
+        index = self.find_key(key)
+        if index is None:
+            return None
+        return self.backend.get(index)
+
+    def is_duplicate_key(self, key: str, index: Optional[int] = None) -> bool:
+        """index 위치가 아닌 다른 항목이 이미 key를 쓰고 있는지 확인합니다."""
+        if not self.loaded:
+            return False
+        key_index = self._get_key_index()
+        if key not in key_index:
             return False
+        own_id = self.row_ids.id_at(index) if index is not None else None
+        return any(row_id != own_id for row_id in key_index.row_ids_of(key))
+
+    def find_duplicate_keys(self) -> Dict[str, List[int]]:
+        """두 항목 이상이 쓰는 키 -> 그 항목들의 인덱스"""
+        if not self.loaded:
+            return {}
+        return self._get_key_index().duplicates()
+
+    def _get_key_index(self) -> KeyIndex:
+        """키 색인 (처음 필요할 때 만들고 이후에는 변경마다 갱신)"""
+        if self._key_index is None:
+            self._key_index = KeyIndex(self.row_ids)
+            self.attach_index(self._key_index)
+        return self._key_index
+
+    def _reject_duplicate(self, key: str, index: Optional[int] = None) -> bool:
+        """unique_keys인데 key가 다른 항목과 겹치면 알리고 True를 반환합니다."""
+        if self.unique_keys and self.is_duplicate_key(key, index):
+            print(f"이미 있는 키입니다: {key}")
+            return True
+        return False
+
+    def _get_key_trie(self) -> KeyTrie:
+        """키 트라이 (처음 필요할 때 만들고 이후에는 변경마다 갱신)"""
+        if self._key_trie is None:
+            self._key_trie = KeyTrie(self.row_ids)
+            self.attach_index(self._key_trie)
+        return self._key_trie
+
+    @timed("data.save")
+    def save_data(self) -> bool:
+        """현재 데이터 전체를 저장합니다.
+
+        백그라운드 저장을 쓰면 예약만 하고 바로 반환하므로, 기록 완료가
+        필요하면 flush()를 호출합니다.
+        """
+        with self.backend.lock():
+            self._catch_up()
+            return self.backend.save()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """예약된 백그라운드 쓰기를 모두 디스크에 기록할 때까지 기다립니다."""
+        return self.backend.flush(timeout)
+
+    def close(self) -> None:
+        """남은 쓰기를 마치고 저장소를 닫습니다."""
+        self.backend.close()
 
     def get_font_size(self) -> int:
-        """저장된 폰트 크기 반환"""
-        return self.data.get("font_size", DEFAULT_FONT_SIZE_VALUE)
+        """저장된 폰트 크기 반환 (로드 전에는 기본값)"""
+        if not self.loaded:
+            return DEFAULT_FONT_SIZE_VALUE
+        return self.backend.get_setting("font_size", DEFAULT_FONT_SIZE_VALUE)
 
     def set_font_size(self, size: int) -> bool:
         """폰트 크기 설정 및 저장"""
-        self.data["font_size"] = size
-        return self.save_data()
+        if not self._check_loaded():
+            return False
+        with self.backend.lock():
+            self._catch_up()
+            return self.backend.set_setting("font_size", size)
 
     def refresh_data(self) -> None:
-        """데이터를 다시 로드합니다."""
-        self.data = self.load_data()
+        """데이터를 저장소에서 강제로 다시 로드합니다."""
+        if not self._check_loaded():
+            return
+        self.load_data()
+        self._notify(CHANGE_RESET)
+
+    def has_external_change(self) -> bool:
+        """다른 프로세스가 저장소를 바꿨는지 확인합니다."""
+        return self.backend.has_external_change()
+
+    def reload_if_changed(self) -> bool:
+        """외부에서 저장소가 바뀐 경우에만 다시 로드하고 리스너에 알립니다."""
+        if not self.loaded or self.importing or self.batching:
+            # 처음 로드나 가져오기, 배치가 끝나지 않았으면 그 결과가 최신 상태
+            return False
+        if self.shared:
+            return self.apply_external_changes()
+        if not self.backend.is_idle():
+            # 아직 기록되지 않은 변경이 있으면 다음 기회에 확인
+            return False
+        if not self.has_external_change():
+            return False
+        self.refresh_data()
+        return True
+
+    def notify_external_change(self) -> bool:
+        """외부 변경 알림 훅입니다.
+
+        파일 감시기나 다른 도구가 저장소를 수정한 뒤 호출하면, 실제로 내용이
+        바뀐 경우에만 다시 로드합니다.
+        """
+        return self.reload_if_changed()
 
     def add_item(self, key: str, value: str) -> bool:
         """새로운 항목을 추가합니다."""
+        if not self._check_loaded():
+            return False
         try:
-            self.data["list"].append({"key": key, "value": value})
-            return self.save_data()
+            with self.backend.lock():
+                self._catch_up()
+                if self._reject_duplicate(key):
+                    return False
+                success = self.backend.insert(key, value)
+            row_id = self.row_ids.append()
+            for index in self._indexes:
+                index.on_insert(row_id, key, value)
+            self._notify(CHANGE_ADD, self.backend.count() - 1)
+            return success
         except Exception as e:
             print(f"항목 추가 중 오류 발생: {e}")
             return False
 
+    def upsert(self, key: str, value: str) -> bool:
+        """키가 key인 첫 항목의 값을 바꾸고, 없으면 새 항목으로 추가합니다."""
+        if not self._check_loaded():
+            return False
+        try:
+            with self.backend.lock():
+                self._catch_up()
+                index = self.find_key(key)
+                if index is None:
+                    return self.add_item(key, value)
+                return self.update_item(index, key, value)
+        except Exception as e:
+            print(f"항목 저장 중 오류 발생: {e}")
+            return False
+
+    def delete_by_key(self, key: str) -> bool:
+        """키가 key인 항목을 모두 삭제합니다. 삭제한 항목이 있으면 True.
+
+        여러 개면 batch()로 묶어 한 번만 저장합니다.
+        """
+        if not self._check_loaded():
+            return False
+        try:
+            with self.backend.lock():
+                self._catch_up()
+                positions = self._get_key_index().lookup(key)
+                if len(positions) <= 1:
+                    return bool(positions) and self.delete_data(positions[0])
+                with self.batch():
+                    for index in reversed(positions):
+                        self.delete_data(index)
+                return True
+        except Exception as e:
+            print(f"항목 삭제 중 오류 발생: {e}")
+            return False
+
+    def begin_import(self) -> bool:
+        """대량 가져오기를 시작합니다.
+
+        end_import()까지는 다른 변경 요청을 거부하고, 공유 저장소면 잠금을
+        잡은 채로 진행합니다. 항목은 import_chunk()로 메모리에만 추가되고
+        end_import()에서 한 번에 저장됩니다. batch()처럼 백엔드 배치로 묶으므로
+        도중에 실패하면 가져오기 전 상태로 되돌릴 수 있습니다.
+        """
+        if not self._check_loaded():
+            return False
+        lock = self.backend.lock()
+        lock.__enter__()
+        try:
+            self._catch_up()
+            self.backend.begin_batch()
+        except BaseException:
+            lock.__exit__(None, None, None)
+            raise
+        self._import_lock = lock
+        return True
+
+    def import_chunk(self, pairs: List[Tuple[str, str]]) -> int:
+        """가져올 (키, 값)들을 추가합니다 (저장은 end_import()에서).
+
+        unique_keys면 이미 있거나 앞에서 나온 키는 건너뛰므로, 반환하는 추가
+        개수가 len(pairs)보다 작을 수 있습니다.
+        """
+        if not self.importing:
+            raise RuntimeError("begin_import()를 먼저 호출해야 합니다.")
+        if self.unique_keys:
+            key_index = self._get_key_index()
+            seen = set()
+            unique_pairs = []
+            for key, value in pairs:
+                if key not in seen and key not in key_index:
+                    seen.add(key)
+                    unique_pairs.append((key, value))
+            pairs = unique_pairs
+        try:
+            added = self.backend.insert_many(pairs)
+        except Exception:
+            # 일부만 추가되었을 수 있으므로 행 ID와 인덱스를 백엔드에 맞춤
+            self._rebuild_indexes()
+            raise
+        for key, value in pairs[:added]:
+            row_id = self.row_ids.append()
+            for index in self._indexes:
+                index.on_insert(row_id, key, value)
+        return added
+
+    def end_import(self, commit: bool = True) -> bool:
+        """가져오기를 끝내고 리스너에 알립니다. 저장했으면 True를 반환합니다.
+
+        commit이면 가져온 항목을 한 번에 저장합니다. commit이 아니거나(도중에
+        실패한 경우) 저장에 실패하면 가져온 항목을 모두 되돌리고 아무것도
+        저장하지 않습니다.
+        """
+        if not self.importing:
+            return False
+        lock, self._import_lock = self._import_lock, None
+        try:
+            # 되돌린 뒤에도 그대로인 행은 같은 행 ID로 이어 줌
+            previous = self.backend.row_identities()
+            # 배치 중의 save()는 commit_batch()에서 한 번에 저장하도록 표시만 함
+            if commit and self.backend.save():
+                # 실패하면 백엔드가 배치 전 상태로 되돌림
+                committed = self.backend.commit_batch()
+            else:
+                self.backend.rollback_batch()
+                committed = False
+            if not committed:
+                self._rebuild_indexes(previous)
+            return committed
+        finally:
+            lock.__exit__(None, None, None)
+            self._notify(CHANGE_RESET)
+
+    def add_items(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """여러 항목을 추가하고 한 번만 저장합니다. 추가한 개수를 반환합니다.
+
+        항목마다 저장하는 add_item()과 달리 전체 파일(또는 저널)을 한 번만
+        기록하므로, 항목이 많을 때 전체 비용이 O(n)입니다. 도중에 실패하거나
+        저장하지 못하면 하나도 추가하지 않습니다.
+        """
+        if not self.begin_import():
+            return 0
+        added = 0
+        try:
+            iterator = iter(pairs)
+            while True:
+                chunk = list(islice(iterator, BULK_CHUNK_SIZE))
+                if not chunk:
+                    break
+                added += self.import_chunk(chunk)
+        except BaseException:
+            self.end_import(commit=False)
+            raise
+        return added if self.end_import() else 0
+
     def get_items(self) -> List[Dict[str, str]]:
         """모든 항목을 반환합니다."""
-        return self.data.get("list", [])
+        if not self.loaded:
+            return []
+        return self.backend.items()
+
+    def get_keys(self) -> List[str]:
+        """모든 항목의 키를 반환합니다 (값은 읽지 않음)."""
+        if not self.loaded:
+            return []
+        previews = self.backend.get_previews(0, self.backend.count(), 0)
+        return [item["key"] for item in previews]
+
+    def get_item(self, index: int) -> Optional[Dict[str, str]]:
+        """지정된 인덱스의 항목을 반환합니다. 없으면 None."""
+        if 0 <= index < self.get_item_count():
+            return self.backend.get(index)
+        return None
+
+    def get_value(self, index: int) -> Optional[str]:
+        """지정된 인덱스 항목의 값 전체를 저장소에서 바로 읽어 반환합니다.
+
+        화면에 표시된 (잘린) 문자열과 달리 항상 저장된 값 그대로입니다.
+        """
+        if 0 <= index < self.get_item_count():
+            return self.backend.get_value(index)
+        return None
+
+    def get_preview(self, index: int) -> Optional[Dict[str, str]]:
+        """리스트 표시용으로 키와 값의 앞부분(VALUE_PREVIEW_LENGTH글자)만 반환합니다."""
+        if 0 <= index < self.get_item_count():
+            return self.backend.get_previews(index, 1, VALUE_PREVIEW_LENGTH)[0]
+        return None
+
+    def get_range(self, start: int, count: int) -> List[Dict[str, str]]:
+        """start부터 최대 count개의 항목을 반환합니다."""
+        if not self.loaded:
+            return []
+        return self.backend.get_range(max(start, 0), max(count, 0))
 
     def delete_data(self, index: int) -> bool:
         """지정된 인덱스의 항목을 삭제합니다."""
+        if not self._check_loaded():
+            return False
         try:
-            if 0 <= index < len(self.data["list"]):
-                del self.data["list"][index]
-                return self.save_data()
-            else:
-                print(f"잘못된 인덱스: {index}")
-                return False
+            with self.backend.lock():
+                index = self._catch_up(index)
+                if index is None:
+                    print("다른 인스턴스에서 이미 삭제되었거나 바뀐 항목입니다.")
+                    return False
+                if not 0 <= index < self.backend.count():
+                    print(f"잘못된 인덱스: {index}")
+                    return False
+                old_key = self.backend.get(index)["key"] if self._indexes else ""
+                success = self.backend.delete(index)
+            row_id = self.row_ids.remove(index)
+            for item_index in self._indexes:
+                item_index.on_delete(row_id, old_key)
+            self._notify(CHANGE_DELETE, index)
+            return success
         except Exception as e:
             print(f"항목 삭제 중 오류 발생: {e}")
             return False
 
     def update_item(self, index: int, key: str, value: str) -> bool:
         """지정된 인덱스의 항목을 업데이트합니다."""
+        if not self._check_loaded():
+            return False
         try:
-            if 0 <= index < len(self.data["list"]):
-                self.data["list"][index] = {"key": key, "value": value}
-                return self.save_data()
-            else:
-                print(f"잘못된 인덱스: {index}")
-                return False
+            with self.backend.lock():
+                index = self._catch_up(index)
+                if index is None:
+                    print("다른 인스턴스에서 이미 삭제되었거나 바뀐 항목입니다.")
+                    return False
+                if not 0 <= index < self.backend.count():
+                    print(f"잘못된 인덱스: {index}")
+                    return False
+                if self._reject_duplicate(key, index):
+                    return False
+                old_key = self.backend.get(index)["key"] if self._indexes else ""
+                success = self.backend.update(index, key, value)
+            row_id = self.row_ids.id_at(index)
+            for item_index in self._indexes:
+                item_index.on_update(row_id, old_key, key, value)
+            self._notify(CHANGE_UPDATE, index)
+            return success
         except Exception as e:
             print(f"항목 업데이트 중 오류 발생: {e}")
             return False
 
     def get_item_count(self) -> int:
-        """항목 개수를 반환합니다."""
-        return len(self.data.get("list", []))
+        """항목 개수를 반환합니다 (로드 전에는 0)."""
+        if not self.loaded:
+            return 0
+        return self.backend.count()
 
     def clear_all(self) -> bool:
         """모든 데이터를 삭제합니다."""
+        if not self._check_loaded():
+            return False
         try:
-            self.data["list"] = []
-            return self.save_data()
+            with self.backend.lock():
+                self._catch_up()
+                success = self.backend.clear()
+            self._rebuild_indexes()
+            self._notify(CHANGE_RESET)
+            return success
         except Exception as e:
             print(f"데이터 초기화 중 오류 발생: {e}")
             return False
@@ -0,0 +1,339 @@
+"""
+GUI 성능 재생(replay) 모듈입니다.
+
+가상 X 서버(Xvfb)에서 임시 data_file로 CopyAndPasteApp을 띄우고, 정해진 동작
+순서(항목 추가, 행 클릭, 삭제, 창 크기 변경, 글꼴 크기 변경)를 UIManager에
+그대로 실행합니다. 동작별 소요 시간, 이벤트 루프가 멈춘 시간, 첫 페인트와
+백그라운드 로드가 끝나 데이터가 표시되기까지의 시간을 측정해 refresh_listctrl,
+on_listctrl_resize, 상태 토스트(StatusFrame) 경로와 시작 시간의 UI 지연 퇴행을
+로컬에서 재현 가능한 숫자로 확인할 수 있습니다.
+
+    python gui_replay.py                               # 기본 시나리오
+    python gui_replay.py --preload 10000 --add 200 --output replay.json
+    python gui_replay.py --scenario actions.json       # 기록된 동작 순서 재생
+    python gui_replay.py --display :0                  # 이미 있는 디스플레이 사용
+
+시나리오 파일은 {"action": 이름, "count": 횟수} 목록입니다. 동작 이름은
+add, click, delete, resize, font_size입니다.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from constants import DEFAULT_FONT_SIZE_VALUE, WINDOW_WIDTH
+
+REPLAY_HEARTBEAT_MS = 10  # 이벤트 루프 정체를 재는 타이머 간격
+REPLAY_STALL_MS = 50  # 타이머가 이만큼 넘게 늦으면 정체로 기록
+REPLAY_ACTION_GAP_MS = 5  # 동작 사이에 이벤트 루프가 쉬는 시간
+REPLAY_SETTLE_MS = 500  # 시작 후 첫 동작까지 기다리는 시간
+REPLAY_TIMEOUT = 600.0  # 전체 재생 제한 시간 (초)
+REPLAY_SEED = 1234
+XVFB_SCREEN = "1280x1024x24"
+
+DEFAULT_SCENARIO = [
+    {"action": "add", "count": 100},
+    {"action": "click", "count": 50},
+    {"action": "resize", "count": 20},
+    {"action": "font_size", "count": 6},
+    {"action": "delete", "count": 30},
+]
+
+Action = Tuple[str, Callable[[], None]]
+
+
+def start_virtual_display(screen: str = XVFB_SCREEN) -> Tuple[subprocess.Popen, str]:
+    """Xvfb를 비어 있는 디스플레이 번호로 실행하고 (프로세스, DISPLAY)를 반환합니다."""
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        raise RuntimeError("Xvfb를 찾을 수 없습니다. xvfb 패키지를 설치하세요.")
+    number = 99
+    while os.path.exists(f"/tmp/.X{number}-lock"):
+        number += 1
+    display = f":{number}"
+    process = subprocess.Popen(
+        [xvfb, display, "-screen", "0", screen, "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 10
+    while not os.path.exists(f"/tmp/.X11-unix/X{number}"):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            raise RuntimeError(f"Xvfb를 시작할 수 없습니다: {display}")
+        time.sleep(0.05)
+    return process, display
+
+
+def write_preload(path: str, count: int, seed: int) -> None:
+    """측정 전에 count개 항목이 들어 있는 data_file을 만듭니다."""
+    rng = random.Random(seed)
+    items = [
+        {
+            "key": f"preload-{i}",
+            "value": f"{rng.getrandbits(64):016x} " * rng.randint(1, 40),
+        }
+        for i in range(count)
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"font_size": DEFAULT_FONT_SIZE_VALUE, "list": items}, f)
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "total_ms": sum(ordered) * 1000,
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+class ReplayDriver:
+    """UIManager에 동작을 순서대로 실행하며 시간을 재는 클래스
+
+    동작은 이벤트 루프 안에서 하나씩 실행되고, 동작 직후 쌓인 이벤트(페인트
+    포함)를 처리하는 시간까지 동작 시간에 포함합니다. 동시에 짧은 주기의
+    타이머가 늦게 도착한 만큼을 이벤트 루프 정체 시간으로 기록합니다.
+    """
+
+    def __init__(self, app, started_at: float, seed: int = REPLAY_SEED):
+        import wx
+
+        self.wx = wx
+        self.app = app
+        self.ui = app.ui_manager
+        self.started_at = started_at
+        self.rng = random.Random(seed)
+        self.first_paint: Optional[float] = None
+        self.data_ready: Optional[float] = None
+        self.samples: Dict[str, List[float]] = {}
+        self.stalls: List[float] = []
+        self._actions: List[Action] = []
+        self._heartbeat = wx.Timer(self.ui.frame)
+        self._last_beat = 0.0
+        self.ui.frame.Bind(wx.EVT_TIMER, self._on_heartbeat, self._heartbeat)
+        self._watch_first_paint(self.ui.frame)
+
+    def _watch_first_paint(self, window) -> None:
+        """창과 모든 자식 창의 첫 페인트 시각을 기록합니다."""
+        window.Bind(self.wx.EVT_PAINT, self._on_paint)
+        for child in window.GetChildren():
+            self._watch_first_paint(child)
+
+    def _on_paint(self, event) -> None:
+        if self.first_paint is None:
+            self.first_paint = time.perf_counter()
+        event.Skip()
+
+    def _on_heartbeat(self, event) -> None:
+        now = time.perf_counter()
+        late = (now - self._last_beat) * 1000 - REPLAY_HEARTBEAT_MS
+        if late > REPLAY_STALL_MS:
+            self.stalls.append(late / 1000)
+        self._last_beat = now
+
+    def build_actions(self, scenario: List[Dict[str, Any]]) -> None:
+        """시나리오 목록을 실행할 동작들로 펼칩니다."""
+        builders = {
+            "add": self._add,
+            "click": self._click,
+            "delete": self._delete,
+            "resize": self._resize,
+            "font_size": self._font_size,
+        }
+        for step in scenario:
+            name = step["action"]
+            if name not in builders:
+                raise ValueError(f"알 수 없는 동작: {name}")
+            build = builders[name]
+            for i in range(step.get("count", 1)):
+                self._actions.append((name, lambda i=i, build=build: build(i)))
+
+    def _add(self, i: int) -> None:
+        self.ui.key_text.SetValue(f"replay-{i}")
+        self.ui.value_text.SetValue(f"replay value {i} " * self.rng.randint(1, 30))
+        self.ui.is_edit_mode = False
+        self.ui.selected_index = None
+        self.ui.on_save(None)
+
+    def _random_row(self) -> Optional[int]:
+        count = self.ui.data_list_ctrl.GetItemCount()
+        return self.rng.randrange(count) if count else None
+
+    def _click(self, i: int) -> None:
+        row = self._random_row()
+        if row is None:
+            return
+        event = self.wx.ListEvent(
+            self.wx.wxEVT_LIST_ITEM_SELECTED, self.ui.data_list_ctrl.GetId()
+        )
+        event.SetIndex(row)
+        self.ui.on_listctrl_click(event)
+
+    def _delete(self, i: int) -> None:
+        row = self._random_row()
+        if row is None:
+            return
+        self.ui.data_list_ctrl.Select(row)
+        self.ui.on_delete(None)
+
+    def _resize(self, i: int) -> None:
+        height = self.ui.frame.GetMinSize().GetHeight() + (i % 5) * 60
+        self.ui.frame.SetSize(WINDOW_WIDTH, height)
+
+    def _font_size(self, i: int) -> None:
+        self.ui.set_font_size(DEFAULT_FONT_SIZE_VALUE + (-2, 0, 2, 4)[i % 4])
+
+    def start(self) -> None:
+        """정체 측정을 시작하고, 데이터 로드가 끝나면 첫 동작을 예약합니다."""
+        self._last_beat = time.perf_counter()
+        self._heartbeat.Start(REPLAY_HEARTBEAT_MS)
+        self._wait_for_data()
+
+    def _wait_for_data(self) -> None:
+        """백그라운드 로드가 끝날 때까지 기다립니다 (그동안의 정체도 기록)."""
+        if self.ui.loading:
+            self.wx.CallLater(REPLAY_HEARTBEAT_MS, self._wait_for_data)
+            return
+        self.data_ready = time.perf_counter()
+        self.wx.CallLater(REPLAY_ACTION_GAP_MS, self._step, 0)
+
+    def _step(self, position: int) -> None:
+        if position >= len(self._actions):
+            self.finish()
+            return
+        name, action = self._actions[position]
+        started = time.perf_counter()
+        action()
+        # 동작으로 생긴 다시 그리기 등 대기 중인 이벤트까지 처리
+        self.app.Yield(True)
+        self.samples.setdefault(name, []).append(time.perf_counter() - started)
+        self.wx.CallLater(REPLAY_ACTION_GAP_MS, self._step, position + 1)
+
+    def finish(self) -> None:
+        """측정을 마치고 창을 닫아 이벤트 루프를 끝냅니다."""
+        self._heartbeat.Stop()
+        self.ui.frame.Close()
+
+    def results(self, startup: float) -> Dict[str, Any]:
+        first_paint = None
+        if self.first_paint is not None:
+            first_paint = (self.first_paint - self.started_at) * 1000
+        data_ready = None
+        if self.data_ready is not None:
+            data_ready = (self.data_ready - self.started_at) * 1000
+        return {
+            "startup_ms": startup * 1000,
+            "time_to_first_paint_ms": first_paint,
+            "time_to_data_ms": data_ready,
+            "actions": {name: _summarize(s) for name, s in self.samples.items()},
+            "stalls": _summarize(self.stalls) if self.stalls else {"count": 0},
+        }
+
+
+def run_replay(
+    scenario: List[Dict[str, Any]],
+    preload: int = 0,
+    seed: int = REPLAY_SEED,
+    timeout: float = REPLAY_TIMEOUT,
+) -> Dict[str, Any]:
+    """임시 data_file로 앱을 띄워 시나리오를 재생하고 측정 결과를 반환합니다.
+
+    DISPLAY가 준비된 뒤에 호출해야 합니다 (wx는 여기서 처음 import).
+    """
+    import wx
+    from main import CopyAndPasteApp
+
+    with tempfile.TemporaryDirectory(prefix="copyandpaste-replay-") as directory:
+        data_file = os.path.join(directory, "data.json")
+        if preload:
+            write_preload(data_file, preload, seed)
+
+        started_at = time.perf_counter()
+        app = CopyAndPasteApp(data_file)
+        startup = time.perf_counter() - started_at
+        if app.ui_manager is None:
+            raise RuntimeError("애플리케이션을 시작할 수 없습니다.")
+
+        driver = ReplayDriver(app, started_at, seed)
+        driver.build_actions(scenario)
+        wx.CallLater(REPLAY_SETTLE_MS, driver.start)
+        # 멈춘 채 끝나지 않는 경우를 대비한 제한 시간
+        wx.CallLater(int(timeout * 1000), app.ExitMainLoop)
+        app.MainLoop()
+        return driver.results(startup)
+
+
+def _print_results(results: Dict[str, Any]) -> None:
+    print(f"시작: {results['startup_ms']:.1f} ms")
+    if results["time_to_first_paint_ms"] is not None:
+        print(f"첫 페인트: {results['time_to_first_paint_ms']:.1f} ms")
+    if results["time_to_data_ms"] is not None:
+        print(f"데이터 표시: {results['time_to_data_ms']:.1f} ms")
+    for name, stats in results["actions"].items():
+        print(
+            f"  {name:<10} {stats['count']:>5}회  p50 {stats['p50_ms']:>8.2f} ms"
+            f"  p99 {stats['p99_ms']:>8.2f} ms  max {stats['max_ms']:>8.2f} ms"
+        )
+    stalls = results["stalls"]
+    if stalls["count"]:
+        print(
+            f"이벤트 루프 정체: {stalls['count']}회, 합계 {stalls['total_ms']:.1f} ms,"
+            f" 최대 {stalls['max_ms']:.1f} ms"
+        )
+    else:
+        print("이벤트 루프 정체: 없음")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """GUI 재생 실행"""
+    parser = argparse.ArgumentParser(description="복붙 GUI 성능 재생")
+    parser.add_argument("--scenario", help="동작 순서 JSON 파일")
+    parser.add_argument("--add", type=int, help="기본 시나리오의 항목 추가 횟수")
+    parser.add_argument("--preload", type=int, default=0, help="미리 넣어 둘 항목 수")
+    parser.add_argument("--display", help="Xvfb 대신 사용할 DISPLAY")
+    parser.add_argument("--seed", type=int, default=REPLAY_SEED)
+    parser.add_argument("--timeout", type=float, default=REPLAY_TIMEOUT)
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+
+    if args.scenario:
+        with open(args.scenario, "r", encoding="utf-8") as f:
+            scenario = json.load(f)
+    else:
+        scenario = [dict(step) for step in DEFAULT_SCENARIO]
+        if args.add is not None:
+            scenario[0]["count"] = args.add
+
+    xvfb = None
+    try:
+        if args.display:
+            os.environ["DISPLAY"] = args.display
+        else:
+            xvfb, os.environ["DISPLAY"] = start_virtual_display()
+        results = run_replay(scenario, args.preload, args.seed, args.timeout)
+    except Exception as e:
+        print(f"GUI 재생 중 오류 발생: {e}")
+        return 1
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+
+    _print_results(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
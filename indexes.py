@@ -0,0 +1,517 @@
+"""
+항목 인덱스들을 정의하는 모듈입니다.
+DataManager가 항목 추가/수정/삭제 때마다 갱신하며, 행 위치가 바뀌어도
+유지되도록 항목마다 부여한 안정적인 행 ID를 기준으로 동작합니다.
+"""
+
+import bisect
+import re
+from collections import defaultdict, deque
+from typing import Deque, Dict, Hashable, Iterable, List, Optional, Protocol, Set, Tuple, Union
+from constants import SEARCH_NARROW_LIMIT, SEARCH_VALUE_LIMIT, TRIE_FUZZY_VISIT_LIMIT
+
+# (행 ID, 키, 값)
+Row = Tuple[int, str, str]
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+class RowIdMap:
+    """행 위치 <-> 안정적인 행 ID 매핑
+
+    ID는 추가 순서대로 증가하므로 ids 목록은 항상 오름차순입니다.
+
+    삭제로 뒤쪽 행의 위치가 당겨지면 전체를 다시 계산하지 않고, 무효화된
+    위치부터만 다음 조회 때 다시 계산합니다.
+
+    저장소를 다시 로드하면 모든 행에 새 ID를 부여하지만, reset_matching()으로
+    내용이 그대로인 행은 이전 ID로도 찾을 수 있게 합니다.
+    """
+
+    def __init__(self):
+        self.ids: List[int] = []
+        self._next_id = 0
+        self._positions: Dict[int, int] = {}
+        self._valid_upto = 0  # 이 위치 미만의 _positions 값만 유효
+        self._first_id = 0  # 마지막 reset() 때 부여한 첫 ID (이보다 작으면 이전 ID)
+        # 마지막 reset_matching()의 이전 ID -> 새 ID (둘 다 오름차순)
+        self._renamed_from: List[int] = []
+        self._renamed_to: List[int] = []
+
+    def reset(self, count: int) -> None:
+        """count개의 행에 새 ID를 부여합니다."""
+        self._first_id = self._next_id
+        self.ids = list(range(self._next_id, self._next_id + count))
+        self._next_id += count
+        self._positions = {}
+        self._valid_upto = 0
+        self._renamed_from = []
+        self._renamed_to = []
+
+    def reset_matching(
+        self, old_identities: List[Hashable], new_identities: List[Hashable]
+    ) -> None:
+        """다시 로드한 행들에 새 ID를 부여하고 이전 ID를 이어 줍니다.
+
+        old_identities는 현재 행들, new_identities는 새 행들의 내용 값입니다.
+        앞에서부터 같은 값을 가진 행끼리 짝지으며, 이전 ID의 순서가 뒤바뀌지
+        않도록 짝지은 이전 ID는 항상 증가합니다. 보통은 일부 행만 바뀌므로
+        앞뒤로 그대로인 구간은 차례로 짝짓고 가운데만 해시로 찾습니다.
+        """
+        old_ids = self.ids
+        self.reset(len(new_identities))
+        new_ids = self.ids
+        old_count = len(old_ids)
+        new_count = len(new_ids)
+        common = min(old_count, new_count)
+        head = 0
+        while head < common and old_identities[head] == new_identities[head]:
+            head += 1
+        tail = 0
+        while (
+            tail < common - head
+            and old_identities[old_count - 1 - tail]
+            == new_identities[new_count - 1 - tail]
+        ):
+            tail += 1
+
+        renamed_from = old_ids[:head]
+        renamed_to = new_ids[:head]
+        candidates: Dict[Hashable, Deque[int]] = {}
+        for offset in range(head, old_count - tail):
+            identity = old_identities[offset]
+            candidates.setdefault(identity, deque()).append(old_ids[offset])
+        last_id = renamed_from[-1] if renamed_from else -1
+        for offset in range(head, new_count - tail):
+            queue = candidates.get(new_identities[offset])
+            if not queue:
+                continue
+            while queue and queue[0] < last_id:
+                queue.popleft()
+            if queue:
+                last_id = queue.popleft()
+                renamed_from.append(last_id)
+                renamed_to.append(new_ids[offset])
+        renamed_from.extend(old_ids[old_count - tail :])
+        renamed_to.extend(new_ids[new_count - tail :])
+        self._renamed_from = renamed_from
+        self._renamed_to = renamed_to
+
+    def append(self) -> int:
+        """맨 뒤에 추가된 행의 ID를 만들어 반환합니다."""
+        row_id = self._next_id
+        self._next_id += 1
+        self.ids.append(row_id)
+        if self._valid_upto == len(self.ids) - 1:
+            self._positions[row_id] = self._valid_upto
+            self._valid_upto += 1
+        return row_id
+
+    def remove(self, index: int) -> int:
+        """index 위치의 행을 제거하고 그 ID를 반환합니다."""
+        row_id = self.ids.pop(index)
+        self._positions.pop(row_id, None)
+        self._valid_upto = min(self._valid_upto, index)
+        return row_id
+
+    def id_at(self, index: int) -> int:
+        return self.ids[index]
+
+    def position(self, row_id: int) -> Optional[int]:
+        """행 ID의 현재 위치를 반환합니다. 없으면 None."""
+        if row_id < self._first_id:
+            index = bisect.bisect_left(self._renamed_from, row_id)
+            if index == len(self._renamed_from) or self._renamed_from[index] != row_id:
+                return None
+            row_id = self._renamed_to[index]
+        position = self._positions.get(row_id)
+        if position is not None and position < self._valid_upto:
+            return position
+        self._revalidate()
+        return self._positions.get(row_id)
+
+    def positions(self, row_ids: Iterable[int]) -> List[int]:
+        """여러 행 ID의 현재 위치를 반환합니다."""
+        self._revalidate()
+        positions = self._positions
+        return [positions[row_id] for row_id in row_ids]
+
+    def _revalidate(self) -> None:
+        ids = self.ids
+        positions = self._positions
+        for index in range(self._valid_upto, len(ids)):
+            positions[ids[index]] = index
+        self._valid_upto = len(ids)
+
+
+class ItemIndex(Protocol):
+    """DataManager가 변경마다 갱신하는 인덱스 인터페이스"""
+
+    def rebuild(self, rows: Iterable[Row]) -> None:
+        """모든 행으로 인덱스를 다시 만듭니다."""
+
+    def on_insert(self, row_id: int, key: str, value: str) -> None:
+        """행이 추가되었습니다."""
+
+    def on_update(self, row_id: int, old_key: str, key: str, value: str) -> None:
+        """행의 키/값이 바뀌었습니다."""
+
+    def on_delete(self, row_id: int, key: str) -> None:
+        """행이 삭제되었습니다."""
+
+
+def tokenize(text: str) -> List[str]:
+    """검색용 토큰(소문자로 바꾼 단어)들로 나눕니다. 밑줄도 구분자로 봅니다."""
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+class SearchIndex:
+    """키/값 단어 검색용 역색인
+
+    항목마다 키와 값(앞쪽 SEARCH_VALUE_LIMIT 글자)을 단어로 나눠 단어 -> 행 ID
+    집합을 유지하고, 정렬된 단어 목록에서 이진 탐색으로 접두사가 일치하는
+    단어들을 찾습니다. 질의의 모든 단어가 어떤 단어의 앞부분과 일치하는 항목이
+    결과입니다. 질의가 이전 질의를 확장한 것(글자를 이어 입력한 경우)이고 이전
+    결과가 충분히 작으면 그 안에서만 다시 확인해 범위를 좁히고, 그렇지 않으면
+    색인에서 바로 찾습니다.
+    """
+
+    def __init__(self, row_ids: RowIdMap, value_limit: int = SEARCH_VALUE_LIMIT):
+        self.row_ids = row_ids
+        self.value_limit = value_limit
+        self._row_tokens: Dict[int, Tuple[str, ...]] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._vocabulary: List[str] = []  # 정렬된 단어 목록
+        self._last_words: Optional[List[str]] = None
+        self._last_ids: List[int] = []
+
+    def rebuild(self, rows: Iterable[Row]) -> None:
+        self._row_tokens = {}
+        postings: Dict[str, Set[int]] = defaultdict(set)
+        for row_id, key, value in rows:
+            tokens = self._tokens(key, value)
+            self._row_tokens[row_id] = tokens
+            for token in tokens:
+                postings[token].add(row_id)
+        self._postings = dict(postings)
+        self._vocabulary = sorted(self._postings)
+        self._last_words = None
+
+    def _tokens(self, key: str, value: str) -> Tuple[str, ...]:
+        return tuple(set(tokenize(key)) | set(tokenize(value[: self.value_limit])))
+
+    def on_insert(self, row_id: int, key: str, value: str) -> None:
+        tokens = self._tokens(key, value)
+        self._row_tokens[row_id] = tokens
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                self._postings[token] = {row_id}
+                bisect.insort(self._vocabulary, token)
+            else:
+                posting.add(row_id)
+        self._last_words = None
+
+    def on_update(self, row_id: int, old_key: str, key: str, value: str) -> None:
+        self.on_delete(row_id, old_key)
+        self.on_insert(row_id, key, value)
+
+    def on_delete(self, row_id: int, key: str) -> None:
+        for token in self._row_tokens.pop(row_id, ()):
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            posting.discard(row_id)
+            if not posting:
+                del self._postings[token]
+                index = bisect.bisect_left(self._vocabulary, token)
+                if index < len(self._vocabulary) and self._vocabulary[index] == token:
+                    del self._vocabulary[index]
+        self._last_words = None
+
+    def _prefix_ids(self, word: str) -> Set[int]:
+        """word로 시작하는 단어를 가진 행 ID 집합"""
+        vocabulary = self._vocabulary
+        start = bisect.bisect_left(vocabulary, word)
+        end = bisect.bisect_left(vocabulary, word + "\U0010ffff", start)
+        if end - start == 1:
+            return self._postings[vocabulary[start]]
+        result: Set[int] = set()
+        for token in vocabulary[start:end]:
+            result |= self._postings[token]
+        return result
+
+    def _narrows(self, words: List[str]) -> bool:
+        """words가 이전 질의를 확장한 것인지 (결과가 이전 결과의 부분집합인지)"""
+        last = self._last_words
+        if last is None or len(words) < len(last):
+            return False
+        return all(word.startswith(old) for word, old in zip(words, last))
+
+    def search(self, query: str) -> List[int]:
+        """질의와 일치하는 행들의 위치를 오름차순으로 반환합니다."""
+        words = tokenize(query)
+        if not words:
+            ids: List[int] = []
+        elif self._narrows(words) and len(self._last_ids) <= SEARCH_NARROW_LIMIT:
+            row_tokens = self._row_tokens
+            ids = [
+                row_id
+                for row_id in self._last_ids
+                if all(
+                    any(token.startswith(word) for token in row_tokens[row_id])
+                    for word in words
+                )
+            ]
+        else:
+            matched: Optional[Set[int]] = None
+            for word in sorted(words, key=len, reverse=True):
+                candidates = self._prefix_ids(word)
+                matched = set(candidates) if matched is None else matched & candidates
+                if not matched:
+                    break
+            # 행 ID는 추가 순서대로 커지므로 ID 순서가 곧 위치 순서
+            ids = sorted(matched or ())
+
+        self._last_words = words
+        self._last_ids = ids
+        return self.row_ids.positions(ids)
+
+
+class KeyIndex:
+    """키 -> 행 ID 해시 색인
+
+    키(대소문자 구분)마다 행 ID를 하나만 두고, 같은 키가 여럿일 때만 행 ID
+    목록(오름차순, 즉 위치 순서)으로 바꿔 메모리를 아낍니다. 변경마다 해당
+    키만 고치므로 삭제 뒤에도 다시 만들지 않으며, 위치는 RowIdMap에서 찾습니다.
+    """
+
+    def __init__(self, row_ids: RowIdMap):
+        self.row_ids = row_ids
+        self._rows: Dict[str, Union[int, List[int]]] = {}
+
+    def rebuild(self, rows: Iterable[Row]) -> None:
+        self._rows = {}
+        for row_id, key, _ in rows:
+            self._add(key, row_id)
+
+    def on_insert(self, row_id: int, key: str, value: str) -> None:
+        self._add(key, row_id)
+
+    def on_update(self, row_id: int, old_key: str, key: str, value: str) -> None:
+        if old_key != key:
+            self._remove(old_key, row_id)
+            self._add(key, row_id)
+
+    def on_delete(self, row_id: int, key: str) -> None:
+        self._remove(key, row_id)
+
+    def _add(self, key: str, row_id: int) -> None:
+        existing = self._rows.get(key)
+        if existing is None:
+            self._rows[key] = row_id
+        elif type(existing) is int:
+            self._rows[key] = sorted((existing, row_id))
+        else:
+            bisect.insort(existing, row_id)
+
+    def _remove(self, key: str, row_id: int) -> None:
+        existing = self._rows.get(key)
+        if existing is None:
+            return
+        if type(existing) is int:
+            if existing == row_id:
+                del self._rows[key]
+            return
+        index = bisect.bisect_left(existing, row_id)
+        if index < len(existing) and existing[index] == row_id:
+            del existing[index]
+        if len(existing) == 1:
+            self._rows[key] = existing[0]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def row_ids_of(self, key: str) -> List[int]:
+        """키가 key인 행들의 ID (위치 순서)"""
+        existing = self._rows.get(key)
+        if existing is None:
+            return []
+        return [existing] if type(existing) is int else list(existing)
+
+    def first(self, key: str) -> Optional[int]:
+        """키가 key인 첫 행의 위치. 없으면 None."""
+        existing = self._rows.get(key)
+        if existing is None:
+            return None
+        return self.row_ids.position(existing if type(existing) is int else existing[0])
+
+    def lookup(self, key: str) -> List[int]:
+        """키가 key인 행들의 위치 (위치 순서)"""
+        return self.row_ids.positions(self.row_ids_of(key))
+
+    def duplicates(self) -> Dict[str, List[int]]:
+        """두 행 이상이 쓰는 키 -> 위치들"""
+        return {
+            key: self.row_ids.positions(existing)
+            for key, existing in self._rows.items()
+            if type(existing) is not int
+        }
+
+
+class _TrieNode:
+    __slots__ = ("label", "children", "row_ids")
+
+    def __init__(self, label: str = ""):
+        self.label = label  # 부모에서 이 노드로 오는 간선의 문자열
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.row_ids: Set[int] = set()
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    length = min(len(a), len(b))
+    for i in range(length):
+        if a[i] != b[i]:
+            return i
+    return length
+
+
+class KeyTrie:
+    """키 접두사/퍼지 검색용 압축(radix) 트라이
+
+    키를 소문자로 바꿔 저장하며, 가지가 갈라지지 않는 구간은 한 노드로 합쳐
+    노드 수를 키 개수 수준으로 유지합니다. 변경마다 해당 키만 넣고 뺍니다.
+    퍼지 검색은 질의 글자들이 순서대로 (떨어져 있어도) 나타나는 키를 찾으며,
+    일치하는 키가 없을 때 전체를 훑지 않도록 방문 노드 수를 제한합니다.
+    """
+
+    def __init__(self, row_ids: RowIdMap, fuzzy_visit_limit: int = TRIE_FUZZY_VISIT_LIMIT):
+        self.row_ids = row_ids
+        self.fuzzy_visit_limit = fuzzy_visit_limit
+        self._root = _TrieNode()
+
+    def rebuild(self, rows: Iterable[Row]) -> None:
+        self._root = _TrieNode()
+        for row_id, key, _ in rows:
+            self._insert(key, row_id)
+
+    def on_insert(self, row_id: int, key: str, value: str) -> None:
+        self._insert(key, row_id)
+
+    def on_update(self, row_id: int, old_key: str, key: str, value: str) -> None:
+        if old_key != key:
+            self._remove(old_key, row_id)
+            self._insert(key, row_id)
+
+    def on_delete(self, row_id: int, key: str) -> None:
+        self._remove(key, row_id)
+
+    def _insert(self, key: str, row_id: int) -> None:
+        node = self._root
+        rest = key.casefold()
+        while rest:
+            child = node.children.get(rest[0])
+            if child is None:
+                child = node.children[rest[0]] = _TrieNode(rest)
+                node = child
+                break
+            common = _common_prefix_length(child.label, rest)
+            if common < len(child.label):
+                # 간선 중간에서 갈라지므로 노드를 나눔
+                middle = _TrieNode(child.label[:common])
+                child.label = child.label[common:]
+                middle.children[child.label[0]] = child
+                node.children[rest[0]] = middle
+                child = middle
+            node = child
+            rest = rest[common:]
+        node.row_ids.add(row_id)
+
+    def _remove(self, key: str, row_id: int) -> None:
+        path = [self._root]
+        rest = key.casefold()
+        while rest:
+            child = path[-1].children.get(rest[0])
+            if child is None or not rest.startswith(child.label):
+                return
+            path.append(child)
+            rest = rest[len(child.label) :]
+        node = path[-1]
+        node.row_ids.discard(row_id)
+
+        # 빈 노드는 지우고, 자식이 하나뿐인 빈 노드는 자식과 합침
+        while len(path) > 1:
+            node = path.pop()
+            parent = path[-1]
+            if node.row_ids:
+                break
+            if not node.children:
+                del parent.children[node.label[0]]
+                continue
+            if len(node.children) == 1:
+                (child,) = node.children.values()
+                child.label = node.label + child.label
+                parent.children[child.label[0]] = child
+            break
+
+    @staticmethod
+    def _collect(node: _TrieNode, found: Dict[int, None], limit: int) -> None:
+        """node 아래의 행 ID들을 키 순서대로 limit개까지 모읍니다."""
+        stack = [node]
+        while stack and len(found) < limit:
+            current = stack.pop()
+            for row_id in sorted(current.row_ids):
+                found.setdefault(row_id)
+            children = current.children
+            stack.extend(children[ch] for ch in sorted(children, reverse=True))
+
+    def _find_prefix_node(self, query: str) -> Optional[_TrieNode]:
+        """query로 시작하는 키들을 모두 포함하는 가장 위쪽 노드"""
+        node = self._root
+        rest = query
+        while rest:
+            child = node.children.get(rest[0])
+            if child is None:
+                return None
+            if child.label.startswith(rest):
+                return child
+            if not rest.startswith(child.label):
+                return None
+            node = child
+            rest = rest[len(child.label) :]
+        return node
+
+    def search(self, query: str, limit: int) -> List[int]:
+        """질의와 맞는 행들의 위치를 반환합니다 (접두사 일치를 먼저)."""
+        query = query.casefold()
+        found: Dict[int, None] = {}  # 순서를 유지하는 집합
+
+        prefix_node = self._find_prefix_node(query)
+        if prefix_node is not None:
+            self._collect(prefix_node, found, limit)
+
+        if query and len(found) < limit:
+            # (노드, 지금까지 맞춘 질의 글자 수)로 깊이 우선 탐색
+            stack = [(self._root, 0)]
+            visited = 0
+            while stack and len(found) < limit and visited < self.fuzzy_visit_limit:
+                current, matched = stack.pop()
+                visited += 1
+                for ch in sorted(current.children, reverse=True):
+                    child = current.children[ch]
+                    child_matched = matched
+                    for label_ch in child.label:
+                        if label_ch == query[child_matched]:
+                            child_matched += 1
+                            if child_matched == len(query):
+                                break
+                    if child_matched == len(query):
+                        self._collect(child, found, limit)
+                    else:
+                        stack.append((child, child_matched))
+
+        return [
+            position
+            for position in (self.row_ids.position(row_id) for row_id in found)
+            if position is not None
+        ][:limit]
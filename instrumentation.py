@@ -0,0 +1,269 @@
+"""
+성능 계측 모듈입니다.
+타이머(timed), 구간(span), 카운터(count)로 주요 경로의 소요 시간과
+처리한 바이트 수를 모읍니다.
+
+기본으로 꺼져 있으며, 꺼져 있을 때는 각 호출이 전역 변수 하나만 확인하고
+바로 원래 동작을 실행합니다. 환경 변수나 main.py의 --metrics 옵션으로 켜면
+JSONL 파일(또는 표준 에러)에 주기적인 요약(횟수, 합계, p50/p99, 바이트)을,
+events 모드에서는 구간마다 한 줄씩 기록합니다.
+
+    COPYANDPASTE_METRICS=metrics.jsonl python main.py
+    COPYANDPASTE_METRICS=- COPYANDPASTE_METRICS_MODE=events python main.py
+    python main.py --metrics metrics.jsonl --metrics-mode events
+"""
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, TextIO, TypeVar
+from constants import (
+    METRICS_ENV,
+    METRICS_MODE_ENV,
+    METRICS_MODE_SUMMARY,
+    METRICS_MODE_EVENTS,
+    METRICS_SUMMARY_INTERVAL,
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _Stat:
+    """이름 하나에 대한 요약 구간 동안의 측정값"""
+
+    __slots__ = ("durations", "bytes")
+
+    def __init__(self):
+        self.durations: List[float] = []
+        self.bytes = 0
+
+
+class MetricsRecorder:
+    """측정값을 모아 JSONL로 기록하는 클래스
+
+    요약은 interval초마다 그동안 모인 값으로 만들고 초기화하므로, 오래 실행해도
+    메모리가 한 구간 분량 이상 늘지 않습니다. 저장 스레드에서도 기록되므로
+    잠금으로 보호합니다.
+    """
+
+    def __init__(
+        self,
+        output: TextIO,
+        mode: str = METRICS_MODE_SUMMARY,
+        interval: float = METRICS_SUMMARY_INTERVAL,
+    ):
+        self.output = output
+        self.events = mode == METRICS_MODE_EVENTS
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _Stat] = {}
+        self._counters: Dict[str, int] = {}
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-summary", daemon=True
+        )
+        self._thread.start()
+
+    def record(self, name: str, seconds: float, nbytes: int = 0) -> None:
+        """구간 하나의 소요 시간과 처리한 바이트 수를 기록합니다."""
+        with self._lock:
+            stat = self._stats.get(name)
+            if stat is None:
+                stat = self._stats[name] = _Stat()
+            stat.durations.append(seconds)
+            stat.bytes += nbytes
+            if self.events:
+                line = {"type": "span", "ts": time.time(), "name": name}
+                line["ms"] = round(seconds * 1000, 4)
+                if nbytes:
+                    line["bytes"] = nbytes
+                self._write(line)
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """지금까지 모인 값의 요약을 반환하고 다음 구간을 위해 비웁니다."""
+        with self._lock:
+            stats, self._stats = self._stats, {}
+            counters, self._counters = self._counters, {}
+        lines = []
+        now = time.time()
+        for name, stat in sorted(stats.items()):
+            durations = sorted(stat.durations)
+            line = {
+                "type": "summary",
+                "ts": now,
+                "name": name,
+                "count": len(durations),
+                "total_ms": round(sum(durations) * 1000, 3),
+                "p50_ms": round(durations[len(durations) // 2] * 1000, 4),
+                "p99_ms": round(
+                    durations[min(len(durations) - 1, int(len(durations) * 0.99))]
+                    * 1000,
+                    4,
+                ),
+            }
+            if stat.bytes:
+                line["bytes"] = stat.bytes
+            lines.append(line)
+        for name, value in sorted(counters.items()):
+            lines.append({"type": "counter", "ts": now, "name": name, "count": value})
+        return lines
+
+    def flush_summary(self) -> None:
+        lines = self.summary()
+        with self._lock:
+            for line in lines:
+                self._write(line)
+            self.output.flush()
+
+    def _write(self, line: Dict[str, Any]) -> None:
+        self.output.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.flush_summary()
+            except Exception as e:
+                print(f"계측 요약 기록 중 오류 발생: {e}")
+
+    def close(self) -> None:
+        """마지막 요약을 기록하고 출력 파일을 닫습니다."""
+        self._stopped.set()
+        self._thread.join(self.interval)
+        self.flush_summary()
+        if self.output not in (sys.stdout, sys.stderr):
+            self.output.close()
+
+
+_recorder: Optional[MetricsRecorder] = None
+
+
+def enabled() -> bool:
+    """계측이 켜져 있는지 반환합니다."""
+    return _recorder is not None
+
+
+def configure(
+    output: Optional[str],
+    mode: str = METRICS_MODE_SUMMARY,
+    interval: float = METRICS_SUMMARY_INTERVAL,
+) -> None:
+    """계측을 켜거나(output이 경로 또는 "-") 끕니다(None)."""
+    global _recorder
+    if _recorder is not None:
+        _recorder.close()
+        _recorder = None
+    if not output:
+        return
+    if mode not in (METRICS_MODE_SUMMARY, METRICS_MODE_EVENTS):
+        raise ValueError(f"지원하지 않는 계측 방식: {mode}")
+    stream = sys.stderr if output == "-" else open(output, "a", encoding="utf-8")
+    _recorder = MetricsRecorder(stream, mode, interval)
+
+
+def configure_from_env() -> None:
+    """환경 변수 COPYANDPASTE_METRICS(_MODE)로 계측을 설정합니다."""
+    output = os.environ.get(METRICS_ENV)
+    if output:
+        configure(output, os.environ.get(METRICS_MODE_ENV, METRICS_MODE_SUMMARY))
+
+
+def _close_at_exit() -> None:
+    if _recorder is not None:
+        configure(None)
+
+
+atexit.register(_close_at_exit)
+
+
+def count(name: str, n: int = 1) -> None:
+    """카운터를 n만큼 올립니다."""
+    if _recorder is not None:
+        _recorder.count(name, n)
+
+
+class _Span:
+    __slots__ = ("name", "nbytes", "started")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.nbytes = 0
+
+    def add_bytes(self, nbytes: int) -> None:
+        """이 구간에서 처리한 바이트 수를 더합니다."""
+        self.nbytes += nbytes
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __enter__(self) -> "_Span":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        recorder = _recorder
+        if recorder is not None:
+            recorder.record(self.name, time.perf_counter() - self.started, self.nbytes)
+
+
+class _NullSpan:
+    """계측이 꺼져 있을 때 쓰는 아무것도 하지 않는 구간 (거짓으로 평가됨)"""
+
+    __slots__ = ()
+
+    def add_bytes(self, nbytes: int) -> None:
+        pass
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str):
+    """with 문으로 감싼 구간의 시간을 잽니다.
+
+    계측이 꺼져 있으면 거짓으로 평가되는 빈 구간을 반환하므로, 바이트 수
+    계산처럼 비용이 드는 작업은 `if s:` 안에서만 하면 됩니다.
+    """
+    if _recorder is None:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """함수 호출 시간을 name으로 기록하는 데코레이터"""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _recorder is None:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                recorder = _recorder
+                if recorder is not None:
+                    recorder.record(name, time.perf_counter() - started)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+configure_from_env()
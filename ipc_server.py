@@ -0,0 +1,318 @@
+"""
+로컬 IPC 서버를 담당하는 모듈입니다.
+실행 중인 앱이 Unix 도메인 소켓으로 요청을 받아, 스크립트나 편집기가 wx를
+불러오거나 저장소를 다시 읽지 않고 값을 가져가거나 바꿀 수 있게 합니다.
+
+요청과 응답은 모두 한 줄짜리 JSON입니다.
+
+    {"op": "get", "key": "인사"}             -> {"ok": true, "value": "안녕하세요"}
+    {"op": "keys"}                           -> {"ok": true, "keys": ["인사", ...]}
+    {"op": "add", "key": "인사", "value": "안녕"}
+    {"op": "update", "key": "인사", "value": "안녕", "new_key": "인사말"}
+    {"op": "delete", "key": "인사"}
+    {"op": "copy", "key": "인사"}            -> 앱이 값을 클립보드에 복사
+
+실패하면 {"ok": false, "error": "..."}를 반환합니다. 키가 같은 항목이 여럿이면
+첫 항목을 사용합니다.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+from constants import (
+    IPC_SOCKET_ENV,
+    IPC_SOCKET_NAME,
+    IPC_TIMEOUT,
+    IPC_DISPATCH_TIMEOUT,
+    IPC_MAX_REQUEST_BYTES,
+    IPC_OP_GET,
+    IPC_OP_KEYS,
+    IPC_OP_ADD,
+    IPC_OP_UPDATE,
+    IPC_OP_DELETE,
+    IPC_OP_COPY,
+    IPC_OP_SET,
+)
+
+if TYPE_CHECKING:
+    # 클라이언트(cli.py)가 서버에 요청할 때는 저장소 모듈을 불러오지 않음
+    from data_manager import DataManager
+
+Request = Dict[str, Any]
+Response = Dict[str, Any]
+# 함수를 메인(UI) 스레드에서 실행하도록 넘기는 함수 (예: wx.CallAfter)
+Dispatcher = Callable[[Callable[[], None]], None]
+
+
+def ipc_supported() -> bool:
+    """이 플랫폼에서 Unix 도메인 소켓을 쓸 수 있는지 반환합니다."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def default_socket_path() -> str:
+    """환경 변수 COPYANDPASTE_SOCKET, 없으면 사용자별 기본 소켓 경로"""
+    path = os.environ.get(IPC_SOCKET_ENV)
+    if path:
+        return path
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(directory, f"{IPC_SOCKET_NAME}-{uid}.sock")
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    return (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _error(message: str) -> Response:
+    return {"ok": False, "error": message}
+
+
+def send_request(
+    request: Request, path: Optional[str] = None, timeout: float = IPC_TIMEOUT
+) -> Response:
+    """서버에 요청 하나를 보내고 응답을 받습니다.
+
+    서버가 없으면 OSError(FileNotFoundError, ConnectionRefusedError 등)가
+    발생합니다.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path or default_socket_path())
+        sock.sendall(_encode(request))
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError("서버가 응답 없이 연결을 끊었습니다.")
+    return json.loads(line.decode("utf-8"))
+
+
+class RequestHandler:
+    """요청을 DataManager 호출로 바꾸는 클래스 (소켓과 무관)
+
+    서버와, 서버가 없을 때 cli.py가 저장소를 직접 읽는 경로가 함께 씁니다.
+    copy는 클립보드에 복사할 함수(copy_value)가 있을 때만 처리합니다.
+    """
+
+    def __init__(
+        self,
+        data_manager: "DataManager",
+        copy_value: Optional[Callable[[str], bool]] = None,
+    ):
+        self.data_manager = data_manager
+        self.copy_value = copy_value
+        self._ops: Dict[str, Callable[[Request], Response]] = {
+            IPC_OP_GET: self._get,
+            IPC_OP_KEYS: self._keys,
+            IPC_OP_ADD: self._add,
+            IPC_OP_UPDATE: self._update,
+            IPC_OP_DELETE: self._delete,
+            IPC_OP_COPY: self._copy,
+            IPC_OP_SET: self._set,
+        }
+
+    def handle(self, request: Request) -> Response:
+        """요청 하나를 처리하고 응답을 반환합니다 (예외를 던지지 않음)."""
+        op = request.get("op") if isinstance(request, dict) else None
+        method = self._ops.get(op)
+        if method is None:
+            return _error(f"알 수 없는 요청: {op}")
+        if not self.data_manager.loaded:
+            response = _error("데이터를 불러오는 중입니다.")
+            response["loading"] = True
+            return response
+        try:
+            return method(request)
+        except (KeyError, TypeError) as e:
+            return _error(f"잘못된 요청: {e}")
+        except Exception as e:
+            print(f"IPC 요청 처리 중 오류 발생: {e}")
+            return _error(str(e))
+
+    @staticmethod
+    def _text(request: Request, name: str) -> str:
+        value = request[name]
+        if not isinstance(value, str):
+            raise TypeError(f"{name}은(는) 문자열이어야 합니다")
+        return value
+
+    def _find(self, request: Request) -> Optional[int]:
+        return self.data_manager.find_key(self._text(request, "key"))
+
+    @staticmethod
+    def _result(success: bool) -> Response:
+        return {"ok": True} if success else _error("저장하지 못했습니다.")
+
+    def _get(self, request: Request) -> Response:
+        index = self._find(request)
+        if index is None:
+            return _error(f"키가 없습니다: {request['key']}")
+        return {"ok": True, "value": self.data_manager.get_value(index)}
+
+    def _keys(self, request: Request) -> Response:
+        return {"ok": True, "keys": self.data_manager.get_keys()}
+
+    def _add(self, request: Request) -> Response:
+        key = self._text(request, "key")
+        value = self._text(request, "value")
+        return self._result(self.data_manager.add_item(key, value))
+
+    def _set(self, request: Request) -> Response:
+        key = self._text(request, "key")
+        value = self._text(request, "value")
+        return self._result(self.data_manager.upsert(key, value))
+
+    def _update(self, request: Request) -> Response:
+        index = self._find(request)
+        if index is None:
+            return _error(f"키가 없습니다: {request['key']}")
+        key = self._text(request, "new_key" if "new_key" in request else "key")
+        value = self._text(request, "value")
+        return self._result(self.data_manager.update_item(index, key, value))
+
+    def _delete(self, request: Request) -> Response:
+        index = self._find(request)
+        if index is None:
+            return _error(f"키가 없습니다: {request['key']}")
+        return self._result(self.data_manager.delete_data(index))
+
+    def _copy(self, request: Request) -> Response:
+        if self.copy_value is None:
+            return _error("클립보드 복사는 실행 중인 앱에서만 할 수 있습니다.")
+        index = self._find(request)
+        if index is None:
+            return _error(f"키가 없습니다: {request['key']}")
+        value = self.data_manager.get_value(index)
+        if not self.copy_value(value):
+            return _error("클립보드에 접근할 수 없습니다.")
+        return {"ok": True}
+
+
+class IpcServer:
+    """Unix 도메인 소켓으로 요청을 받는 서버
+
+    연결마다 작업 스레드가 요청 줄을 읽고, 처리는 dispatch로 메인 스레드에
+    넘겨 UI와 같은 스레드에서 DataManager를 사용합니다 (dispatch가 없으면
+    작업 스레드에서 바로 처리). 한 연결로 여러 요청을 차례로 보낼 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        handler: RequestHandler,
+        path: Optional[str] = None,
+        dispatch: Optional[Dispatcher] = None,
+    ):
+        self.handler = handler
+        self.path = path or default_socket_path()
+        self.dispatch = dispatch
+        self._server: Optional[socketserver.BaseServer] = None
+
+    def start(self) -> bool:
+        """소켓을 열고 요청을 받기 시작합니다. 열지 못하면 False."""
+        if not ipc_supported():
+            print("이 플랫폼은 Unix 도메인 소켓을 지원하지 않아 IPC 서버를 켜지 않습니다.")
+            return False
+        if not self._remove_stale_socket():
+            print(f"다른 인스턴스가 이미 IPC 소켓을 쓰고 있습니다: {self.path}")
+            return False
+        try:
+            server = _UnixServer(self.path, _ConnectionHandler)
+            # 같은 사용자만 연결할 수 있도록 함
+            os.chmod(self.path, 0o600)
+        except OSError as e:
+            print(f"IPC 서버 시작 중 오류 발생: {e}")
+            return False
+        server.ipc = self
+        self._server = server
+        threading.Thread(
+            target=server.serve_forever, name="ipc-server", daemon=True
+        ).start()
+        return True
+
+    def _remove_stale_socket(self) -> bool:
+        """이전 실행이 남긴 소켓 파일을 지웁니다. 응답하는 서버가 있으면 False."""
+        if not os.path.exists(self.path):
+            return True
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(IPC_TIMEOUT)
+                sock.connect(self.path)
+        except OSError:
+            os.remove(self.path)
+            return True
+        return False
+
+    def process(self, request: Request) -> Response:
+        """요청 하나를 처리한 응답 (dispatch가 있으면 메인 스레드에서 처리)
+
+        메인 스레드가 IPC_DISPATCH_TIMEOUT 안에 요청을 시작하지 않으면 요청을
+        취소하므로, 시간 초과 응답을 받은 변경 요청은 적용되지 않습니다. 이미
+        처리를 시작했는데 끝나지 않았으면 결과를 알 수 없다는 오류를 반환합니다.
+        """
+        if self.dispatch is None:
+            return self.handler.handle(request)
+        done = threading.Event()
+        state_lock = threading.Lock()
+        state = {"started": False, "cancelled": False}
+        result: Dict[str, Response] = {}
+
+        def run() -> None:
+            with state_lock:
+                if state["cancelled"]:
+                    return
+                state["started"] = True
+            try:
+                result["response"] = self.handler.handle(request)
+            finally:
+                done.set()
+
+        self.dispatch(run)
+        if not done.wait(IPC_DISPATCH_TIMEOUT):
+            with state_lock:
+                if not state["started"]:
+                    state["cancelled"] = True
+                    return _error("앱이 응답하지 않아 요청을 취소했습니다.")
+            return _error("앱이 요청을 처리하는 중이라 결과를 알 수 없습니다.")
+        return result.get("response") or _error("요청을 처리하지 못했습니다.")
+
+    def close(self) -> None:
+        """요청 받기를 멈추고 소켓 파일을 지웁니다."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    """연결 하나에서 요청 줄을 읽어 응답 줄을 씁니다."""
+
+    def handle(self) -> None:
+        ipc: IpcServer = self.server.ipc
+        while True:
+            line = self.rfile.readline(IPC_MAX_REQUEST_BYTES + 1)
+            if not line:
+                return
+            if len(line) > IPC_MAX_REQUEST_BYTES:
+                self.wfile.write(_encode(_error("요청이 너무 큽니다.")))
+                return
+            try:
+                request = json.loads(line.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                response = _error(f"잘못된 요청: {e}")
+            else:
+                response = ipc.process(request)
+            self.wfile.write(_encode(response))
+
+
+if ipc_supported():
+
+    class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
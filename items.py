@@ -0,0 +1,114 @@
+"""
+JSON 저장소 항목의 메모리 표현을 정의하는 모듈입니다.
+항목은 dict 대신 (키, 값) 튜플로 보관하고, 파일에는 기존과 같은
+{"key", "value"} 또는 {"key", "blob"} 모양으로 기록합니다.
+"""
+
+import json
+from json.encoder import encode_basestring
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+# blob 파일의 값 참조: (오프셋, 바이트 길이)
+BlobRef = Tuple[int, int]
+
+# 메모리의 항목: (키, 값). 큰 값은 값 문자열 대신 blob 참조가 들어갑니다.
+#
+# 항목당 dict(약 184바이트) 대신 56바이트 튜플 하나만 쓰고, 문자열과 정수만
+# 담은 튜플은 순환 GC의 추적 대상에서 빠지므로 항목이 많아져도 GC 시간이
+# 늘지 않습니다. 튜플은 수정할 수 없으므로 저장 스레드가 목록의 얕은
+# 복사본을 그대로 직렬화해도 안전합니다.
+StoredItem = Tuple[str, Union[str, BlobRef]]
+
+# dumps_data()에서 목록 자리를 표시하는 값 (설정 값과 겹치지 않는 문자열)
+_LIST_PLACEHOLDER = "\x00list\x00"
+
+
+def make_item(key: str, value: str) -> StoredItem:
+    return (key, value)
+
+
+def make_blob_item(key: str, ref: Sequence[int]) -> StoredItem:
+    return (key, (ref[0], ref[1]))
+
+
+def item_blob(item: StoredItem) -> Optional[BlobRef]:
+    """항목의 blob 참조 (값이 항목 안에 있으면 None)"""
+    value = item[1]
+    return value if type(value) is tuple else None
+
+
+def item_from_json(obj: Dict[str, Any]) -> StoredItem:
+    """파일의 항목(또는 저널의 add/update 레코드)에서 항목을 만듭니다."""
+    if "blob" in obj:
+        return make_blob_item(obj["key"], obj["blob"])
+    return (obj["key"], obj["value"])
+
+
+def item_object_hook(obj: Dict[str, Any]) -> Any:
+    """json.loads용 훅: 항목 모양의 객체를 파싱하는 즉시 튜플로 바꿉니다.
+
+    항목 dict가 한꺼번에 쌓이지 않으므로 로드 중 메모리도 늘지 않습니다.
+    """
+    if "key" in obj and ("value" in obj or "blob" in obj):
+        return item_from_json(obj)
+    return obj
+
+
+def item_to_json(item: StoredItem) -> Dict[str, Any]:
+    """파일(스냅샷, 저널)에 기록할 dict"""
+    key, value = item
+    if type(value) is tuple:
+        return {"key": key, "blob": list(value)}
+    return {"key": key, "value": value}
+
+
+def _dump_items_pretty(items: Sequence[StoredItem]) -> str:
+    """json.dumps(indent=2)로 최상위 dict 안의 항목 목록을 쓴 것과 같은 문자열"""
+    if not items:
+        return "[]"
+    parts = []
+    for key, value in items:
+        if type(value) is tuple:
+            parts.append(
+                f'    {{\n      "key": {encode_basestring(key)},\n'
+                f'      "blob": [\n        {value[0]},\n        {value[1]}\n'
+                f"      ]\n    }}"
+            )
+        else:
+            parts.append(
+                f'    {{\n      "key": {encode_basestring(key)},\n'
+                f'      "value": {encode_basestring(value)}\n    }}'
+            )
+    return "[\n" + ",\n".join(parts) + "\n  ]"
+
+
+def _dump_items_compact(items: Sequence[StoredItem]) -> str:
+    """json.dumps(separators=(",", ":"))와 같은 문자열"""
+    parts = []
+    for key, value in items:
+        if type(value) is tuple:
+            parts.append(
+                f'{{"key":{encode_basestring(key)},"blob":[{value[0]},{value[1]}]}}'
+            )
+        else:
+            parts.append(
+                f'{{"key":{encode_basestring(key)},"value":{encode_basestring(value)}}}'
+            )
+    return "[" + ",".join(parts) + "]"
+
+
+def dumps_data(data: Dict[str, Any], pretty: bool = True) -> str:
+    """data["list"]에 항목 튜플이 든 데이터를 기존 JSON 모양으로 씁니다.
+
+    항목마다 dict를 만들지 않고 바로 문자열로 만들며, 결과는 항목을 dict로
+    바꿔 json.dumps(ensure_ascii=False)한 것과 바이트 단위로 같습니다.
+    """
+    head = dict(data)
+    head["list"] = _LIST_PLACEHOLDER
+    if pretty:
+        text = json.dumps(head, indent=2, ensure_ascii=False)
+        items = _dump_items_pretty(data["list"])
+    else:
+        text = json.dumps(head, ensure_ascii=False, separators=(",", ":"))
+        items = _dump_items_compact(data["list"])
+    return text.replace(encode_basestring(_LIST_PLACEHOLDER), items, 1)
@@ -0,0 +1,260 @@
+"""
+append-only 변경 로그(저널)를 담당하는 모듈입니다.
+항목 변경마다 작은 레코드 한 줄을 파일 끝에 추가하고,
+시작 시 스냅샷 위에 레코드를 다시 적용(replay)합니다.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from constants import (
+    JOURNAL_COMPACTING_SUFFIX,
+    JOURNAL_GENERATION_KEY,
+    JOURNAL_OP_ADD,
+    JOURNAL_OP_UPDATE,
+    JOURNAL_OP_DELETE,
+    JOURNAL_OP_CLEAR,
+    JOURNAL_OP_FONT_SIZE,
+    JOURNAL_OP_SETTING,
+    JOURNAL_OP_BATCH,
+)
+from items import item_from_json
+
+JournalRecord = Dict[str, Any]
+
+
+def apply_record(data: Dict[str, Any], record: JournalRecord) -> None:
+    """저널 레코드 하나를 데이터에 적용합니다."""
+    op = record.get("op")
+    if op == JOURNAL_OP_ADD:
+        data["list"].append(item_from_json(record))
+    elif op == JOURNAL_OP_UPDATE:
+        data["list"][record["index"]] = item_from_json(record)
+    elif op == JOURNAL_OP_DELETE:
+        del data["list"][record["index"]]
+    elif op == JOURNAL_OP_CLEAR:
+        data["list"] = []
+    elif op == JOURNAL_OP_SETTING:
+        data[record["name"]] = record["value"]
+    elif op == JOURNAL_OP_FONT_SIZE:
+        data["font_size"] = record["value"]
+    elif op == JOURNAL_OP_BATCH:
+        for batch_record in record["records"]:
+            apply_record(data, batch_record)
+    else:
+        raise ValueError(f"알 수 없는 저널 레코드: {record}")
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _read_journal_file(path: str) -> Tuple[int, List[JournalRecord], bytes]:
+    """저널 파일을 읽어 (세대, 레코드 목록, 유효한 원본 바이트)를 반환합니다.
+
+    비정상 종료로 마지막 줄이 잘린 경우 그 줄은 버립니다.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    generation = 0
+    records: List[JournalRecord] = []
+    valid_length = 0
+    for line in raw.splitlines(keepends=True):
+        if not line.endswith(b"\n"):
+            break
+        try:
+            record = json.loads(line.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            break
+        if JOURNAL_GENERATION_KEY in record:
+            generation = record[JOURNAL_GENERATION_KEY]
+        else:
+            records.append(record)
+        valid_length += len(line)
+    return generation, records, raw[:valid_length]
+
+
+class Journal:
+    """스냅샷 옆에 붙는 append-only 저널 파일 관리 클래스
+
+    파일 첫 줄에는 세대(generation) 번호가 기록됩니다. 스냅샷에 같은 키로
+    저장된 세대보다 오래된 저널은 이미 스냅샷에 반영된 것으로 보고 건너뜁니다.
+    압축(compaction) 중에는 기존 저널을 .compacting 파일로 옮기고 새 세대의
+    저널에 계속 기록합니다.
+
+    shared=True면 다른 프로세스도 같은 저널에 기록하는 것으로 보고, 어디까지
+    읽었는지(offset)를 기억해 read_new()로 그 뒤에 추가된 레코드만 읽습니다.
+    이때 append()는 다른 프로세스의 레코드를 모두 읽은 뒤(저장소 잠금 안에서)
+    호출해야 합니다.
+    """
+
+    def __init__(self, path: str, shared: bool = False):
+        self.path = path
+        self.compacting_path = path + JOURNAL_COMPACTING_SUFFIX
+        self.shared = shared
+        self.generation = 0
+        # 현재 저널 파일에서 읽었거나 직접 기록한 위치 (바이트)
+        self.offset = 0
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._hasher = hashlib.blake2b(digest_size=16)
+
+    def load(self, snapshot_generation: int) -> List[JournalRecord]:
+        """스냅샷 이후에 기록된 레코드들을 순서대로 반환합니다."""
+        records: List[JournalRecord] = []
+        if os.path.exists(self.compacting_path):
+            generation, pending, _ = _read_journal_file(self.compacting_path)
+            if generation >= snapshot_generation:
+                records.extend(pending)
+
+        if os.path.exists(self.path):
+            generation, current, raw = _read_journal_file(self.path)
+            if generation >= snapshot_generation:
+                records.extend(current)
+                self.generation = generation
+                # 잘린 마지막 줄이 있었다면 제거해 이후 append가 이어지도록 함
+                with open(self.path, "r+b") as f:
+                    f.truncate(len(raw))
+                self.offset = len(raw)
+                self._reset_hash(raw)
+                return records
+
+        self.start(snapshot_generation)
+        return records
+
+    def read(self, snapshot_generation: int) -> List[JournalRecord]:
+        """load()와 같은 레코드들을 파일을 고치거나 만들지 않고 읽기만 합니다."""
+        records: List[JournalRecord] = []
+        for path in (self.compacting_path, self.path):
+            if os.path.exists(path):
+                generation, pending, _ = _read_journal_file(path)
+                if generation >= snapshot_generation:
+                    records.extend(pending)
+        return records
+
+    def start(self, generation: int) -> None:
+        """주어진 세대로 빈 저널 파일을 새로 만듭니다."""
+        header = _encode({JOURNAL_GENERATION_KEY: generation})
+        with open(self.path, "wb") as f:
+            f.write(header)
+            f.flush()
+            os.fsync(f.fileno())
+        self.generation = generation
+        self.offset = len(header)
+        self._reset_hash(header)
+
+    def append(self, records: Iterable[JournalRecord]) -> int:
+        """레코드들을 파일 끝에 추가하고 기록한 바이트 수를 반환합니다."""
+        raw = b"".join(_encode(record) for record in records)
+        if not raw:
+            return 0
+        with open(self.path, "ab") as f:
+            if self.shared and os.fstat(f.fileno()).st_size != self.offset:
+                raise RuntimeError(
+                    f"다른 프로세스의 저널 레코드를 아직 읽지 않았습니다: {self.path}"
+                )
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        self.offset += len(raw)
+        self._hasher.update(raw)
+        self._signature = self._stat()
+        return len(raw)
+
+    def rotate(self, new_generation: int) -> None:
+        """현재 저널을 .compacting으로 옮기고 새 세대의 저널을 시작합니다.
+
+        이전 압축이 실패해 .compacting이 남아 있으면 현재 저널 내용을 그 뒤에
+        이어 붙여 레코드 순서를 유지합니다.
+        """
+        if os.path.exists(self.path):
+            if os.path.exists(self.compacting_path):
+                _, _, raw = _read_journal_file(self.path)
+                body = raw.split(b"\n", 1)[1] if b"\n" in raw else b""
+                with open(self.compacting_path, "ab") as f:
+                    f.write(body)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.remove(self.path)
+            else:
+                os.replace(self.path, self.compacting_path)
+        self.start(new_generation)
+
+    def discard_compacting(self) -> None:
+        """압축이 끝난 뒤 .compacting 파일을 삭제합니다."""
+        try:
+            os.remove(self.compacting_path)
+        except FileNotFoundError:
+            pass
+
+    def size(self) -> int:
+        """현재 저널 파일 크기(바이트)"""
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def read_new(self) -> Optional[List[JournalRecord]]:
+        """마지막으로 읽거나 기록한 위치 이후에 다른 프로세스가 추가한 레코드들
+
+        크기가 그대로면 stat 한 번으로 끝나고, 늘어났으면 늘어난 부분만 읽습니다.
+        아직 기록 중인 마지막 줄은 다음 호출 때 읽습니다. 저널이 압축으로 다른
+        세대의 파일로 바뀌었으면 None을 반환하므로 전체를 다시 읽어야 합니다.
+        """
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            # 압축 중 파일이 교체되는 순간
+            return []
+        if size == self.offset:
+            return []
+        if size < self.offset:
+            return None
+        with open(self.path, "rb") as f:
+            try:
+                header = json.loads(f.readline().decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                return None
+            if header.get(JOURNAL_GENERATION_KEY) != self.generation:
+                return None
+            f.seek(self.offset)
+            raw = f.read(size - self.offset)
+
+        records: List[JournalRecord] = []
+        consumed = 0
+        for line in raw.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            records.append(json.loads(line.decode("utf-8")))
+            consumed += len(line)
+        self.offset += consumed
+        self._hasher.update(raw[:consumed])
+        self._signature = self._stat()
+        return records
+
+    def has_external_change(self) -> bool:
+        """다른 프로세스가 저널을 수정했는지 확인합니다."""
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False
+        try:
+            with open(self.path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            return False
+        if hashlib.blake2b(raw, digest_size=16).hexdigest() == self._hasher.hexdigest():
+            self._signature = signature
+            return False
+        return True
+
+    def _reset_hash(self, raw: bytes) -> None:
+        self._hasher = hashlib.blake2b(raw, digest_size=16)
+        self._signature = self._stat()
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
@@ -2,31 +2,76 @@
 복붙 관리 애플리케이션의 메인 모듈입니다.
 """
 
+import argparse
+import os
 import wx
 import sys
 from typing import Optional
+import instrumentation
 from data_manager import DataManager
+from ipc_server import IpcServer, RequestHandler
+from storage_backends import detect_storage_mode
 from ui_manager import UIManager
-from constants import DEFAULT_DATA_FILE
+from constants import (
+    DEFAULT_DATA_FILE,
+    JOURNAL_SUFFIX,
+    STORAGE_MODE_SNAPSHOT,
+    STORAGE_MODE_JOURNAL,
+    STORAGE_MODE_INDEXED,
+    STORAGE_MODE_SQLITE,
+    METRICS_MODE_SUMMARY,
+    METRICS_MODE_EVENTS,
+)
 
 
 class CopyAndPasteApp(wx.App):
     """복붙 관리 애플리케이션의 메인 클래스"""
 
-    def __init__(self, data_file: str = DEFAULT_DATA_FILE):
+    def __init__(
+        self,
+        data_file: str = DEFAULT_DATA_FILE,
+        storage_mode: str = STORAGE_MODE_SNAPSHOT,
+        clipboard_history: bool = False,
+        shared: bool = False,
+        ipc: bool = False,
+        unique_keys: bool = False,
+    ):
         self.data_file = data_file
+        self.storage_mode = storage_mode
+        self.clipboard_history = clipboard_history
+        self.shared = shared
+        self.ipc = ipc
+        self.unique_keys = unique_keys
         self.data_manager: Optional[DataManager] = None
         self.ui_manager: Optional[UIManager] = None
+        self.ipc_server: Optional[IpcServer] = None
         super().__init__()
 
     def OnInit(self) -> bool:
         """애플리케이션 초기화"""
         try:
-            # 데이터 매니저 초기화
-            self.data_manager = DataManager(self.data_file)
+            # 데이터 매니저 초기화 (저장소는 창을 띄운 뒤 읽음)
+            self.data_manager = DataManager(
+                self.data_file,
+                self.storage_mode,
+                write_behind=True,
+                load=False,
+                shared=self.shared,
+                unique_keys=self.unique_keys,
+            )
 
-            # UI 매니저 초기화
+            # UI 매니저 초기화: 빈 리스트로 창을 먼저 보여주고 백그라운드에서 로드
             self.ui_manager = UIManager(self, self.data_manager)
+            self.ui_manager.load_data_in_background()
+            if self.clipboard_history:
+                self.ui_manager.enable_clipboard_history()
+            if self.ipc:
+                # 요청은 소켓 스레드에서 받아 메인 스레드에서 처리
+                self.ipc_server = IpcServer(
+                    RequestHandler(self.data_manager, self.ui_manager.copy_to_clipboard),
+                    dispatch=wx.CallAfter,
+                )
+                self.ipc_server.start()
 
             return True
         except Exception as e:
@@ -41,19 +86,108 @@ class CopyAndPasteApp(wx.App):
     def OnExit(self) -> int:
         """애플리케이션 종료 시 정리 작업"""
         try:
+            if self.ipc_server:
+                self.ipc_server.close()
             if self.data_manager:
-                # 마지막 데이터 저장
-                self.data_manager.save_data()
+                # 백그라운드에 남은 쓰기를 마무리
+                self.data_manager.close()
         except Exception as e:
             print(f"종료 시 데이터 저장 중 오류: {e}")
 
         return 0
 
 
+def _choose_storage_mode(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> str:
+    """--storage가 없으면 디스크에 있는 저장소에 맞춰 저장 방식을 정합니다.
+
+    기존 저장소와 맞지 않는 방식(SQLite와 JSON을 바꿔 열거나, 저널이 있는
+    저장소를 스냅샷으로 여는 경우)은 데이터를 잃을 수 있으므로 거부합니다.
+    """
+    detected = detect_storage_mode(args.data_file)
+    storage_mode = args.storage or detected
+    if os.path.exists(args.data_file) or os.path.exists(
+        args.data_file + JOURNAL_SUFFIX
+    ):
+        if (storage_mode == STORAGE_MODE_SQLITE) != (detected == STORAGE_MODE_SQLITE):
+            parser.error(
+                f"{args.data_file}은(는) {detected} 저장소입니다 "
+                "(JSON을 SQLite로 옮기려면 storage_backends.py migrate)"
+            )
+        if storage_mode == STORAGE_MODE_SNAPSHOT and detected == STORAGE_MODE_JOURNAL:
+            parser.error(f"{args.data_file}은(는) 저널이 있어 스냅샷 방식으로 열 수 없습니다")
+    if args.shared and storage_mode == STORAGE_MODE_SNAPSHOT:
+        if args.storage:
+            parser.error("--shared에는 journal, indexed 또는 sqlite 저장 방식이 필요합니다")
+        # 공유하려면 저널이 필요 (기존 스냅샷 위에 저널을 이어 씀)
+        storage_mode = STORAGE_MODE_JOURNAL
+    return storage_mode
+
+
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="복붙 관리 애플리케이션")
+    parser.add_argument(
+        "--data-file",
+        default=DEFAULT_DATA_FILE,
+        help="저장소 파일 (.db 등 SQLite 확장자면 SQLite)",
+    )
+    parser.add_argument(
+        "--storage",
+        choices=[
+            STORAGE_MODE_SNAPSHOT,
+            STORAGE_MODE_JOURNAL,
+            STORAGE_MODE_INDEXED,
+            STORAGE_MODE_SQLITE,
+        ],
+        help="저장 방식 (기본: 디스크에 있는 저장소에 맞춤, 없으면 snapshot)",
+    )
+    parser.add_argument(
+        "--metrics",
+        metavar="PATH",
+        help="성능 계측 결과를 기록할 JSONL 파일 (-는 표준 에러)",
+    )
+    parser.add_argument(
+        "--metrics-mode",
+        choices=[METRICS_MODE_SUMMARY, METRICS_MODE_EVENTS],
+        default=METRICS_MODE_SUMMARY,
+    )
+    parser.add_argument(
+        "--clipboard-history",
+        action="store_true",
+        help="다른 프로그램에서 복사한 텍스트를 기록해 목록 아래에 표시",
+    )
+    parser.add_argument(
+        "--shared",
+        action="store_true",
+        help="여러 창이 같은 데이터 파일을 함께 쓰도록 잠금과 변경 공유를 켬 (저널 방식)",
+    )
+    parser.add_argument(
+        "--ipc",
+        action="store_true",
+        help="cli.py가 값을 가져가거나 바꿀 수 있도록 로컬 소켓으로 요청을 받음",
+    )
+    parser.add_argument(
+        "--unique-keys",
+        action="store_true",
+        help="이미 있는 키로 항목을 추가하거나 바꾸지 못하게 함",
+    )
+    args = parser.parse_args()
+    if args.metrics:
+        instrumentation.configure(args.metrics, args.metrics_mode)
+
+    storage_mode = _choose_storage_mode(parser, args)
+
     try:
-        app = CopyAndPasteApp()
+        app = CopyAndPasteApp(
+            data_file=args.data_file,
+            storage_mode=storage_mode,
+            clipboard_history=args.clipboard_history,
+            shared=args.shared,
+            ipc=args.ipc,
+            unique_keys=args.unique_keys,
+        )
         app.MainLoop()
     except Exception as e:
         print(f"애플리케이션 실행 중 오류 발생: {e}")
@@ -0,0 +1,164 @@
+"""
+빠른 붙여넣기 팔레트를 담당하는 모듈입니다.
+전역 단축키로 불러오는 작은 창에서 키를 입력해 항목을 찾고,
+Enter로 선택한 항목의 값을 클립보드에 복사합니다.
+"""
+
+import wx
+from typing import Callable, List
+from constants import (
+    CHANGE_RESET,
+    PALETTE_WIDTH,
+    PALETTE_HEIGHT,
+    PALETTE_MAX_RESULTS,
+)
+from data_manager import DataManager
+from theme_manager import ThemeManager
+
+
+class QuickPastePalette(wx.Frame):
+    """키 검색 팔레트 창
+
+    시작할 때 한 번 만들어 숨겨 두고, 단축키가 눌리면 보여주기만 하므로
+    창 생성 비용 없이 바로 나타납니다. 검색은 DataManager의 키 트라이를
+    사용하며, 트라이는 항목 변경마다 갱신되므로 열 때 다시 만들지 않습니다.
+    """
+
+    def __init__(
+        self,
+        data_manager: DataManager,
+        copy_value: Callable[[str], bool],
+        font: wx.Font,
+    ):
+        super().__init__(
+            None,
+            title="빠른 붙여넣기",
+            size=(PALETTE_WIDTH, PALETTE_HEIGHT),
+            style=wx.FRAME_NO_TASKBAR | wx.STAY_ON_TOP | wx.BORDER_SIMPLE,
+        )
+        self.data_manager = data_manager
+        self.copy_value = copy_value
+        # 결과 목록의 행 -> DataManager 인덱스
+        self._matches: List[int] = []
+
+        self._init_ui(font)
+        self.apply_theme()
+
+        self.Bind(wx.EVT_CHAR_HOOK, self.on_char_hook)
+        self.Bind(wx.EVT_ACTIVATE, self.on_activate)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.data_manager.add_listener(self._on_data_changed)
+
+    def _init_ui(self, font: wx.Font) -> None:
+        panel = wx.Panel(self)
+        self.panel = panel
+        self.query_text = wx.TextCtrl(panel, style=wx.TE_PROCESS_ENTER)
+        self.query_text.SetHint("키 검색")
+        self.result_list = wx.ListBox(panel, style=wx.LB_SINGLE)
+        self.query_text.SetFont(font)
+        self.result_list.SetFont(font)
+
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer.Add(self.query_text, 0, wx.EXPAND | wx.ALL, 5)
+        sizer.Add(self.result_list, 1, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM, 5)
+        panel.SetSizer(sizer)
+
+        self.query_text.Bind(wx.EVT_TEXT, self.on_query_text)
+        self.query_text.Bind(wx.EVT_TEXT_ENTER, self.on_enter)
+        self.result_list.Bind(wx.EVT_LISTBOX_DCLICK, self.on_enter)
+
+    def set_font(self, font: wx.Font) -> None:
+        """검색창과 결과 목록의 글꼴을 바꿉니다."""
+        self.query_text.SetFont(font)
+        self.result_list.SetFont(font)
+        self.panel.Layout()
+
+    def apply_theme(self) -> None:
+        """현재 테마 색상을 적용합니다."""
+        colors = ThemeManager.get_theme_colors()
+        self.panel.SetBackgroundColour(colors["background"])
+        self.query_text.SetBackgroundColour(colors["input_background"])
+        self.query_text.SetForegroundColour(colors["text"])
+        self.result_list.SetBackgroundColour(colors["list_background"])
+        self.result_list.SetForegroundColour(colors["text"])
+
+    def show_palette(self) -> None:
+        """검색어를 비우고 화면 가운데에 팔레트를 보여줍니다."""
+        self.query_text.ChangeValue("")
+        self._update_results()
+        self.CentreOnScreen()
+        self.Show()
+        self.Raise()
+        self.query_text.SetFocus()
+
+    def hide_palette(self) -> None:
+        """팔레트를 숨깁니다 (창은 다음 호출을 위해 유지)."""
+        if self.IsShown():
+            self.Hide()
+
+    def _update_results(self) -> None:
+        """현재 검색어로 결과 목록을 다시 채웁니다."""
+        query = self.query_text.GetValue().strip()
+        self._matches = self.data_manager.match_keys(query, PALETTE_MAX_RESULTS)
+        labels = []
+        for index in self._matches:
+            item = self.data_manager.get_preview(index)
+            labels.append(item["key"] if item is not None else "")
+        self.result_list.Set(labels)
+        if labels:
+            self.result_list.SetSelection(0)
+
+    def _on_data_changed(self, event: str, index: int) -> None:
+        """팔레트가 열려 있는 동안 항목이 바뀌면 결과를 다시 구합니다."""
+        if self.IsShown():
+            self._update_results()
+        elif event == CHANGE_RESET:
+            self._matches = []
+
+    def on_query_text(self, event) -> None:
+        """검색어 입력 시 결과 갱신"""
+        self._update_results()
+
+    def on_char_hook(self, event) -> None:
+        """Esc로 닫고, 위/아래 화살표로 결과를 선택합니다."""
+        key_code = event.GetKeyCode()
+        if key_code == wx.WXK_ESCAPE:
+            self.hide_palette()
+            return
+        if key_code in (wx.WXK_UP, wx.WXK_DOWN) and self._matches:
+            step = -1 if key_code == wx.WXK_UP else 1
+            selection = self.result_list.GetSelection()
+            selection = max(0, min(len(self._matches) - 1, selection + step))
+            self.result_list.SetSelection(selection)
+            return
+        event.Skip()
+
+    def on_enter(self, event) -> None:
+        """선택한 항목의 값을 복사하고 팔레트를 숨깁니다."""
+        selection = self.result_list.GetSelection()
+        if selection == wx.NOT_FOUND or selection >= len(self._matches):
+            return
+        value = self.data_manager.get_value(self._matches[selection])
+        if value is None:
+            return
+        self.hide_palette()
+        self.copy_value(value)
+
+    def on_activate(self, event) -> None:
+        """다른 창으로 포커스가 옮겨가면 숨깁니다."""
+        if not event.GetActive():
+            self.hide_palette()
+        event.Skip()
+
+    def on_close(self, event) -> None:
+        """닫기 요청은 숨기기로 처리하고, 강제 종료일 때만 파괴합니다."""
+        if event.CanVeto():
+            event.Veto()
+            self.hide_palette()
+            return
+        self.destroy_palette()
+
+    def destroy_palette(self) -> None:
+        """리스너를 해제하고 창을 파괴합니다."""
+        self.data_manager.remove_listener(self._on_data_changed)
+        self.Destroy()
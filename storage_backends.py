@@ -0,0 +1,1201 @@
+"""
+저장소 백엔드를 정의하는 모듈입니다.
+DataManager는 StorageBackend 프로토콜만 사용하며, JSON 파일(스냅샷/저널)과
+SQLite 구현을 제공합니다.
+
+기존 data.json을 SQLite로 옮기려면:
+    python storage_backends.py migrate data.json data.db
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from contextlib import nullcontext
+from urllib.request import pathname2url
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    runtime_checkable,
+)
+from constants import (
+    DEFAULT_INIT_DATA,
+    DEFAULT_FONT_SIZE_VALUE,
+    STORAGE_MODE_SNAPSHOT,
+    STORAGE_MODE_JOURNAL,
+    STORAGE_MODE_SQLITE,
+    STORAGE_MODE_INDEXED,
+    SQLITE_FILE_EXTENSIONS,
+    SQLITE_FILE_HEADER,
+    SQLITE_PAGE_SIZE,
+    SQLITE_PAGE_CACHE_PAGES,
+    JOURNAL_SUFFIX,
+    JOURNAL_COMPACTING_SUFFIX,
+    JOURNAL_GENERATION_KEY,
+    JOURNAL_COMPACT_MIN_BYTES,
+    JOURNAL_COMPACT_RATIO,
+    JOURNAL_OP_ADD,
+    JOURNAL_OP_UPDATE,
+    JOURNAL_OP_DELETE,
+    JOURNAL_OP_CLEAR,
+    JOURNAL_OP_SETTING,
+    JOURNAL_OP_BATCH,
+    BLOB_SUFFIX,
+    BLOB_GENERATION_KEY,
+    BLOB_THRESHOLD,
+    BLOB_COMPACT_MIN_BYTES,
+    BLOB_COMPACT_RATIO,
+    VALUE_PREVIEW_LENGTH,
+    VALUE_CACHE_BYTES,
+    STORE_LOCK_SUFFIX,
+    CHANGE_ADD,
+    CHANGE_UPDATE,
+    CHANGE_DELETE,
+    CHANGE_RESET,
+)
+from instrumentation import span
+from items import (
+    BlobRef,
+    StoredItem,
+    dumps_data,
+    item_blob,
+    item_object_hook,
+    item_to_json,
+    make_blob_item,
+    make_item,
+)
+from journal import Journal, JournalRecord, apply_record
+from store_lock import StoreLock
+from value_store import BlobStore, ValueCache
+from write_behind import WriteBehindSaver, atomic_write
+
+Item = Dict[str, str]
+
+# 파일 변경 여부를 싸게 비교하기 위한 (mtime_ns, size, inode)
+FileSignature = Tuple[int, int, int]
+
+# 다른 인스턴스의 변경을 적용한 결과: (변경 이벤트, 행 인덱스, 이전 키)
+# 설정 변경처럼 항목과 무관하면 이벤트가 None입니다.
+ExternalChange = Tuple[Optional[str], int, str]
+
+
+def _file_signature(path: str) -> Optional[FileSignature]:
+    """파일의 (mtime_ns, size, inode)를 반환합니다. 없으면 None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _content_hash(raw: bytes) -> str:
+    """파일 내용 해시"""
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class StorageBackend(Protocol):
+    """DataManager가 사용하는 저장소 인터페이스
+
+    인덱스 범위 검사는 DataManager가 하므로 구현체는 올바른 인덱스만 받습니다.
+    변경 메서드는 저장 성공 여부를 반환합니다.
+    """
+
+    path: str
+
+    def load(self) -> None:
+        """저장소에서 상태를 (다시) 읽습니다."""
+
+    def count(self) -> int:
+        """항목 개수"""
+
+    def get(self, index: int) -> Item:
+        """index 위치의 항목"""
+
+    def get_value(self, index: int) -> str:
+        """index 위치 항목의 값 전체"""
+
+    def get_range(self, start: int, count: int) -> List[Item]:
+        """start부터 최대 count개의 항목"""
+
+    def get_previews(self, start: int, count: int, length: int) -> List[Item]:
+        """start부터 최대 count개의 항목을 값의 앞 length글자만 담아 반환합니다.
+
+        큰 값도 전체를 읽지 않으므로 리스트 표시나 색인 구축에 사용합니다.
+        """
+
+    def items(self) -> List[Item]:
+        """모든 항목"""
+
+    def row_identities(self) -> List[Hashable]:
+        """행마다 내용을 구별하는 값 (위치 순서)
+
+        다시 로드하기 전후에 값이 같은 행은 같은 행으로 보고 행 ID를 이어 줍니다.
+        """
+
+    def insert(self, key: str, value: str) -> bool:
+        """항목을 맨 뒤에 추가합니다."""
+
+    def insert_many(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """(키, 값)들을 맨 뒤에 추가하고 개수를 반환합니다.
+
+        디스크에는 아직 기록하지 않으므로, 다 추가한 뒤 save()로 한 번에
+        저장합니다.
+        """
+
+    def update(self, index: int, key: str, value: str) -> bool:
+        """index 위치의 항목을 바꿉니다."""
+
+    def delete(self, index: int) -> bool:
+        """index 위치의 항목을 삭제합니다."""
+
+    def clear(self) -> bool:
+        """모든 항목을 삭제합니다."""
+
+    def get_setting(self, name: str, default: Any = None) -> Any:
+        """설정 값 (font_size 등)"""
+
+    def set_setting(self, name: str, value: Any) -> bool:
+        """설정 값을 저장합니다."""
+
+    def save(self) -> bool:
+        """현재 상태 전체를 저장합니다."""
+
+    def begin_batch(self) -> None:
+        """변경을 메모리에만 적용하고 기록은 commit_batch()까지 미룹니다."""
+
+    def commit_batch(self) -> bool:
+        """배치의 변경을 한 번에 기록합니다. 실패하면 배치 전 상태로 되돌립니다."""
+
+    def rollback_batch(self) -> None:
+        """배치의 변경을 버리고 배치 전 상태로 되돌립니다."""
+
+    def has_external_change(self) -> bool:
+        """다른 프로세스가 저장소를 바꿨는지 확인합니다."""
+
+    def lock(self) -> ContextManager:
+        """공유 저장소면 다른 프로세스와의 배타적 잠금 (아니면 아무것도 안 함)"""
+
+    def is_idle(self) -> bool:
+        """아직 기록되지 않은 변경이 없는지 반환합니다."""
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """예약된 쓰기를 모두 마칠 때까지 기다립니다."""
+
+    def close(self) -> None:
+        """남은 쓰기를 마치고 자원을 해제합니다."""
+
+
+@runtime_checkable
+class ChangeFeed(Protocol):
+    """다른 인스턴스의 변경을 레코드 단위로 읽어 적용할 수 있는 백엔드
+
+    저널을 쓰는 JSON 백엔드만 제공합니다. 이 기능이 없는 백엔드(SQLite)는
+    DataManager가 has_external_change()로 확인한 뒤 전체를 다시 읽습니다.
+    """
+
+    def read_external_changes(self) -> Optional[List[JournalRecord]]:
+        """다른 인스턴스가 기록한 변경들 (None이면 전체를 다시 읽어야 함)"""
+
+    def apply_external(self, record: JournalRecord) -> ExternalChange:
+        """read_external_changes()의 레코드 하나를 메모리에만 적용합니다."""
+
+
+class JsonStorageBackend:
+    """JSON 파일 백엔드
+
+    전체 데이터를 메모리에 두고, 스냅샷 모드에서는 변경마다 파일 전체를,
+    저널 모드에서는 저널에 레코드 한 줄만 기록합니다. 저널이 커지면 스냅샷으로
+    압축합니다. write_behind를 켜면 모든 디스크 쓰기를 백그라운드 스레드가
+    모아서 처리합니다.
+
+    항목은 메모리에서 (키, 값) 튜플(items.StoredItem)로 보관하고, 파일에는
+    기존 JSON 모양으로 기록합니다. BLOB_THRESHOLD 이상인 큰 값은 옆의 blob
+    파일에 저장하고 항목에는 {"key", "blob": [오프셋, 길이]}만 남겨, 필요할 때
+    mmap으로 읽습니다.
+    읽은 값은 value_cache_bytes 예산의 LRU 캐시에 보관합니다.
+
+    색인(indexed) 모드는 저널 모드와 같이 기록하되 모든 값을 blob 파일(값
+    영역)에 두므로, JSON 파일과 메모리에는 키와 오프셋만 남습니다.
+
+    shared=True면 여러 인스턴스가 같은 파일을 쓰는 것으로 보고, 로드, 저널
+    기록, 압축을 저장소 잠금(.lock) 안에서 바로 수행합니다 (write_behind는
+    쓰지 않음). 저널이 곧 변경 피드이므로, 다른 인스턴스는 저널 크기로 변경을
+    알아채고 늘어난 레코드만 읽어 적용합니다.
+
+    read_only=True면 파일을 고치지 않고 읽기만 합니다. 잘린 저널 끝을 자르거나
+    저널/blob 파일을 압축하지 않고, 변경은 메모리에만 적용한 뒤 실패를 반환합니다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        storage_mode: str = STORAGE_MODE_SNAPSHOT,
+        write_behind: bool = False,
+        value_cache_bytes: int = VALUE_CACHE_BYTES,
+        shared: bool = False,
+        read_only: bool = False,
+    ):
+        if storage_mode not in (
+            STORAGE_MODE_SNAPSHOT,
+            STORAGE_MODE_JOURNAL,
+            STORAGE_MODE_INDEXED,
+        ):
+            raise ValueError(f"지원하지 않는 저장 방식: {storage_mode}")
+        if shared and storage_mode == STORAGE_MODE_SNAPSHOT:
+            raise ValueError("공유 저장소는 저널 또는 색인 저장 방식이 필요합니다.")
+        self.path = path
+        self.storage_mode = storage_mode
+        self.shared = shared
+        self.read_only = read_only
+        self._store_lock = StoreLock(path + STORE_LOCK_SUFFIX) if shared else None
+        self.journal: Optional[Journal] = None
+        if storage_mode in (STORAGE_MODE_JOURNAL, STORAGE_MODE_INDEXED):
+            self.journal = Journal(path + JOURNAL_SUFFIX, shared)
+        self._indexed = storage_mode == STORAGE_MODE_INDEXED
+        self.blob_threshold = 0 if self._indexed else BLOB_THRESHOLD
+        self.data: Dict[str, Any] = copy.deepcopy(DEFAULT_INIT_DATA)
+        self._compact_lock = threading.Lock()
+        # 마지막으로 읽거나 쓴 디스크 상태 (외부 변경 감지용)
+        self._disk_signature: Optional[FileSignature] = None
+        self._disk_hash: Optional[str] = None
+        # 백그라운드 저장 (write-behind), 첫 로드가 끝난 뒤 시작
+        self._write_behind = write_behind and not shared and not read_only
+        self._saver: Optional[WriteBehindSaver] = None
+        self._pending_records: List[JournalRecord] = []
+        # 메모리 변경과 그 레코드 예약을 함께 묶음. 압축은 이 잠금 안에서
+        # 스냅샷을 뜨므로, 스냅샷에 반영된 변경의 레코드는 모두 예약되어 있음
+        self._pending_lock = threading.RLock()
+        self._compact_requested = False
+        self.blobs: Optional[BlobStore] = None
+        self.value_cache = ValueCache(value_cache_bytes)
+        self._loaded = False
+        # 배치 중에 모은 레코드와 되돌릴 상태 (배치 중이 아니면 None)
+        self._batch_records: Optional[List[JournalRecord]] = None
+        self._batch_backup: Optional[Dict[str, Any]] = None
+        self._batch_save = False
+
+    def load(self) -> None:
+        """JSON 파일에서 데이터를 로드합니다. 없으면 자동 생성.
+
+        저널 모드에서는 스냅샷 위에 저널 레코드를 다시 적용합니다. 스냅샷
+        모드로 저널이 있는 저장소를 열면, 저널의 변경을 잃거나 나중에 스냅샷
+        위에 다시 적용하게 되므로 ValueError를 발생시킵니다.
+        """
+        if self.journal is None and os.path.exists(self.path + JOURNAL_SUFFIX):
+            raise ValueError(
+                f"저널이 있는 저장소는 저널 방식으로 열어야 합니다: {self.path}"
+            )
+        with self.lock():
+            data = self._load_snapshot()
+            if self.journal is not None:
+                data = self._replay_journal(data)
+            self.data = data
+            self._open_blobs()
+            self.value_cache.clear()
+            if not self._loaded and not self.read_only:
+                self._loaded = True
+                if self._indexed:
+                    self._move_values_out_of_line()
+                self._maybe_compact_blobs()
+        if self._write_behind and self._saver is None:
+            self._saver = WriteBehindSaver(self._write_pending)
+
+    def _load_snapshot(self) -> Dict[str, Any]:
+        """스냅샷(JSON 파일)을 로드합니다."""
+        if not os.path.exists(self.path):
+            # 파일이 없으면 기본 데이터로 생성
+            self.data = copy.deepcopy(DEFAULT_INIT_DATA)
+            if self.journal is None and not self.read_only:
+                self.save()
+            return self.data
+        try:
+            with open(self.path, "rb") as f:
+                raw = f.read()
+            self._remember_disk_state(raw)
+            loaded_data = json.loads(raw.decode("utf-8"), object_hook=item_object_hook)
+            # 데이터 구조 검증 및 보정
+            if not isinstance(loaded_data, dict):
+                print(f"잘못된 데이터 구조: {self.path}")
+                return copy.deepcopy(DEFAULT_INIT_DATA)
+            if "list" not in loaded_data:
+                loaded_data["list"] = []
+            if "font_size" not in loaded_data:
+                loaded_data["font_size"] = DEFAULT_FONT_SIZE_VALUE
+            return loaded_data
+        except json.JSONDecodeError as e:
+            print(f"JSON 파싱 오류: {e}")
+            return copy.deepcopy(DEFAULT_INIT_DATA)
+        except Exception as e:
+            print(f"데이터 로드 중 오류 발생: {e}")
+            return copy.deepcopy(DEFAULT_INIT_DATA)
+
+    def _replay_journal(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """스냅샷 이후의 저널 레코드를 순서대로 적용합니다."""
+        generation = data.pop(JOURNAL_GENERATION_KEY, 0)
+        try:
+            if self.read_only:
+                records = self.journal.read(generation)
+            else:
+                records = self.journal.load(generation)
+        except Exception as e:
+            print(f"저널 로드 중 오류 발생: {e}")
+            return data
+        for record in records:
+            try:
+                apply_record(data, record)
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                print(f"저널 레코드 적용 중 오류 발생: {e}")
+        return data
+
+    def _blob_path(self, generation: int) -> str:
+        suffix = f"{BLOB_SUFFIX}.{generation}" if generation else BLOB_SUFFIX
+        return self.path + suffix
+
+    def _open_blobs(self) -> None:
+        """데이터에 기록된 세대의 blob 파일을 엽니다 (파일은 처음 쓸 때 생성)."""
+        path = self._blob_path(self.data.get(BLOB_GENERATION_KEY, 0))
+        if self.blobs is not None and self.blobs.path == path:
+            return
+        if self.blobs is not None:
+            self.blobs.close()
+        self.blobs = BlobStore(path, self.read_only)
+
+    def _move_values_out_of_line(self) -> None:
+        """색인 모드에서 아직 JSON에 들어 있는 값들을 값 영역으로 옮깁니다.
+
+        기존 data.json을 색인 모드로 처음 열 때 한 번만 일어납니다.
+        """
+        items = self.data["list"]
+        if all(item_blob(item) is not None for item in items):
+            return
+        self.data["list"] = [
+            item if item_blob(item) is not None else self._make_item(*item)
+            for item in items
+        ]
+        if not self.compact_journal():
+            # 디스크에는 그대로 값이 남아 있으므로 되돌림 (blob에 쓴 값은 버려짐)
+            self.data["list"] = items
+
+    def _sync_blobs(self) -> None:
+        """blob 참조를 디스크에 기록하기 전에 blob 파일을 먼저 fsync합니다."""
+        if self.blobs is not None:
+            self.blobs.sync()
+
+    def _maybe_compact_blobs(self) -> None:
+        """삭제되거나 바뀐 값이 차지하던 공간이 많으면 살아 있는 값만
+        다음 세대의 blob 파일로 옮깁니다.
+
+        새 세대를 가리키는 스냅샷이 기록된 뒤에만 이전 파일을 지우므로,
+        도중에 종료되어도 이전 스냅샷과 blob 파일은 그대로 남습니다.
+        """
+        try:
+            file_size = os.path.getsize(self.blobs.path)
+        except OSError:
+            return
+        items = self.data["list"]
+        refs = [item[1] for item in items if item_blob(item) is not None]
+        live_size = sum(length for _, length in refs)
+        dead_size = file_size - live_size
+        if dead_size < BLOB_COMPACT_MIN_BYTES or dead_size < live_size * BLOB_COMPACT_RATIO:
+            return
+
+        old_blobs = self.blobs
+        old_generation = self.data.get(BLOB_GENERATION_KEY, 0)
+        generation = old_generation + 1
+        try:
+            new_blobs, new_refs = old_blobs.rewrite(self._blob_path(generation), refs)
+        except Exception as e:
+            print(f"blob 파일 정리 중 오류 발생: {e}")
+            return
+        moved = iter(new_refs)
+        self.data["list"] = [
+            make_blob_item(item[0], next(moved)) if item_blob(item) is not None else item
+            for item in items
+        ]
+        self.data[BLOB_GENERATION_KEY] = generation
+        self.blobs = new_blobs
+        self.value_cache.clear()
+
+        if self.journal is not None:
+            saved = self.compact_journal()
+        else:
+            saved = self._write_snapshot()
+        if not saved:
+            # 디스크의 스냅샷은 여전히 이전 세대를 가리키므로 되돌림
+            self.data["list"] = items
+            self.data[BLOB_GENERATION_KEY] = old_generation
+            self.blobs = old_blobs
+            new_blobs.close()
+            return
+        old_blobs.close()
+        try:
+            os.remove(old_blobs.path)
+        except OSError:
+            pass
+
+    def _make_item(self, key: str, value: str) -> StoredItem:
+        """저장할 항목을 만듭니다. 큰 값은 blob 파일에 쓰고 참조만 남깁니다."""
+        # 한 글자는 최대 4바이트이므로 짧은 값은 인코딩 없이 바로 통과
+        if len(value) * 4 >= self.blob_threshold:
+            raw = value.encode("utf-8")
+            if len(raw) >= self.blob_threshold:
+                return make_blob_item(key, self.blobs.put(raw))
+        return make_item(key, value)
+
+    def _read_blob(self, ref: BlobRef) -> str:
+        """blob 값을 캐시에서 찾고, 없으면 파일에서 읽어 캐시에 넣습니다."""
+        value = self.value_cache.get(ref)
+        if value is None:
+            value = self.blobs.get(ref)
+            self.value_cache.put(ref, value)
+        return value
+
+    def _value(self, item: StoredItem) -> str:
+        """항목의 값 전체 (blob 참조면 읽어 옴)"""
+        key, value = item
+        if type(value) is tuple:
+            return self._read_blob(value)
+        return value
+
+    def _resolve(self, item: StoredItem) -> Item:
+        """blob 참조를 실제 값으로 바꾼 항목"""
+        return {"key": item[0], "value": self._value(item)}
+
+    def count(self) -> int:
+        return len(self.data["list"])
+
+    def get(self, index: int) -> Item:
+        return self._resolve(self.data["list"][index])
+
+    def get_value(self, index: int) -> str:
+        return self._value(self.data["list"][index])
+
+    def get_range(self, start: int, count: int) -> List[Item]:
+        return [self._resolve(item) for item in self.data["list"][start : start + count]]
+
+    def get_previews(self, start: int, count: int, length: int) -> List[Item]:
+        # 색인을 만들 때 전체 항목을 순회하는 경로이므로 메서드 호출 없이 바로 만듦
+        blobs = self.blobs
+        return [
+            {
+                "key": key,
+                "value": (
+                    blobs.preview(value, length)
+                    if type(value) is tuple
+                    else value[:length]
+                ),
+            }
+            for key, value in self.data["list"][start : start + count]
+        ]
+
+    def items(self) -> List[Item]:
+        return [self._resolve(item) for item in self.data["list"]]
+
+    def row_identities(self) -> List[Hashable]:
+        # 항목은 바뀌지 않는 (키, 값|blob 참조) 튜플이므로 그대로 사용
+        return list(self.data["list"])
+
+    def insert(self, key: str, value: str) -> bool:
+        item = self._make_item(key, value)
+        with self._pending_lock:
+            self.data["list"].append(item)
+            return self._persist({"op": JOURNAL_OP_ADD, **item_to_json(item)})
+
+    def insert_many(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        items = self.data["list"]
+        count = len(items)
+        make_item = self._make_item
+        items.extend(make_item(key, value) for key, value in pairs)
+        return len(items) - count
+
+    def update(self, index: int, key: str, value: str) -> bool:
+        item = self._make_item(key, value)
+        with self._pending_lock:
+            self.data["list"][index] = item
+            return self._persist(
+                {"op": JOURNAL_OP_UPDATE, "index": index, **item_to_json(item)}
+            )
+
+    def delete(self, index: int) -> bool:
+        with self._pending_lock:
+            del self.data["list"][index]
+            return self._persist({"op": JOURNAL_OP_DELETE, "index": index})
+
+    def clear(self) -> bool:
+        with self._pending_lock:
+            self.data["list"] = []
+            return self._persist({"op": JOURNAL_OP_CLEAR})
+
+    def get_setting(self, name: str, default: Any = None) -> Any:
+        return self.data.get(name, default)
+
+    def set_setting(self, name: str, value: Any) -> bool:
+        with self._pending_lock:
+            self.data[name] = value
+            return self._persist(
+                {"op": JOURNAL_OP_SETTING, "name": name, "value": value}
+            )
+
+    def _persist(self, record: JournalRecord) -> bool:
+        """변경 사항 하나를 저장합니다.
+
+        저널 모드에서는 레코드 한 줄만 추가하고, 아니면 전체 파일을 저장합니다.
+        백그라운드 저장을 쓰면 기록을 예약만 하고 바로 반환합니다.
+        배치 중에는 레코드를 모아 두기만 합니다.
+        """
+        if self.read_only:
+            print(f"읽기 전용으로 연 저장소입니다: {self.path}")
+            return False
+        if self._batch_records is not None:
+            self._batch_records.append(record)
+            return True
+        if self._saver is not None:
+            if self.journal is not None:
+                with self._pending_lock:
+                    self._pending_records.append(record)
+            self._saver.mark_dirty()
+            return True
+        if self.journal is None:
+            return self._write_snapshot()
+        try:
+            self._append_journal([record])
+        except Exception as e:
+            print(f"저널 기록 중 오류 발생: {e}")
+            return False
+        self._maybe_compact(background=True)
+        return True
+
+    def _write_pending(self) -> None:
+        """백그라운드 저장 스레드에서 모인 변경을 한 번에 기록합니다."""
+        if self.journal is None:
+            self._write_snapshot()
+            return
+        with self._pending_lock:
+            records, self._pending_records = self._pending_records, []
+        if records:
+            self._append_journal(records)
+        if self._compact_requested:
+            self._compact_requested = False
+            self.compact_journal()
+        else:
+            self._maybe_compact(background=False)
+
+    def _append_journal(self, records: List[JournalRecord]) -> None:
+        """blob 파일을 먼저 fsync한 뒤 저널에 레코드들을 추가합니다."""
+        with span("storage.journal_append") as s:
+            self._sync_blobs()
+            written = self.journal.append(records)
+            s.add_bytes(written)
+
+    def _maybe_compact(self, background: bool) -> None:
+        """저널이 임계치를 넘으면 압축합니다."""
+        journal_size = self.journal.size()
+        if journal_size < JOURNAL_COMPACT_MIN_BYTES:
+            return
+        snapshot_size = self._disk_signature[1] if self._disk_signature else 0
+        if journal_size >= snapshot_size * JOURNAL_COMPACT_RATIO:
+            self.compact_journal(background=background)
+
+    def compact_journal(self, background: bool = False) -> bool:
+        """저널을 새 스냅샷으로 합칩니다.
+
+        현재 저널을 다음 세대로 교체한 뒤 그 시점의 상태를 스냅샷으로 씁니다.
+        background=True면 이미 압축 중일 때 건너뛰고, 쓰기는 별도 스레드에서
+        수행합니다. 그동안의 변경은 새 저널에 계속 기록됩니다. 아직 기록하지
+        않은 예약 레코드는 스냅샷에 이미 반영되어 있으므로 버립니다.
+
+        공유 저장소에서는 다른 인스턴스가 .compacting 파일을 건드리지 않도록
+        잠금을 건 채로 끝까지 기록합니다.
+        """
+        if self.shared:
+            background = False
+        with self.lock():
+            if not self._compact_lock.acquire(blocking=not background):
+                return False
+            try:
+                with self._pending_lock:
+                    generation = self.journal.generation + 1
+                    self.journal.rotate(generation)
+                    snapshot = self._snapshot()
+                    self._pending_records = []
+                snapshot[JOURNAL_GENERATION_KEY] = generation
+            except Exception as e:
+                self._compact_lock.release()
+                print(f"저널 압축 준비 중 오류 발생: {e}")
+                return False
+
+            if background:
+                threading.Thread(
+                    target=self._write_compacted_snapshot,
+                    args=(snapshot,),
+                    daemon=True,
+                ).start()
+                return True
+            return self._write_compacted_snapshot(snapshot)
+
+    def _write_compacted_snapshot(self, snapshot: Dict[str, Any]) -> bool:
+        """압축된 스냅샷을 임시 파일에 쓴 뒤 원자적으로 교체합니다."""
+        try:
+            self._replace_snapshot(self._dumps(snapshot))
+            self.journal.discard_compacting()
+            return True
+        except Exception as e:
+            print(f"저널 압축 중 오류 발생: {e}")
+            return False
+        finally:
+            self._compact_lock.release()
+
+    def save(self) -> bool:
+        """데이터를 JSON 파일에 저장합니다.
+
+        저널 모드에서는 저널을 스냅샷으로 압축합니다. 백그라운드 저장을 쓰면
+        예약만 하고 바로 반환하므로, 기록 완료가 필요하면 flush()를 호출합니다.
+        배치 중에는 commit_batch()에서 저장하도록 표시만 합니다.
+        """
+        if self.read_only:
+            print(f"읽기 전용으로 연 저장소입니다: {self.path}")
+            return False
+        if self._batch_records is not None:
+            self._batch_save = True
+            return True
+        if self._saver is not None:
+            if self.journal is not None:
+                self._compact_requested = True
+            self._saver.mark_dirty()
+            return True
+        if self.journal is not None:
+            return self.compact_journal()
+        return self._write_snapshot()
+
+    def begin_batch(self) -> None:
+        """배치를 시작합니다.
+
+        되돌릴 때 쓸 얕은 복사본(항목 튜플은 공유)을 만들어 두고, 이후 변경의
+        레코드는 디스크에 쓰지 않고 모읍니다. 예약된 백그라운드 쓰기가 배치
+        도중의 상태를 기록하지 않도록 먼저 끝냅니다.
+        """
+        if self._saver is not None:
+            self._saver.flush()
+        self._batch_backup = self._snapshot()
+        self._batch_records = []
+        self._batch_save = False
+
+    def commit_batch(self) -> bool:
+        """모은 변경을 한 번에 기록합니다.
+
+        저널 모드에서는 레코드들을 batch 레코드 한 줄로 묶어 추가하므로,
+        기록 도중 종료되어도 잘린 줄과 함께 배치 전체가 버려집니다. 스냅샷
+        모드나 배치 안에서 save()가 호출된 경우에는 전체를 한 번 저장합니다.
+        실패하면 메모리도 배치 전 상태로 되돌립니다.
+        """
+        records, self._batch_records = self._batch_records, None
+        backup, self._batch_backup = self._batch_backup, None
+        save_requested, self._batch_save = self._batch_save, False
+        if save_requested or (records and self.journal is None):
+            success = self.save()
+        elif len(records) > 1:
+            success = self._persist({"op": JOURNAL_OP_BATCH, "records": records})
+        elif records:
+            success = self._persist(records[0])
+        else:
+            success = True
+        if not success:
+            self.data = backup
+        return success
+
+    def rollback_batch(self) -> None:
+        """모은 레코드를 버리고 배치 전 상태로 되돌립니다.
+
+        배치 중 blob 파일에 쓴 값은 참조만 사라지며, blob 압축 때 정리됩니다.
+        """
+        if self._batch_backup is not None:
+            self.data = self._batch_backup
+        self._batch_records = None
+        self._batch_backup = None
+        self._batch_save = False
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """저장용 얕은 복사본을 만듭니다.
+
+        list()/dict() 복사는 GIL 아래에서 한 번에 이뤄지므로 저장 스레드에서도
+        일관된 스냅샷을 얻을 수 있습니다 (항목 튜플은 교체만 되고 수정되지 않음).
+        """
+        snapshot = dict(self.data)
+        snapshot["list"] = list(snapshot["list"])
+        return snapshot
+
+    def _write_snapshot(self) -> bool:
+        """현재 데이터 전체를 JSON 파일에 원자적으로 저장합니다."""
+        try:
+            self._replace_snapshot(self._dumps(self._snapshot()))
+            return True
+        except Exception as e:
+            print(f"데이터 저장 중 오류 발생: {e}")
+            return False
+
+    def _dumps(self, snapshot: Dict[str, Any]) -> bytes:
+        """스냅샷을 JSON 바이트로 만듭니다 (색인 모드는 공백 없이 작게)."""
+        return dumps_data(snapshot, pretty=not self._indexed).encode("utf-8")
+
+    def _replace_snapshot(self, raw: bytes) -> None:
+        """스냅샷 파일을 원자적으로 교체하고 디스크 상태를 기록합니다.
+
+        교체 직후 외부 변경 검사가 끼어들어도 자신의 쓰기로 인식하도록
+        해시를 먼저 기록합니다.
+        """
+        with span("storage.snapshot_write") as s:
+            self._sync_blobs()
+            self._disk_hash = _content_hash(raw)
+            atomic_write(self.path, raw)
+            self._disk_signature = _file_signature(self.path)
+            s.add_bytes(len(raw))
+
+    def _remember_disk_state(self, raw: bytes) -> None:
+        """방금 읽은 파일의 시그니처와 내용 해시를 기록합니다."""
+        self._disk_signature = _file_signature(self.path)
+        self._disk_hash = _content_hash(raw)
+
+    def has_external_change(self) -> bool:
+        """다른 프로세스가 파일을 바꿨는지 확인합니다.
+
+        mtime/size/inode가 같으면 바로 False를 반환하고, 다를 때만 파일을 읽어
+        내용 해시로 실제 변경인지 확인합니다.
+        """
+        if self.journal is not None and self.journal.has_external_change():
+            return True
+        signature = _file_signature(self.path)
+        if signature is None or signature == self._disk_signature:
+            # 파일이 없으면 다음 저장 때 다시 만들어지므로 변경으로 보지 않음
+            return False
+        try:
+            with open(self.path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            return False
+        if _content_hash(raw) == self._disk_hash:
+            # touch 등으로 메타데이터만 바뀐 경우
+            self._disk_signature = signature
+            return False
+        return True
+
+    def lock(self) -> ContextManager:
+        return self._store_lock if self._store_lock is not None else nullcontext()
+
+    def read_external_changes(self) -> Optional[List[JournalRecord]]:
+        """다른 인스턴스가 저널에 추가한 레코드들
+
+        스냅샷 모드에는 변경 피드가 없으므로 파일이 바뀌었으면 None입니다.
+        """
+        if self.journal is None:
+            return None if self.has_external_change() else []
+        return self.journal.read_new()
+
+    def apply_external(self, record: JournalRecord) -> ExternalChange:
+        items = self.data["list"]
+        op = record.get("op")
+        index = record.get("index", -1)
+        old_key = items[index][0] if op in (JOURNAL_OP_UPDATE, JOURNAL_OP_DELETE) else ""
+        apply_record(self.data, record)
+        if op == JOURNAL_OP_ADD:
+            return CHANGE_ADD, len(items) - 1, ""
+        if op == JOURNAL_OP_UPDATE:
+            return CHANGE_UPDATE, index, old_key
+        if op == JOURNAL_OP_DELETE:
+            return CHANGE_DELETE, index, old_key
+        if op in (JOURNAL_OP_CLEAR, JOURNAL_OP_BATCH):
+            return CHANGE_RESET, -1, ""
+        return None, -1, ""
+
+    def is_idle(self) -> bool:
+        return self._saver is None or self._saver.is_idle()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        if self._saver is None:
+            return True
+        return self._saver.flush(timeout)
+
+    def close(self) -> None:
+        if self._saver is not None:
+            self._saver.close()
+            self._saver = None
+        if self.blobs is not None:
+            self.blobs.close()
+        if self._store_lock is not None:
+            self._store_lock.close()
+
+
+class SqliteStorageBackend:
+    """SQLite 백엔드 (WAL 모드)
+
+    항목은 id 순서로 정렬되며, 변경마다 한 행짜리 트랜잭션을 실행합니다.
+    리스트 표시는 LIMIT/OFFSET으로 페이지 단위로 읽어 작은 캐시에 보관하므로
+    전체 항목을 파이썬 메모리에 올리지 않습니다. 페이지에는 값의 앞부분만
+    담고, 값 전체는 요청될 때 행 하나만 읽습니다.
+
+    SQLite가 커밋 단위로 잠그므로 여러 프로세스가 써도 파일은 안전하지만,
+    행 위치로 변경하기 전에 다른 프로세스의 변경을 반영해야 하므로 shared=True면
+    JSON 백엔드와 같은 저장소 잠금을 제공합니다. 변경 레코드(ChangeFeed)는
+    없으므로, PRAGMA data_version으로 다른 연결의 커밋을 알아채면 DataManager가
+    다시 로드합니다 (행 id와 페이지 캐시만 다시 읽음).
+
+    read_only=True면 데이터베이스를 읽기 전용(mode=ro)으로 열고 테이블도 만들지
+    않으므로, 쓰기는 SQLite 오류로 실패합니다.
+    """
+
+    def __init__(self, path: str, shared: bool = False, read_only: bool = False):
+        self.path = path
+        self.shared = shared
+        self.read_only = read_only
+        self._store_lock = StoreLock(path + STORE_LOCK_SUFFIX) if shared else None
+        self.conn: Optional[sqlite3.Connection] = None
+        # 위치 순서의 SQLite 행 id (위치로 변경할 때 페이지를 읽지 않아도 됨)
+        self._ids = array("q")
+        self._pages: "OrderedDict[int, List[Tuple[int, str, str]]]" = OrderedDict()
+        self._data_version: Optional[int] = None
+        # 배치 중이면 변경을 커밋하지 않고 트랜잭션을 열어 둠
+        self._in_batch = False
+
+    def load(self) -> None:
+        if self.conn is None and self.read_only:
+            uri = "file:" + pathname2url(os.path.abspath(self.path)) + "?mode=ro"
+            self.conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        elif self.conn is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            with self.conn:
+                self.conn.execute(
+                    "CREATE TABLE IF NOT EXISTS items ("
+                    "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                    "key TEXT NOT NULL, "
+                    "value TEXT NOT NULL)"
+                )
+                self.conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_items_key ON items(key)"
+                )
+                self.conn.execute(
+                    "CREATE TABLE IF NOT EXISTS settings ("
+                    "name TEXT PRIMARY KEY, value TEXT NOT NULL)"
+                )
+        self._reload_ids()
+        self._data_version = self._read_data_version()
+
+    def _reload_ids(self) -> None:
+        self._pages.clear()
+        rows = self.conn.execute("SELECT id FROM items ORDER BY id")
+        self._ids = array("q", (row[0] for row in rows))
+
+    def _read_data_version(self) -> int:
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _page(self, page: int) -> List[Tuple[int, str, str]]:
+        """page번째 페이지의 (id, key, 값 미리보기) 행들을 캐시에서 가져옵니다."""
+        rows = self._pages.get(page)
+        if rows is not None:
+            self._pages.move_to_end(page)
+            return rows
+        rows = self.conn.execute(
+            "SELECT id, key, substr(value, 1, ?) FROM items "
+            "ORDER BY id LIMIT ? OFFSET ?",
+            (VALUE_PREVIEW_LENGTH, SQLITE_PAGE_SIZE, page * SQLITE_PAGE_SIZE),
+        ).fetchall()
+        self._pages[page] = rows
+        if len(self._pages) > SQLITE_PAGE_CACHE_PAGES:
+            self._pages.popitem(last=False)
+        return rows
+
+    def _row(self, index: int) -> Tuple[int, str, str]:
+        page, offset = divmod(index, SQLITE_PAGE_SIZE)
+        return self._page(page)[offset]
+
+    def _invalidate_from(self, index: int) -> None:
+        """index 이후의 행이 바뀌었으므로 해당 페이지부터 캐시를 버립니다."""
+        first_page = index // SQLITE_PAGE_SIZE
+        for page in [p for p in self._pages if p >= first_page]:
+            del self._pages[page]
+
+    def count(self) -> int:
+        return len(self._ids)
+
+    def get(self, index: int) -> Item:
+        return {"key": self._row(index)[1], "value": self.get_value(index)}
+
+    def get_value(self, index: int) -> str:
+        return self.conn.execute(
+            "SELECT value FROM items WHERE id = ?", (self._ids[index],)
+        ).fetchone()[0]
+
+    def get_range(self, start: int, count: int) -> List[Item]:
+        rows = self.conn.execute(
+            "SELECT key, value FROM items ORDER BY id LIMIT ? OFFSET ?",
+            (count, start),
+        ).fetchall()
+        return [{"key": key, "value": value} for key, value in rows]
+
+    def get_previews(self, start: int, count: int, length: int) -> List[Item]:
+        if length <= VALUE_PREVIEW_LENGTH:
+            # 페이지 캐시에 있는 미리보기를 그대로 사용
+            end = min(start + count, len(self._ids))
+            return [
+                {"key": row[1], "value": row[2][:length]}
+                for row in (self._row(index) for index in range(start, end))
+            ]
+        rows = self.conn.execute(
+            "SELECT key, substr(value, 1, ?) FROM items ORDER BY id LIMIT ? OFFSET ?",
+            (length, count, start),
+        ).fetchall()
+        return [{"key": key, "value": value} for key, value in rows]
+
+    def items(self) -> List[Item]:
+        return self.get_range(0, len(self._ids))
+
+    def row_identities(self) -> List[Hashable]:
+        return list(self._ids)
+
+    def _execute(self, sql: str, params: Tuple = ()) -> Optional[sqlite3.Cursor]:
+        """SQL 하나를 실행합니다. 실패하면 None."""
+        try:
+            if self._in_batch:
+                # 커밋은 commit_batch()에서
+                return self.conn.execute(sql, params)
+            with self.conn:
+                cursor = self.conn.execute(sql, params)
+            self._data_version = self._read_data_version()
+            return cursor
+        except sqlite3.Error as e:
+            print(f"SQLite 쓰기 중 오류 발생: {e}")
+            return None
+
+    def insert(self, key: str, value: str) -> bool:
+        cursor = self._execute(
+            "INSERT INTO items (key, value) VALUES (?, ?)", (key, value)
+        )
+        if cursor is None:
+            return False
+        self._invalidate_from(len(self._ids))
+        self._ids.append(cursor.lastrowid)
+        return True
+
+    def insert_many(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        # 커밋하지 않고 트랜잭션을 열어 둔 채 추가 (같은 연결의 읽기에는 보임)
+        last_id = self._ids[-1] if self._ids else 0
+        cursor = self.conn.executemany(
+            "INSERT INTO items (key, value) VALUES (?, ?)", pairs
+        )
+        self._invalidate_from(len(self._ids))
+        self._ids.extend(
+            row[0]
+            for row in self.conn.execute(
+                "SELECT id FROM items WHERE id > ? ORDER BY id", (last_id,)
+            )
+        )
+        return cursor.rowcount
+
+    def update(self, index: int, key: str, value: str) -> bool:
+        cursor = self._execute(
+            "UPDATE items SET key = ?, value = ? WHERE id = ?",
+            (key, value, self._ids[index]),
+        )
+        if cursor is None:
+            return False
+        self._invalidate_from(index)
+        return True
+
+    def delete(self, index: int) -> bool:
+        cursor = self._execute("DELETE FROM items WHERE id = ?", (self._ids[index],))
+        if cursor is None:
+            return False
+        self._invalidate_from(index)
+        del self._ids[index]
+        return True
+
+    def clear(self) -> bool:
+        if self._execute("DELETE FROM items") is None:
+            return False
+        self._pages.clear()
+        self._ids = array("q")
+        return True
+
+    def get_setting(self, name: str, default: Any = None) -> Any:
+        row = self.conn.execute(
+            "SELECT value FROM settings WHERE name = ?", (name,)
+        ).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def set_setting(self, name: str, value: Any) -> bool:
+        cursor = self._execute(
+            "INSERT OR REPLACE INTO settings (name, value) VALUES (?, ?)",
+            (name, json.dumps(value, ensure_ascii=False)),
+        )
+        return cursor is not None
+
+    def save(self) -> bool:
+        # 변경마다 커밋되므로 insert_many()로 열어 둔 트랜잭션만 커밋
+        if self._in_batch:
+            return True
+        try:
+            self.conn.commit()
+        except sqlite3.Error as e:
+            print(f"SQLite 쓰기 중 오류 발생: {e}")
+            return False
+        self._data_version = self._read_data_version()
+        return True
+
+    def begin_batch(self) -> None:
+        self._in_batch = True
+
+    def commit_batch(self) -> bool:
+        """배치 동안 열어 둔 트랜잭션을 커밋합니다 (실패하면 롤백)."""
+        self._in_batch = False
+        if self.save():
+            return True
+        self.rollback_batch()
+        return False
+
+    def rollback_batch(self) -> None:
+        """트랜잭션을 롤백하고 행 id와 페이지 캐시를 다시 읽습니다."""
+        self._in_batch = False
+        try:
+            self.conn.rollback()
+        except sqlite3.Error as e:
+            print(f"SQLite 롤백 중 오류 발생: {e}")
+        self._reload_ids()
+
+    def has_external_change(self) -> bool:
+        """다른 연결이 커밋하면 PRAGMA data_version 값이 바뀝니다."""
+        return self._read_data_version() != self._data_version
+
+    def lock(self) -> ContextManager:
+        return self._store_lock if self._store_lock is not None else nullcontext()
+
+    def is_idle(self) -> bool:
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        return True
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        if self._store_lock is not None:
+            self._store_lock.close()
+
+
+def create_backend(
+    path: str,
+    storage_mode: str = STORAGE_MODE_SNAPSHOT,
+    write_behind: bool = False,
+    value_cache_bytes: int = VALUE_CACHE_BYTES,
+    shared: bool = False,
+    read_only: bool = False,
+) -> StorageBackend:
+    """경로와 저장 방식에 맞는 백엔드를 만듭니다.
+
+    SQLite 확장자(.db 등)를 가진 파일은 storage_mode와 관계없이 SQLite를 씁니다.
+    """
+    if storage_mode == STORAGE_MODE_SQLITE or path.lower().endswith(
+        SQLITE_FILE_EXTENSIONS
+    ):
+        return SqliteStorageBackend(path, shared, read_only)
+    return JsonStorageBackend(
+        path, storage_mode, write_behind, value_cache_bytes, shared, read_only
+    )
+
+
+def detect_storage_mode(path: str) -> str:
+    """설정 없이 저장소 파일만 보고 열 저장 방식을 정합니다.
+
+    SQLite 확장자나 SQLite 파일 머리글이면 SQLite, 저널(압축 중인 것 포함)이
+    있으면 저널, 아니면 스냅샷입니다. 색인 방식 저장소는 저널 방식과 같은
+    파일들(스냅샷, 저널, blob)로 이뤄지므로 읽을 때는 저널 방식으로 엽니다.
+    """
+    if path.lower().endswith(SQLITE_FILE_EXTENSIONS):
+        return STORAGE_MODE_SQLITE
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(SQLITE_FILE_HEADER)) == SQLITE_FILE_HEADER:
+                return STORAGE_MODE_SQLITE
+    except OSError:
+        pass
+    journal_path = path + JOURNAL_SUFFIX
+    if os.path.exists(journal_path) or os.path.exists(
+        journal_path + JOURNAL_COMPACTING_SUFFIX
+    ):
+        return STORAGE_MODE_JOURNAL
+    return STORAGE_MODE_SNAPSHOT
+
+
+def migrate_json_to_sqlite(json_file: str, db_file: str) -> int:
+    """data.json(및 저널)의 내용을 SQLite 데이터베이스로 옮깁니다.
+
+    옮긴 항목 수를 반환합니다. 대상 데이터베이스에 이미 항목이 있으면
+    ValueError를 발생시킵니다.
+    """
+    storage_mode = detect_storage_mode(json_file)
+    if storage_mode == STORAGE_MODE_SQLITE:
+        raise ValueError(f"이미 SQLite 데이터베이스입니다: {json_file}")
+    if not os.path.exists(json_file) and storage_mode == STORAGE_MODE_SNAPSHOT:
+        raise FileNotFoundError(json_file)
+    source = JsonStorageBackend(json_file, storage_mode, read_only=True)
+    source.load()
+
+    target = SqliteStorageBackend(db_file)
+    target.load()
+    try:
+        if target.count():
+            raise ValueError(f"이미 항목이 있는 데이터베이스입니다: {db_file}")
+        items = source.items()
+        with target.conn:
+            target.conn.executemany(
+                "INSERT INTO items (key, value) VALUES (?, ?)",
+                ((item["key"], item["value"]) for item in items),
+            )
+            for name, value in source.data.items():
+                if name not in ("list", JOURNAL_GENERATION_KEY, BLOB_GENERATION_KEY):
+                    target.conn.execute(
+                        "INSERT OR REPLACE INTO settings (name, value) VALUES (?, ?)",
+                        (name, json.dumps(value, ensure_ascii=False)),
+                    )
+        return len(items)
+    finally:
+        source.close()
+        target.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """저장소 관리 명령 (migrate)"""
+    parser = argparse.ArgumentParser(description="복붙 저장소 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    migrate = subparsers.add_parser("migrate", help="data.json을 SQLite로 옮깁니다")
+    migrate.add_argument("json_file")
+    migrate.add_argument("db_file")
+    args = parser.parse_args(argv)
+
+    if args.command == "migrate":
+        try:
+            count = migrate_json_to_sqlite(args.json_file, args.db_file)
+        except Exception as e:
+            print(f"마이그레이션 중 오류 발생: {e}")
+            return 1
+        print(f"{count}개 항목을 옮겼습니다: {args.db_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
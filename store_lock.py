@@ -0,0 +1,83 @@
+"""
+여러 인스턴스가 같은 저장소를 쓸 때의 파일 잠금을 담당하는 모듈입니다.
+저장소 옆의 .lock 파일에 advisory 잠금(POSIX는 flock, Windows는
+msvcrt.locking)을 걸어 변경이 한 번에 한 프로세스에서만 일어나게 합니다.
+"""
+
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class StoreLock:
+    """저장소 잠금 파일에 거는 배타적 잠금
+
+    같은 스레드에서 다시 획득할 수 있으며(변경 중 압축 등), 가장 바깥의
+    획득과 해제에서만 파일 잠금을 걸고 풉니다. 잠금 파일은 처음 획득할 때
+    열어 닫을 때까지 유지합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._depth = 0
+        self._thread_lock = threading.RLock()
+
+    def acquire(self) -> None:
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._lock_file()
+            except BaseException:
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self._unlock_file()
+        self._thread_lock.release()
+
+    def __enter__(self) -> "StoreLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+    def _lock_file(self) -> None:
+        if self._file is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        else:
+            # 첫 바이트를 잠금 (LK_LOCK은 1초씩 10번 재시도 후 실패하므로 반복)
+            self._file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+
+    def _unlock_file(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def close(self) -> None:
+        """잠금 파일을 닫습니다 (잠겨 있으면 함께 풀림)."""
+        with self._thread_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
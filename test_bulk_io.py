@@ -0,0 +1,139 @@
+"""
+대량 가져오기 테스트입니다.
+잘못된 줄은 건너뛰고 기록하는지, 도중에 실패하면 일부만 가져온 상태를
+저장하지 않고 가져오기 전으로 되돌리는지 저장 방식별로 확인합니다.
+
+    python -m unittest test_bulk_io
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+from bulk_io import import_file
+from data_manager import DataManager
+from constants import STORAGE_MODE_JOURNAL, STORAGE_MODE_SNAPSHOT, STORAGE_MODE_SQLITE
+
+# (파일 이름, 저장 방식)
+BACKENDS = [
+    ("data.json", STORAGE_MODE_SNAPSHOT),
+    ("data.json", STORAGE_MODE_JOURNAL),
+    ("data.db", STORAGE_MODE_SQLITE),
+]
+
+
+class ImportTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write(self, name, text):
+        path = os.path.join(self.directory, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def open(self, file_name=None, storage_mode=STORAGE_MODE_JOURNAL, **kwargs):
+        path = os.path.join(self.directory, file_name or "data.json")
+        data_manager = DataManager(path, storage_mode, **kwargs)
+        self.addCleanup(data_manager.close)
+        return data_manager
+
+    def test_invalid_lines_are_skipped(self):
+        path = self.write(
+            "items.jsonl",
+            '{"key": "k0", "value": "v0"}\n'
+            "not json\n"
+            "[1, 2]\n"
+            '{"key": "k1", "value": 1}\n'
+            '{"key": " ", "value": ""}\n'
+            '{"key": "k2", "value": "v2"}\n',
+        )
+        data_manager = self.open()
+        result = import_file(data_manager, path)
+        self.assertTrue(result.saved)
+        self.assertEqual((result.imported, result.skipped), (2, 4))
+        self.assertEqual(
+            [error.split(":")[0] for error in result.errors],
+            ["2번째 줄", "3번째 줄", "4번째 줄", "5번째 줄"],
+        )
+        self.assertEqual(data_manager.get_keys(), ["k0", "k2"])
+
+    def test_csv_header_and_wrong_columns(self):
+        path = self.write("items.csv", 'key,value\nk0,v0\nk1\n"k2","a,b"\n')
+        data_manager = self.open()
+        result = import_file(data_manager, path)
+        self.assertEqual((result.imported, result.skipped), (2, 1))
+        self.assertEqual(data_manager.get_value(1), "a,b")
+
+    def test_unreadable_file_changes_nothing(self):
+        path = os.path.join(self.directory, "items.csv")
+        with open(path, "wb") as f:
+            f.write(b"k0,v0\n\xff\xfe,broken\n")
+        data_manager = self.open()
+        data_manager.add_item("old", "old")
+        with self.assertRaises(ValueError):
+            import_file(data_manager, path)
+        self.assertEqual(data_manager.get_keys(), ["old"])
+        self.assertFalse(data_manager.importing)
+
+    def test_duplicates_with_unique_keys(self):
+        path = self.write("items.tsv", "k0\tv0\nk1\tv1\nk1\tagain\n")
+        data_manager = self.open(unique_keys=True)
+        data_manager.add_item("k0", "old")
+        result = import_file(data_manager, path)
+        self.assertEqual((result.imported, result.duplicates), (1, 2))
+        self.assertEqual(data_manager.get_keys(), ["k0", "k1"])
+
+    def test_failed_chunk_rolls_back(self):
+        path = self.write(
+            "items.csv", "".join(f"new{number},v\n" for number in range(5))
+        )
+        for file_name, storage_mode in BACKENDS:
+            with self.subTest(storage_mode=storage_mode):
+                name = f"{storage_mode}-{file_name}"
+                data_manager = self.open(name, storage_mode)
+                data_manager.add_item("old", "old")
+                backend = data_manager.backend
+                insert_many = backend.insert_many
+                calls = []
+
+                def fail_second_chunk(pairs):
+                    calls.append(True)
+                    if len(calls) == 2:
+                        raise OSError("디스크 오류")
+                    return insert_many(pairs)
+
+                backend.insert_many = fail_second_chunk
+                with mock.patch("bulk_io.BULK_CHUNK_SIZE", 2):
+                    with self.assertRaises(OSError):
+                        import_file(data_manager, path)
+                backend.insert_many = insert_many
+                self.assertEqual(len(calls), 2)
+                self.assertFalse(data_manager.importing)
+                self.assertEqual(data_manager.get_keys(), ["old"])
+                # 되돌린 뒤에도 행 위치로 한 변경이 그대로 동작함
+                self.assertTrue(data_manager.update_item(0, "old", "edited"))
+                data_manager.close()
+                reopened = self.open(name, storage_mode)
+                self.assertEqual(
+                    reopened.get_items(), [{"key": "old", "value": "edited"}]
+                )
+
+    def test_failed_save_rolls_back(self):
+        path = self.write("items.csv", "k0,v0\nk1,v1\n")
+        data_manager = self.open(storage_mode=STORAGE_MODE_SNAPSHOT)
+        data_manager.add_item("old", "old")
+        with mock.patch.object(
+            data_manager.backend, "_write_snapshot", return_value=False
+        ):
+            result = import_file(data_manager, path)
+        self.assertFalse(result.saved)
+        self.assertEqual(data_manager.get_keys(), ["old"])
+        self.assertEqual(data_manager.add_items([("k2", "v2")]), 1)
+        self.assertEqual(data_manager.get_keys(), ["old", "k2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
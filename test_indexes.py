@@ -0,0 +1,182 @@
+"""
+항목 인덱스 테스트입니다.
+검색 색인이 글자를 이어 입력할 때 이전 결과 안에서 좁혀 나가면서도, 항목이
+바뀐 뒤에는 이전 결과에 기대지 않고 올바른 행을 찾는지 확인합니다. 행 ID
+매핑은 삭제 뒤와 다시 로드한 뒤에도 같은 행을 가리키는지, 키 색인은 중복
+키를 찾고 unique_keys 저장소에서 겹치는 키를 거부하는지 확인합니다.
+
+    python -m unittest test_indexes
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+from data_manager import DataManager
+from indexes import KeyIndex, RowIdMap, SearchIndex
+from constants import STORAGE_MODE_SNAPSHOT
+
+
+class RowIdMapTest(unittest.TestCase):
+    def test_positions_follow_removals(self):
+        row_ids = RowIdMap()
+        row_ids.reset(4)
+        first, second, third, fourth = row_ids.ids
+        self.assertEqual(row_ids.remove(1), second)
+        self.assertEqual(row_ids.position(fourth), 2)
+        self.assertIsNone(row_ids.position(second))
+        fifth = row_ids.append()
+        self.assertEqual(row_ids.positions([fifth, first, third]), [3, 0, 1])
+
+    def test_reset_gives_new_ids(self):
+        row_ids = RowIdMap()
+        row_ids.reset(2)
+        old_ids = list(row_ids.ids)
+        row_ids.reset(3)
+        self.assertEqual(row_ids.ids, [2, 3, 4])
+        # reset()은 이전 ID를 이어 주지 않음
+        self.assertEqual([row_ids.position(row_id) for row_id in old_ids], [None, None])
+
+    def test_reset_matching_keeps_unchanged_rows(self):
+        row_ids = RowIdMap()
+        old = ["a", "b", "c", "d", "e"]
+        row_ids.reset(len(old))
+        old_ids = list(row_ids.ids)
+        # 앞쪽 삽입, 가운데 삭제와 수정, 뒤쪽 추가
+        new = ["x", "a", "b", "d2", "e", "f"]
+        row_ids.reset_matching(old, new)
+        self.assertEqual(
+            [row_ids.position(row_id) for row_id in old_ids], [1, 2, None, None, 4]
+        )
+        self.assertEqual(row_ids.position(row_ids.id_at(0)), 0)
+
+    def test_reset_matching_duplicates_keep_order(self):
+        row_ids = RowIdMap()
+        old = ["a", "b", "a", "c"]
+        row_ids.reset(len(old))
+        old_ids = list(row_ids.ids)
+        # 같은 내용의 행은 앞에서부터 차례로 짝지음
+        row_ids.reset_matching(old, ["a", "a", "c"])
+        positions = [row_ids.position(row_id) for row_id in old_ids]
+        self.assertEqual(positions, [0, None, 1, 2])
+        # 순서가 뒤바뀐 행은 짝짓지 않음 (이전 ID의 순서를 유지)
+        old_ids = list(row_ids.ids)
+        row_ids.reset_matching(["a", "a", "c"], ["c", "a", "a"])
+        positions = [row_ids.position(row_id) for row_id in old_ids]
+        self.assertEqual(positions, [None, None, 0])
+
+    def test_reset_matching_then_removal(self):
+        row_ids = RowIdMap()
+        row_ids.reset(3)
+        old_ids = list(row_ids.ids)
+        row_ids.reset_matching(["a", "b", "c"], ["a", "b", "c"])
+        row_ids.remove(0)
+        self.assertEqual(
+            [row_ids.position(row_id) for row_id in old_ids], [None, 0, 1]
+        )
+
+
+class SearchIndexTest(unittest.TestCase):
+    def build(self, pairs):
+        row_ids = RowIdMap()
+        row_ids.reset(len(pairs))
+        index = SearchIndex(row_ids)
+        index.rebuild(
+            (row_id, key, value) for row_id, (key, value) in zip(row_ids.ids, pairs)
+        )
+        return row_ids, index
+
+    def test_prefix_words_match_keys_and_values(self):
+        _, index = self.build(
+            [("Hello world", "인사"), ("hello_there", "bye"), ("other", "HELP me")]
+        )
+        self.assertEqual(index.search("hel"), [0, 1, 2])
+        self.assertEqual(index.search("hel wor"), [0])
+        self.assertEqual(index.search("there hello"), [1])
+        self.assertEqual(index.search("인사"), [0])
+        self.assertEqual(index.search("xyz"), [])
+        self.assertEqual(index.search("  "), [])
+
+    def test_typing_narrows_previous_result(self):
+        _, index = self.build(
+            [("apple", ""), ("apricot", ""), ("banana", ""), ("applesauce", "")]
+        )
+        self.assertEqual(index.search("ap"), [0, 1, 3])
+        with mock.patch.object(index, "_prefix_ids") as prefix_ids:
+            # 이전 질의를 확장했으므로 색인을 다시 찾지 않음
+            self.assertEqual(index.search("app"), [0, 3])
+            self.assertEqual(index.search("apples"), [3])
+            prefix_ids.assert_not_called()
+        # 지우면(질의가 짧아지면) 색인에서 다시 찾음
+        self.assertEqual(index.search("a"), [0, 1, 3])
+
+    def test_large_previous_result_is_not_narrowed(self):
+        _, index = self.build([(f"item{number}", "") for number in range(5)])
+        self.assertEqual(len(index.search("item")), 5)
+        with mock.patch("indexes.SEARCH_NARROW_LIMIT", 2):
+            with mock.patch.object(
+                index, "_prefix_ids", wraps=index._prefix_ids
+            ) as prefix_ids:
+                self.assertEqual(index.search("item3"), [3])
+                prefix_ids.assert_called()
+
+    def test_changes_reset_narrowing(self):
+        row_ids, index = self.build([("apple", ""), ("banana", "")])
+        self.assertEqual(index.search("ap"), [0])
+        index.on_insert(row_ids.append(), "apricot", "")
+        # 추가된 행이 이전 결과에 없어도 찾음
+        self.assertEqual(index.search("apr"), [2])
+        index.on_update(row_ids.id_at(1), "banana", "application", "")
+        self.assertEqual(index.search("appl"), [0, 1])
+        index.on_delete(row_ids.remove(0), "apple")
+        self.assertEqual(index.search("appl"), [0])
+        # 삭제로 쓰이지 않게 된 단어는 목록에서도 빠짐
+        self.assertNotIn("apple", index._vocabulary)
+
+
+class KeyIndexTest(unittest.TestCase):
+    def test_lookup_and_duplicates(self):
+        row_ids = RowIdMap()
+        row_ids.reset(4)
+        index = KeyIndex(row_ids)
+        index.rebuild(zip(row_ids.ids, ["a", "b", "a", "c"], ["", "", "", ""]))
+        self.assertEqual(index.first("a"), 0)
+        self.assertEqual(index.lookup("a"), [0, 2])
+        self.assertEqual(index.duplicates(), {"a": [0, 2]})
+        self.assertNotIn("A", index)
+        # 삭제하면 뒤쪽 위치가 당겨지고, 하나만 남은 키는 중복이 아님
+        index.on_delete(row_ids.remove(0), "a")
+        self.assertEqual(index.first("a"), 1)
+        self.assertEqual(index.duplicates(), {})
+        index.on_update(row_ids.id_at(2), "c", "b", "")
+        self.assertEqual(index.lookup("b"), [0, 2])
+        self.assertNotIn("c", index)
+
+    def test_unique_keys_rejects_duplicates(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "data.json")
+        data_manager = DataManager(path, STORAGE_MODE_SNAPSHOT, unique_keys=True)
+        self.addCleanup(data_manager.close)
+        self.assertTrue(data_manager.add_item("a", "1"))
+        self.assertTrue(data_manager.add_item("b", "2"))
+        self.assertFalse(data_manager.add_item("a", "again"))
+        self.assertFalse(data_manager.update_item(1, "a", "2"))
+        # 자기 자신의 키는 그대로 두고 값만 바꿀 수 있음
+        self.assertTrue(data_manager.update_item(1, "b", "changed"))
+        self.assertTrue(data_manager.upsert("a", "upserted"))
+        pairs = [("a", "x"), ("c", "3"), ("c", "4")]
+        self.assertEqual(data_manager.add_items(pairs), 1)
+        self.assertEqual(
+            data_manager.get_items(),
+            [
+                {"key": "a", "value": "upserted"},
+                {"key": "b", "value": "changed"},
+                {"key": "c", "value": "3"},
+            ],
+        )
+        self.assertEqual(data_manager.find_duplicate_keys(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
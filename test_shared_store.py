@@ -0,0 +1,111 @@
+"""
+공유 저장소 테스트입니다.
+같은 파일을 연 두 DataManager 인스턴스에서, 한쪽의 변경을 다른 쪽이 반영한 뒤에도
+행 위치로 한 수정/삭제가 올바른 행에 적용되는지 저장 방식별로 확인합니다.
+
+    python -m unittest test_shared_store
+"""
+
+import os
+import tempfile
+import unittest
+from data_manager import DataManager
+from storage_backends import detect_storage_mode
+from constants import (
+    STORAGE_MODE_JOURNAL,
+    STORAGE_MODE_INDEXED,
+    STORAGE_MODE_SNAPSHOT,
+    STORAGE_MODE_SQLITE,
+)
+
+# (파일 이름, 저장 방식)
+BACKENDS = [
+    ("data.db", STORAGE_MODE_SQLITE),
+    ("data.json", STORAGE_MODE_JOURNAL),
+    ("data.json", STORAGE_MODE_INDEXED),
+]
+
+
+class SharedStoreTest(unittest.TestCase):
+    def open_pair(self, file_name, storage_mode):
+        """같은 저장소를 연 두 인스턴스를 만듭니다 (a에는 항목 세 개)."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, file_name)
+        a = DataManager(path, storage_mode, shared=True)
+        self.addCleanup(a.close)
+        for number in range(3):
+            a.add_item(f"k{number}", f"v{number}")
+        b = DataManager(path, storage_mode, shared=True)
+        self.addCleanup(b.close)
+        return a, b
+
+    def test_update_after_other_instance_adds(self):
+        for file_name, storage_mode in BACKENDS:
+            with self.subTest(storage_mode=storage_mode):
+                a, b = self.open_pair(file_name, storage_mode)
+                b.add_item("k3", "v3")
+                self.assertTrue(a.update_item(1, "k1", "edited"))
+                self.assertTrue(a.delete_data(0))
+                b.reload_if_changed()
+                self.assertEqual(b.get_keys(), ["k1", "k2", "k3"])
+                self.assertEqual(b.get_value(0), "edited")
+
+    def test_update_after_other_instance_batch(self):
+        for file_name, storage_mode in BACKENDS:
+            with self.subTest(storage_mode=storage_mode):
+                a, b = self.open_pair(file_name, storage_mode)
+                with b.batch():
+                    b.add_item("k3", "v3")
+                    b.delete_data(0)
+                # a가 보는 위치 2의 행(k2)은 b의 배치 뒤 위치 1로 옮겨짐
+                self.assertTrue(a.update_item(2, "k2", "edited"))
+                b.reload_if_changed()
+                self.assertEqual(b.get_keys(), ["k1", "k2", "k3"])
+                self.assertEqual(b.get_value(1), "edited")
+
+    def test_delete_after_other_instance_batch(self):
+        for file_name, storage_mode in BACKENDS:
+            with self.subTest(storage_mode=storage_mode):
+                a, b = self.open_pair(file_name, storage_mode)
+                with b.batch():
+                    b.delete_data(0)
+                    b.add_item("k3", "v3")
+                # 배치에서 삭제된 행은 다른 행으로 착각하지 않음
+                self.assertFalse(a.delete_data(0))
+                self.assertTrue(a.delete_data(0))
+                b.reload_if_changed()
+                self.assertEqual(b.get_keys(), ["k2", "k3"])
+
+    def test_update_after_other_instance_clears(self):
+        for file_name, storage_mode in BACKENDS:
+            with self.subTest(storage_mode=storage_mode):
+                a, b = self.open_pair(file_name, storage_mode)
+                b.clear_all()
+                b.add_item("k0", "new")
+                self.assertFalse(a.update_item(0, "k0", "stale"))
+                self.assertEqual(a.get_items(), [{"key": "k0", "value": "new"}])
+
+    def test_alternating_shared_and_plain_runs(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "data.json")
+        shared = DataManager(path, STORAGE_MODE_JOURNAL, shared=True)
+        for key in ("a", "b", "c"):
+            shared.add_item(key, key)
+        shared.close()
+        # 공유하지 않고 실행해도 main.py처럼 디스크에 맞는 저장 방식으로 엶
+        plain = DataManager(path, detect_storage_mode(path))
+        self.assertEqual(plain.get_keys(), ["a", "b", "c"])
+        plain.add_item("z", "z")
+        plain.close()
+        shared = DataManager(path, STORAGE_MODE_JOURNAL, shared=True)
+        self.addCleanup(shared.close)
+        self.assertEqual(shared.get_keys(), ["a", "b", "c", "z"])
+        # 저널이 있는 저장소를 스냅샷 방식으로 덮어쓰지 않음
+        with self.assertRaises(ValueError):
+            DataManager(path, STORAGE_MODE_SNAPSHOT)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+"""
+저장소 백엔드 테스트입니다.
+저널 재생과 압축, 백그라운드 저장과 압축이 겹칠 때 레코드가 두 번 적용되지
+않는지, batch()가 실패하면 메모리와 디스크 모두 블록 전 상태로 되돌리는지
+확인합니다.
+
+    python -m unittest test_storage_backends
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+from data_manager import DataManager
+from constants import (
+    JOURNAL_SUFFIX,
+    STORAGE_MODE_INDEXED,
+    STORAGE_MODE_JOURNAL,
+    STORAGE_MODE_SNAPSHOT,
+    STORAGE_MODE_SQLITE,
+)
+
+# (파일 이름, 저장 방식)
+BACKENDS = [
+    ("data.json", STORAGE_MODE_SNAPSHOT),
+    ("data.json", STORAGE_MODE_JOURNAL),
+    ("data.json", STORAGE_MODE_INDEXED),
+    ("data.db", STORAGE_MODE_SQLITE),
+]
+
+
+class JournalTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.path = os.path.join(self.directory, "data.json")
+
+    def open(self, storage_mode=STORAGE_MODE_JOURNAL, write_behind=False, path=None):
+        data_manager = DataManager(
+            path or self.path, storage_mode, write_behind=write_behind
+        )
+        self.addCleanup(data_manager.close)
+        return data_manager
+
+    def test_replay_after_reopen(self):
+        for storage_mode in (STORAGE_MODE_JOURNAL, STORAGE_MODE_INDEXED):
+            with self.subTest(storage_mode=storage_mode):
+                path = os.path.join(self.directory, f"{storage_mode}.json")
+                data_manager = self.open(storage_mode, path=path)
+                for number in range(3):
+                    data_manager.add_item(f"k{number}", f"v{number}")
+                data_manager.update_item(1, "k1", "edited")
+                data_manager.delete_data(0)
+                data_manager.close()
+                # 스냅샷 없이 저널만으로 다시 읽음
+                self.assertFalse(os.path.exists(path))
+                reopened = self.open(storage_mode, path=path)
+                self.assertEqual(
+                    reopened.get_items(),
+                    [{"key": "k1", "value": "edited"}, {"key": "k2", "value": "v2"}],
+                )
+
+    def test_torn_last_record_is_dropped(self):
+        data_manager = self.open()
+        data_manager.add_item("k0", "v0")
+        data_manager.close()
+        with open(self.path + JOURNAL_SUFFIX, "ab") as f:
+            f.write(b'{"op": "add", "key": "torn"')
+        reopened = self.open()
+        self.assertEqual(reopened.get_keys(), ["k0"])
+        # 잘린 줄을 지웠으므로 이후 레코드가 이어서 읽힘
+        reopened.add_item("k1", "v1")
+        reopened.close()
+        self.assertEqual(self.open().get_keys(), ["k0", "k1"])
+
+    def test_compaction_keeps_items(self):
+        data_manager = self.open()
+        data_manager.add_item("k0", "v0")
+        data_manager.add_item("k1", "v1")
+        self.assertTrue(data_manager.save_data())
+        data_manager.add_item("k2", "v2")
+        data_manager.close()
+        self.assertTrue(os.path.exists(self.path))
+        self.assertEqual(self.open().get_keys(), ["k0", "k1", "k2"])
+
+    def test_insert_during_write_behind_compaction(self):
+        data_manager = self.open(write_behind=True)
+        backend = data_manager.backend
+        append_journal = backend._append_journal
+
+        def append_then_insert(records):
+            # 기록한 뒤 압축하기 전에 다른 변경이 끼어드는 경우
+            append_journal(records)
+            if not inserted:
+                inserted.append(True)
+                data_manager.add_item("k1", "v1")
+
+        inserted = []
+        backend._append_journal = append_then_insert
+        data_manager.add_item("k0", "v0")
+        data_manager.save_data()
+        self.assertTrue(data_manager.flush(5))
+        self.assertEqual(inserted, [True])
+        data_manager.close()
+        self.assertEqual(self.open().get_keys(), ["k0", "k1"])
+
+
+class BatchTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def open(self, path, storage_mode):
+        data_manager = DataManager(path, storage_mode)
+        self.addCleanup(data_manager.close)
+        return data_manager
+
+    def open_new(self, file_name, storage_mode):
+        return self.open(
+            os.path.join(self.directory, f"{storage_mode}-{file_name}"), storage_mode
+        )
+
+    def reopen(self, data_manager):
+        data_manager.close()
+        return self.open(data_manager.json_file, data_manager.storage_mode)
+
+    def test_exception_rolls_back(self):
+        for file_name, storage_mode in BACKENDS:
+            with self.subTest(storage_mode=storage_mode):
+                data_manager = self.open_new(file_name, storage_mode)
+                for number in range(3):
+                    data_manager.add_item(f"k{number}", f"v{number}")
+                with self.assertRaises(KeyError):
+                    with data_manager.batch():
+                        data_manager.delete_data(0)
+                        data_manager.update_item(0, "k1", "edited")
+                        data_manager.add_item("k3", "v3")
+                        raise KeyError("중단")
+                self.assertFalse(data_manager.batching)
+                self.assertEqual(data_manager.get_keys(), ["k0", "k1", "k2"])
+                self.assertEqual(data_manager.get_value(1), "v1")
+                # 색인도 되돌아가고, 되돌린 뒤에도 행 위치로 바꿀 수 있음
+                self.assertEqual(data_manager.find_key("k2"), 2)
+                self.assertIsNone(data_manager.find_key("k3"))
+                self.assertTrue(data_manager.update_item(2, "k2", "after"))
+                reopened = self.reopen(data_manager)
+                self.assertEqual(reopened.get_keys(), ["k0", "k1", "k2"])
+                self.assertEqual(reopened.get_value(2), "after")
+
+    def test_nested_batches_commit_once(self):
+        for file_name, storage_mode in BACKENDS:
+            with self.subTest(storage_mode=storage_mode):
+                data_manager = self.open_new(file_name, storage_mode)
+                data_manager.add_item("k0", "v0")
+                with data_manager.batch():
+                    data_manager.add_item("k1", "v1")
+                    with data_manager.batch():
+                        data_manager.delete_data(0)
+                    self.assertTrue(data_manager.batching)
+                self.assertEqual(data_manager.get_keys(), ["k1"])
+                self.assertEqual(self.reopen(data_manager).get_keys(), ["k1"])
+
+    def test_failed_commit_rolls_back(self):
+        data_manager = self.open_new("data.json", STORAGE_MODE_SNAPSHOT)
+        data_manager.add_item("k0", "v0")
+        with mock.patch.object(
+            data_manager.backend, "_write_snapshot", return_value=False
+        ):
+            with self.assertRaises(RuntimeError):
+                with data_manager.batch():
+                    data_manager.add_item("k1", "v1")
+                    data_manager.delete_data(0)
+        self.assertEqual(data_manager.get_keys(), ["k0"])
+        self.assertEqual(data_manager.find_key("k0"), 0)
+        self.assertEqual(self.reopen(data_manager).get_keys(), ["k0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,20 +1,39 @@
 """
 테마 관리 기능을 담당하는 모듈입니다.
 시스템 테마 감지 및 색상 관리를 처리합니다.
+테마는 한 번만 감지해 캐시하며, 시스템 색상 변경 이벤트
+(wx.EVT_SYS_COLOUR_CHANGED)를 받으면 invalidate()로 다시 감지합니다.
 """
 
 import wx
-from typing import Dict, Tuple
+from typing import Dict, Optional
 import subprocess
-import sys
+from instrumentation import count, span
 
 
 class ThemeManager:
     """시스템 테마를 감지하고 적절한 색상을 제공하는 클래스"""
 
+    _is_dark_cache: Optional[bool] = None
+    _colors_cache: Optional[Dict[str, wx.Colour]] = None
+
+    @staticmethod
+    def invalidate() -> None:
+        """캐시된 테마 정보를 버립니다. 다음 조회 때 다시 감지합니다."""
+        ThemeManager._is_dark_cache = None
+        ThemeManager._colors_cache = None
+
     @staticmethod
     def is_dark_mode() -> bool:
-        """시스템이 다크모드인지 확인합니다."""
+        """시스템이 다크모드인지 확인합니다 (캐시됨)."""
+        if ThemeManager._is_dark_cache is None:
+            with span("theme.detect"):
+                ThemeManager._is_dark_cache = ThemeManager._detect_dark_mode()
+        return ThemeManager._is_dark_cache
+
+    @staticmethod
+    def _detect_dark_mode() -> bool:
+        """플랫폼별로 다크모드를 감지합니다."""
         if wx.Platform == "__WXMAC__":
             return ThemeManager._detect_macos_dark_mode()
         elif wx.Platform == "__WXMSW__":
@@ -24,7 +43,15 @@ class ThemeManager:
 
     @staticmethod
     def _detect_macos_dark_mode() -> bool:
-        """macOS에서 다크모드 감지"""
+        """macOS에서 다크모드 감지
+
+        wx가 제공하는 시스템 외관 정보를 우선 사용하고, 오래된 wxPython에서만
+        defaults 명령으로 대체합니다.
+        """
+        try:
+            return wx.SystemSettings.GetAppearance().IsDark()
+        except Exception:
+            pass
         try:
             result = subprocess.run(
                 ["defaults", "read", "-g", "AppleInterfaceStyle"],
@@ -53,8 +80,17 @@ class ThemeManager:
 
     @staticmethod
     def get_theme_colors() -> Dict[str, wx.Colour]:
-        """현재 테마에 맞는 색상 팔레트를 반환합니다."""
-        is_dark = ThemeManager.is_dark_mode()
+        """현재 테마에 맞는 색상 팔레트를 반환합니다 (캐시됨)."""
+        count("theme.lookup")
+        if ThemeManager._colors_cache is None:
+            ThemeManager._colors_cache = ThemeManager._build_palette(
+                ThemeManager.is_dark_mode()
+            )
+        return ThemeManager._colors_cache
+
+    @staticmethod
+    def _build_palette(is_dark: bool) -> Dict[str, wx.Colour]:
+        """다크/라이트 모드에 맞는 색상 팔레트를 만듭니다."""
 
         if is_dark:
             return {
@@ -3,10 +3,19 @@ UI 컴포넌트들을 정의하는 모듈입니다.
 재사용 가능한 UI 요소들을 포함합니다.
 """
 
+import bisect
 import wx
-from typing import Optional
-from constants import ROUNDED_PANEL_RADIUS, STATUS_PANEL_RADIUS
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+from constants import (
+    ROUNDED_PANEL_RADIUS,
+    STATUS_PANEL_RADIUS,
+    ELLIPSIS,
+    TRUNCATE_CACHE_SIZE,
+    VALUE_COLUMN_PADDING,
+)
 from theme_manager import ThemeManager
+from instrumentation import count, span
 
 
 class RoundedPanel(wx.Panel):
@@ -40,10 +49,124 @@ class RoundedPanel(wx.Panel):
         dc.DrawRoundedRectangle(0, 0, width, height, self.radius)
 
 
+class EllipsisTruncator:
+    """컬럼 너비에 맞게 문자열을 ...으로 잘라내는 클래스
+
+    모든 접두사의 폭을 GetPartialTextExtents로 한 번에 측정한 뒤 자를 위치를
+    이진 탐색합니다. 결과는 (폰트, 너비, 값) 기준으로 LRU 캐시에 보관하므로
+    바뀌지 않은 행은 다시 측정하지 않습니다.
+    """
+
+    def __init__(self, max_entries: int = TRUNCATE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple[str, int, str], str]" = OrderedDict()
+
+    def truncate(
+        self, dc: wx.DC, value: str, width: int, padding: int = VALUE_COLUMN_PADDING
+    ) -> str:
+        """dc의 폰트 기준으로 width 안에 들어가도록 value를 잘라 반환합니다."""
+        cache_key = (dc.GetFont().GetNativeFontInfoDesc(), width, value)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            count("ui.truncate.cache_hit")
+            return cached
+
+        with span("ui.truncate"):
+            result = self._measure_and_cut(dc, value, width - padding)
+        self._cache[cache_key] = result
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """캐시를 비웁니다."""
+        self._cache.clear()
+
+    @staticmethod
+    def _measure_and_cut(dc: wx.DC, value: str, max_width: int) -> str:
+        if not value:
+            return value
+        # 한 글자는 최소 1픽셀이므로 max_width + 1 글자 이후는 측정할 필요가 없음
+        head = value[: max(max_width, 0) + 1]
+        extents = dc.GetPartialTextExtents(head)
+        if len(head) == len(value) and extents and extents[-1] <= max_width:
+            return value
+
+        limit = max_width - dc.GetTextExtent(ELLIPSIS)[0]
+        cut = bisect.bisect_right(extents, limit)
+        return value[:cut] + ELLIPSIS
+
+
+class VirtualListCtrl(wx.ListCtrl):
+    """행 텍스트를 필요할 때만 요청하는 가상 리스트 컨트롤
+
+    항목 문자열을 컨트롤 안에 복사해 두지 않고, 화면에 보이는 행을 그릴 때
+    text_provider(row, column)를 호출해 값을 가져옵니다.
+    """
+
+    def __init__(
+        self,
+        parent: wx.Window,
+        text_provider: Callable[[int, int], str],
+        style: int = 0,
+    ):
+        super().__init__(parent, style=wx.LC_REPORT | wx.LC_VIRTUAL | style)
+        self.text_provider = text_provider
+
+    def OnGetItemText(self, item: int, column: int) -> str:
+        """가상 리스트가 행을 그릴 때 호출됩니다."""
+        try:
+            return self.text_provider(item, column)
+        except Exception:
+            return ""
+
+    def set_row_count(self, count: int) -> None:
+        """행 개수만 바꾸고 보이는 영역을 다시 그립니다."""
+        self.SetItemCount(count)
+        self.Refresh()
+
+    def visible_rows(self) -> range:
+        """화면에 (일부라도) 보이는 행들"""
+        top = self.GetTopItem()
+        return range(top, min(top + self.GetCountPerPage() + 1, self.GetItemCount()))
+
+    def refresh_visible(self) -> None:
+        """화면에 보이는 행만 다시 그립니다."""
+        rows = self.visible_rows()
+        if rows:
+            self.RefreshItems(rows.start, rows.stop - 1)
+
+    def refresh_row(self, row: int) -> None:
+        """한 행만 다시 그립니다."""
+        if 0 <= row < self.GetItemCount():
+            self.RefreshItem(row)
+
+    def insert_row(self, row: int, count: int) -> None:
+        """row 위치에 행이 추가된 것을 반영합니다 (뒤쪽 행은 한 칸씩 밀림)."""
+        self.SetItemCount(count)
+        if 0 <= row < count:
+            self.RefreshItems(row, count - 1)
+
+    def remove_row(self, row: int, count: int) -> None:
+        """row 위치의 행이 삭제된 것을 반영합니다 (뒤쪽 행은 한 칸씩 당겨짐)."""
+        if 0 <= row < self.GetItemCount():
+            self.Select(row, False)
+        self.SetItemCount(count)
+        if 0 <= row < count:
+            self.RefreshItems(row, count - 1)
+
+
 class StatusFrame(wx.Frame):
-    """상태 메시지를 표시하는 프레임 (더 예쁘고 현대적으로 개선, 프레임 전체 둥글게 기능 제거)"""
+    """상태 메시지를 잠깐 보여주는 토스트 프레임 (프레임 전체 둥글게 기능 제거)
+
+    메인 창에 하나만 만들어 숨겨 두고 재사용합니다. show_message()는 레이블을
+    바꾸고 위치를 맞춘 뒤 하나뿐인 타이머를 다시 시작할 뿐이라 메시지마다
+    창을 새로 만들지 않습니다. 표시 중에 같은 메시지가 다시 오면 "×N"으로
+    합치고, 다른 메시지는 바로 교체합니다.
+    """
 
-    def __init__(self, parent: wx.Frame, message: str, font_size: int = 15):
+    def __init__(self, parent: wx.Frame, font_size: int = 15):
         from constants import (
             STATUS_FRAME_WIDTH,
             STATUS_FRAME_HEIGHT,
@@ -59,29 +182,31 @@ class StatusFrame(wx.Frame):
         self.SetTransparent(230)  # 반투명 효과 (0~255)
         self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
         self.parent = parent
-        self.message = message
+        self.message = ""
+        self.repeat = 0
         self.font_size = font_size
         self.radius = STATUS_PANEL_RADIUS + 10
         self._init_ui()
-        self._position_frame()
+        self._hide_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._on_hide_timer, self._hide_timer)
 
     def _init_ui(self):
         panel = wx.Panel(self)
         panel.SetBackgroundColour(wx.Colour(0, 0, 0, 180))  # 투명 검정
         sizer = wx.BoxSizer(wx.VERTICAL)
-        status_text = wx.StaticText(panel, label=self.message, style=wx.ALIGN_CENTER)
-        status_font = wx.Font(
+        self.status_text = wx.StaticText(panel, label="", style=wx.ALIGN_CENTER)
+        self.status_font = wx.Font(
             self.font_size,
             wx.FONTFAMILY_SWISS,
             wx.FONTSTYLE_NORMAL,
             wx.FONTWEIGHT_BOLD,
         )
-        status_text.SetFont(status_font)
-        status_text.SetForegroundColour(wx.Colour(255, 255, 255))
+        self.status_text.SetFont(self.status_font)
+        self.status_text.SetForegroundColour(wx.Colour(255, 255, 255))
         # 패딩과 중앙정렬 (패딩을 3으로 줄임)
         inner_sizer = wx.BoxSizer(wx.VERTICAL)
         inner_sizer.AddStretchSpacer(1)
-        inner_sizer.Add(status_text, 0, wx.ALIGN_CENTER | wx.ALL, 3)
+        inner_sizer.Add(self.status_text, 0, wx.ALIGN_CENTER | wx.ALL, 3)
         inner_sizer.AddStretchSpacer(1)
         panel.SetSizer(inner_sizer)
         sizer.Add(panel, 1, wx.EXPAND | wx.ALL, 0)
@@ -89,7 +214,7 @@ class StatusFrame(wx.Frame):
         self.panel = panel
 
     def _position_frame(self):
-        from constants import STATUS_FRAME_WIDTH, STATUS_OFFSET_Y
+        from constants import STATUS_OFFSET_Y
 
         frame_pos = self.parent.GetPosition()
         frame_size = self.parent.GetSize()
@@ -97,15 +222,30 @@ class StatusFrame(wx.Frame):
         y = frame_pos[1] + STATUS_OFFSET_Y
         self.SetPosition((x, y))
 
-    def show_temporarily(self, duration: int = 2000):
-        """일정 시간 동안 표시 후 자동으로 닫기 (안전하게 처리)"""
-        self.Show()
-
-        def safe_close():
-            try:
-                if self and not self.IsBeingDeleted():
-                    self.Close()
-            except Exception:
-                pass
+    def set_font_size(self, font_size: int) -> None:
+        """메시지 글꼴 크기를 바꿉니다."""
+        self.font_size = font_size
+        self.status_font.SetPointSize(font_size)
+        self.status_text.SetFont(self.status_font)
+        self.panel.Layout()
+
+    def show_message(self, message: str, duration: int = 2000) -> None:
+        """메시지를 duration(ms) 동안 표시합니다 (창과 타이머는 재사용)."""
+        if self.IsShown() and message == self.message:
+            self.repeat += 1
+            label = f"{message} ×{self.repeat}"
+        else:
+            self.message = message
+            self.repeat = 1
+            label = message
+        if self.status_text.GetLabel() != label:
+            self.status_text.SetLabel(label)
+            self.panel.Layout()
+        # 메인 창이 옮겨졌을 수 있으므로 매번 위치를 맞춤
+        self._position_frame()
+        if not self.IsShown():
+            self.ShowWithoutActivating()
+        self._hide_timer.StartOnce(duration)
 
-        wx.CallLater(duration, safe_close)
+    def _on_hide_timer(self, event) -> None:
+        self.Hide()
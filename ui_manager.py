@@ -3,9 +3,12 @@ UI 관리 기능을 담당하는 모듈입니다.
 메인 윈도우와 사용자 인터페이스를 관리합니다.
 """
 
+import threading
 import wx
-from typing import Optional
+from typing import Callable, List, Optional
 from constants import (
+    WINDOW_TITLE,
+    WINDOW_LOADING_TITLE,
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
     WINDOW_MIN_HEIGHT,
@@ -19,78 +22,24 @@ from constants import (
     PANEL_MARGIN,
     STATUS_DISPLAY_TIME,
     STATUS_FRAME_HEIGHT,
+    CHANGE_ADD,
+    CHANGE_UPDATE,
+    CHANGE_DELETE,
+    PALETTE_HOTKEY_KEY,
+    CLIPBOARD_POLL_INTERVAL,
+    SHARED_POLL_INTERVAL,
+    HISTORY_LIST_HEIGHT,
+    RESIZE_SETTLE_DELAY,
+    BULK_FILE_WILDCARD,
+    BULK_FILE_EXTENSIONS,
 )
+from bulk_io import ImportResult, export_file, import_file
+from clipboard_history import ClipboardHistory, clipboard_change_counter
 from theme_manager import ThemeManager
-from ui_components import StatusFrame
+from ui_components import EllipsisTruncator, StatusFrame, VirtualListCtrl
 from data_manager import DataManager
-
-
-# 시스템 테마에 따른 동적 색상 설정
-def get_theme_colors():
-    """시스템 테마에 따라 색상을 반환"""
-    # macOS에서 다크모드 감지
-    if wx.Platform == "__WXMAC__":
-        try:
-            import subprocess
-
-            result = subprocess.run(
-                ["defaults", "read", "-g", "AppleInterfaceStyle"],
-                capture_output=True,
-                text=True,
-            )
-            is_dark = result.stdout.strip() == "Dark"
-        except:
-            is_dark = False
-    # Windows에서 다크모드 감지
-    elif wx.Platform == "__WXMSW__":
-        try:
-            import winreg
-
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize",
-            )
-            value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
-            is_dark = value == 0
-            winreg.CloseKey(key)
-        except:
-            is_dark = False
-    else:
-        is_dark = False
-
-    if is_dark:
-        # 다크모드 색상
-        return {
-            "primary": wx.Colour(33, 150, 243),  # Material Blue 500
-            "background": wx.Colour(30, 30, 30),  # 어두운 배경
-            "list_background": wx.Colour(45, 45, 45),  # 어두운 리스트 배경
-            "text": wx.Colour(255, 255, 255),  # 흰색 텍스트
-            "input_background": wx.Colour(50, 50, 50),  # 어두운 입력 필드
-            "border": wx.Colour(70, 70, 70),  # 어두운 테두리
-        }
-    else:
-        # 라이트모드 색상
-        return {
-            "primary": wx.Colour(33, 150, 243),  # Material Blue 500
-            "background": wx.Colour(250, 250, 250),  # 밝은 배경
-            "list_background": wx.Colour(245, 245, 245),  # 밝은 리스트 배경
-            "text": wx.Colour(0, 0, 0),  # 검은색 텍스트
-            "input_background": wx.Colour(255, 255, 255),  # 흰색 입력 필드
-            "border": wx.Colour(200, 200, 200),  # 밝은 테두리
-        }
-
-
-# 기존 색상 상수 제거하고 함수로 대체
-def get_primary_color():
-    return get_theme_colors()["primary"]
-
-
-def get_background_color():
-    return get_theme_colors()["background"]
-
-
-def get_list_background_color():
-    return get_theme_colors()["list_background"]
+from quick_paste import QuickPastePalette
+from instrumentation import span, timed
 
 
 class RoundedPanel(wx.Panel):
@@ -130,7 +79,13 @@ class UIManager:
         # 폰트 크기를 data_manager에서 읽어옴
         self.font_size = self.data_manager.get_font_size()
         self.selected_index: Optional[int] = None
+        # 편집 중인 항목의 행 ID (다른 인스턴스의 변경으로 위치가 바뀌어도 따라감)
+        self.selected_row_id: Optional[int] = None
+        # 필터 결과: 리스트 행 -> DataManager 인덱스 (None이면 필터 없음)
+        self._visible_rows: Optional[List[int]] = None
         self.is_edit_mode = False
+        # 백그라운드에서 데이터를 불러오는 중인지 (끝나기 전에는 편집 불가)
+        self.loading = False
 
         # UI 컴포넌트들
         self.frame: Optional[wx.Frame] = None
@@ -138,29 +93,127 @@ class UIManager:
         self.input_panel: Optional[wx.Panel] = None
         self.key_text: Optional[wx.TextCtrl] = None
         self.value_text: Optional[wx.TextCtrl] = None
+        self.filter_text: Optional[wx.SearchCtrl] = None
         self.add_button: Optional[wx.Button] = None
         self.new_button: Optional[wx.Button] = None
         self.save_button: Optional[wx.Button] = None
         self.delete_button: Optional[wx.Button] = None
-        self.data_list_ctrl: Optional[wx.ListCtrl] = None
+        self.data_list_ctrl: Optional[VirtualListCtrl] = None
+        self.history_label: Optional[wx.StaticText] = None
+        self.history_list_ctrl: Optional[VirtualListCtrl] = None
         self.font: Optional[wx.Font] = None
-        self.status_frame = None
+        self.status_frame: Optional[StatusFrame] = None
+        self.truncator = EllipsisTruncator()
+        # 말줄임에 쓰는 컬럼 너비. 창 크기를 조정하는 동안에는 그대로 두고,
+        # 조정이 멈추면(resize_timer) 새 너비로 바꿔 보이는 행만 다시 자름
+        self._value_width = 0
+        self._history_width = 0
+        self.resize_timer: Optional[wx.Timer] = None
+        self.palette: Optional[QuickPastePalette] = None
+        self.palette_hotkey_id = wx.NewIdRef()
+        self.palette_hotkey_registered = False
+        # 클립보드 기록 모드 (enable_clipboard_history()로 켬)
+        self.clipboard_history: Optional[ClipboardHistory] = None
+        self.clipboard_timer: Optional[wx.Timer] = None
+        # 공유 저장소에서 다른 인스턴스의 변경을 확인하는 타이머
+        self.shared_timer: Optional[wx.Timer] = None
+        # 파일 메뉴와 가져오기/내보내기 진행 중 여부
+        self.import_menu_item: Optional[wx.MenuItem] = None
+        self.export_menu_item: Optional[wx.MenuItem] = None
+        self.bulk_running = False
 
         self.init_ui()
         self.setup_event_handlers()
+        self.data_manager.add_listener(self._on_data_changed)
+        self._init_quick_paste()
 
     def init_ui(self) -> None:
         """UI 초기화"""
         self._create_main_frame()
+        self._create_menu_bar()
         self._create_panels()
         self._init_controls()
         self._layout_controls()
         self._apply_theme()
         self.frame.Show()
 
+    def load_data_in_background(self) -> None:
+        """창을 먼저 띄운 채로 작업 스레드에서 데이터를 불러옵니다.
+
+        불러오는 동안에는 빈 리스트를 보여주고 추가/검색을 막아 두며,
+        끝나면 메인 스레드에서 _on_data_loaded가 리스트를 채웁니다.
+        저장소 크기와 관계없이 창은 바로 나타납니다.
+        """
+        self._set_loading(True)
+        self.data_manager.load_in_background(
+            lambda error: wx.CallAfter(self._on_data_loaded, error)
+        )
+
+    def _set_loading(self, loading: bool) -> None:
+        """불러오는 중 표시와 편집 컨트롤 사용 가능 여부를 바꿉니다."""
+        self.loading = loading
+        self.frame.SetTitle(WINDOW_LOADING_TITLE if loading else WINDOW_TITLE)
+        self.add_button.Enable(not loading)
+        self.filter_text.Enable(not loading)
+        self.import_menu_item.Enable(not loading)
+        self.export_menu_item.Enable(not loading)
+
+    def _on_data_loaded(self, error: Optional[Exception]) -> None:
+        """백그라운드 로드 완료 (메인 스레드): 저장된 글꼴을 적용하고 리스트를 채움"""
+        if not self.frame:
+            # 불러오는 동안 창이 닫힘
+            return
+        if error is not None:
+            # 빈 상태로 저장해 기존 데이터를 덮어쓰지 않도록 편집은 계속 막아 둠
+            self.frame.SetTitle(WINDOW_TITLE)
+            wx.MessageBox(
+                f"데이터를 불러올 수 없습니다.\n오류: {error}",
+                "로드 오류",
+                wx.OK | wx.ICON_ERROR,
+            )
+            return
+        self._set_loading(False)
+        font_size = self.data_manager.get_font_size()
+        if font_size != self.font_size:
+            self._apply_font_size(font_size)
+        else:
+            self.refresh_listctrl()
+        if self.data_manager.shared:
+            self._start_shared_sync()
+
+    def _start_shared_sync(self) -> None:
+        """공유 저장소면 다른 인스턴스의 변경을 주기적으로 반영합니다.
+
+        확인은 저널 크기 stat 한 번이고, 변경이 있으면 새 레코드만 적용되어
+        리스너를 통해 바뀐 행만 다시 그려집니다.
+        """
+        self.shared_timer = wx.Timer(self.frame)
+        self.frame.Bind(wx.EVT_TIMER, self.on_shared_poll, self.shared_timer)
+        self.shared_timer.Start(SHARED_POLL_INTERVAL)
+
+    def on_shared_poll(self, event) -> None:
+        self.data_manager.reload_if_changed()
+
+    def _init_quick_paste(self) -> None:
+        """빠른 붙여넣기 팔레트를 미리 만들어 숨겨 두고 전역 단축키를 등록"""
+        self.palette = QuickPastePalette(
+            self.data_manager, self.copy_to_clipboard, self.font
+        )
+        self.palette_hotkey_registered = self.frame.RegisterHotKey(
+            self.palette_hotkey_id,
+            wx.MOD_CONTROL | wx.MOD_SHIFT,
+            ord(PALETTE_HOTKEY_KEY),
+        )
+        if self.palette_hotkey_registered:
+            self.frame.Bind(
+                wx.EVT_HOTKEY, self.on_palette_hotkey, id=self.palette_hotkey_id
+            )
+        else:
+            print("빠른 붙여넣기 단축키를 등록할 수 없습니다.")
+
     def _create_main_frame(self) -> None:
         """메인 프레임 생성"""
-        self.frame = wx.Frame(None, title="복붙")
+        self.frame = wx.Frame(None, title=WINDOW_TITLE)
         self.frame.SetSize(WINDOW_WIDTH, WINDOW_HEIGHT)
         self.frame.SetMinSize((WINDOW_WIDTH, WINDOW_MIN_HEIGHT))
         self.frame.SetMaxSize((WINDOW_WIDTH, -1))
@@ -171,6 +224,15 @@ class UIManager:
         y = screen_height - WINDOW_HEIGHT - WINDOW_MARGIN_Y
         self.frame.SetPosition(wx.Point(x, y))
 
+    def _create_menu_bar(self) -> None:
+        """파일 메뉴 (가져오기/내보내기) 생성"""
+        file_menu = wx.Menu()
+        self.import_menu_item = file_menu.Append(wx.ID_OPEN, "가져오기...\tCtrl+I")
+        self.export_menu_item = file_menu.Append(wx.ID_SAVEAS, "내보내기...\tCtrl+E")
+        menu_bar = wx.MenuBar()
+        menu_bar.Append(file_menu, "파일")
+        self.frame.SetMenuBar(menu_bar)
+
     def _create_panels(self) -> None:
         """패널들 생성"""
         self.main_panel = wx.Panel(self.frame)
@@ -183,8 +245,10 @@ class UIManager:
     def _init_controls(self) -> None:
         """컨트롤들 초기화"""
         self._init_text_controls()
+        self._init_filter_control()
         self._init_buttons()
         self._init_list_control()
+        self._init_history_controls()
         self._init_font()
         self.refresh_listctrl()
 
@@ -212,6 +276,19 @@ class UIManager:
         self.key_text.Bind(wx.EVT_TEXT_ENTER, lambda e: self.value_text.SetFocus())
         self.value_text.Bind(wx.EVT_TEXT_ENTER, self.on_save)
 
+    def _init_filter_control(self) -> None:
+        """리스트 위 검색(필터) 입력창 초기화"""
+        self.filter_text = wx.SearchCtrl(self.main_panel, style=wx.BORDER_SIMPLE)
+        self.filter_text.ShowCancelButton(True)
+        self.filter_text.SetDescriptiveText("검색")
+
+        colors = ThemeManager.get_theme_colors()
+        self.filter_text.SetBackgroundColour(colors["input_background"])
+        self.filter_text.SetForegroundColour(colors["text"])
+
+        self.filter_text.Bind(wx.EVT_TEXT, self.on_filter_text)
+        self.filter_text.Bind(wx.EVT_SEARCHCTRL_CANCEL_BTN, self.on_filter_cancel)
+
     def _init_buttons(self) -> None:
         """버튼들 초기화"""
         BUTTON_HEIGHT = 28
@@ -244,10 +321,11 @@ class UIManager:
         self.value_text.SetSize(-1, INPUT_FIELD_HEIGHT)
 
     def _init_list_control(self) -> None:
-        """리스트 컨트롤 초기화"""
-        self.data_list_ctrl = wx.ListCtrl(
+        """리스트 컨트롤 초기화 (가상 모드: 보이는 행만 DataManager에서 읽음)"""
+        self.data_list_ctrl = VirtualListCtrl(
             self.main_panel,
-            style=wx.LC_REPORT | wx.BORDER_NONE | wx.LC_SINGLE_SEL,
+            self._get_list_item_text,
+            style=wx.BORDER_NONE | wx.LC_SINGLE_SEL,
         )
 
         # 컬럼 설정 (초기값, 이후 동적으로 조정)
@@ -260,8 +338,31 @@ class UIManager:
 
         # 이벤트 바인딩
         self.data_list_ctrl.Bind(wx.EVT_LIST_ITEM_SELECTED, self.on_listctrl_click)
+        self.resize_timer = wx.Timer(self.frame)
+        self.frame.Bind(wx.EVT_TIMER, self.on_resize_settled, self.resize_timer)
         self.data_list_ctrl.Bind(wx.EVT_SIZE, self.on_listctrl_resize)
 
+    def _init_history_controls(self) -> None:
+        """클립보드 기록 리스트 초기화 (기록 모드를 켤 때까지 숨김)"""
+        self.history_label = wx.StaticText(self.main_panel, label="클립보드 기록")
+        self.history_list_ctrl = VirtualListCtrl(
+            self.main_panel,
+            self._get_history_item_text,
+            style=wx.BORDER_NONE | wx.LC_SINGLE_SEL | wx.LC_NO_HEADER,
+        )
+        self.history_list_ctrl.InsertColumn(0, "HISTORY", width=100)
+        self.history_list_ctrl.SetMinSize((-1, HISTORY_LIST_HEIGHT))
+
+        # 클릭하면 복사, 더블클릭(Enter)하면 저장소로 옮김
+        self.history_list_ctrl.Bind(wx.EVT_LIST_ITEM_SELECTED, self.on_history_click)
+        self.history_list_ctrl.Bind(
+            wx.EVT_LIST_ITEM_ACTIVATED, self.on_history_activate
+        )
+        self.history_list_ctrl.Bind(wx.EVT_SIZE, self.on_history_resize)
+
+        self.history_label.Hide()
+        self.history_list_ctrl.Hide()
+
     def _init_font(self) -> None:
         """폰트 초기화"""
         self.font = wx.Font(
@@ -273,14 +374,37 @@ class UIManager:
 
         # 폰트 적용
         self.data_list_ctrl.SetFont(self.font)
+        self.history_list_ctrl.SetFont(self.font)
         self.key_text.SetFont(self.font)
         self.value_text.SetFont(self.font)
 
+    def set_font_size(self, size: int) -> None:
+        """글꼴 크기를 바꿔 저장하고 실행 중인 화면에 다시 적용합니다."""
+        self.data_manager.set_font_size(size)
+        self._apply_font_size(size)
+
+    def _apply_font_size(self, size: int) -> None:
+        """글꼴 크기를 실행 중인 화면에 적용합니다 (저장하지 않음)."""
+        self.font_size = size
+        self._init_font()
+        self._apply_theme()
+        if self.palette is not None:
+            self.palette.set_font(self.font)
+        if self.status_frame is not None:
+            self.status_frame.set_font_size(size)
+        self.main_panel.Layout()
+        self.refresh_listctrl()
+
     def _layout_controls(self) -> None:
         """컨트롤 레이아웃 설정"""
         # 메인 레이아웃
         main_sizer = wx.BoxSizer(wx.VERTICAL)
+        main_sizer.Add(
+            self.filter_text, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, PANEL_MARGIN
+        )
         main_sizer.Add(self.data_list_ctrl, 1, wx.EXPAND | wx.ALL, PANEL_MARGIN)
+        main_sizer.Add(self.history_label, 0, wx.LEFT | wx.RIGHT, PANEL_MARGIN)
+        main_sizer.Add(self.history_list_ctrl, 0, wx.EXPAND | wx.ALL, PANEL_MARGIN)
         main_sizer.Add(self.input_panel, 0, wx.EXPAND)
         main_sizer.Add(self.add_button, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, PANEL_MARGIN)
         main_sizer.AddSpacer(6)  # Add 버튼 아래 간격
@@ -373,8 +497,10 @@ class UIManager:
             pass
 
         # 리스트 컨트롤 스타일 적용
-        self.data_list_ctrl.SetBackgroundColour(colors["list_background"])
-        self.data_list_ctrl.SetForegroundColour(colors["text"])
+        for list_ctrl in [self.data_list_ctrl, self.history_list_ctrl]:
+            list_ctrl.SetBackgroundColour(colors["list_background"])
+            list_ctrl.SetForegroundColour(colors["text"])
+        self.history_label.SetForegroundColour(colors["text"])
 
         # 프레임 및 패널 배경색 적용
         self.frame.SetBackgroundColour(colors["background"])
@@ -382,11 +508,14 @@ class UIManager:
         self.input_panel.SetBackgroundColour(colors["background"])
 
         # 입력 필드 색상 적용
-        if hasattr(self, "key_text"):
+        if self.key_text is not None:
             self.key_text.SetBackgroundColour(colors["input_background"])
             self.value_text.SetBackgroundColour(colors["input_background"])
             self.key_text.SetForegroundColour(colors["text"])
             self.value_text.SetForegroundColour(colors["text"])
+        if self.filter_text is not None:
+            self.filter_text.SetBackgroundColour(colors["input_background"])
+            self.filter_text.SetForegroundColour(colors["text"])
 
     def setup_event_handlers(self) -> None:
         """이벤트 핸들러 설정"""
@@ -394,20 +523,215 @@ class UIManager:
         self.new_button.Bind(wx.EVT_BUTTON, self.on_new_button_click)
         self.save_button.Bind(wx.EVT_BUTTON, self.on_save)
         self.delete_button.Bind(wx.EVT_BUTTON, self.on_delete)
+        self.frame.Bind(wx.EVT_ACTIVATE, self.on_frame_activate)
+        self.frame.Bind(wx.EVT_SYS_COLOUR_CHANGED, self.on_sys_colour_changed)
+        self.frame.Bind(wx.EVT_CLOSE, self.on_frame_close)
+        self.frame.Bind(wx.EVT_MENU, self.on_import, self.import_menu_item)
+        self.frame.Bind(wx.EVT_MENU, self.on_export, self.export_menu_item)
+
+    def on_frame_close(self, event) -> None:
+        """메인 창을 닫을 때 단축키를 해제하고 숨겨 둔 팔레트를 정리"""
+        if self.clipboard_timer is not None:
+            self.clipboard_timer.Stop()
+        self.resize_timer.Stop()
+        if self.shared_timer is not None:
+            self.shared_timer.Stop()
+        if self.palette_hotkey_registered:
+            self.frame.UnregisterHotKey(self.palette_hotkey_id)
+            self.palette_hotkey_registered = False
+        if self.palette is not None:
+            self.palette.destroy_palette()
+            self.palette = None
+        event.Skip()
+
+    def on_import(self, event) -> None:
+        """파일 메뉴 > 가져오기: CSV/TSV/JSONL 파일의 항목을 끝에 추가"""
+        if self.loading or self.bulk_running:
+            return
+        with wx.FileDialog(
+            self.frame,
+            "가져올 파일 선택",
+            wildcard=BULK_FILE_WILDCARD,
+            style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST,
+        ) as dialog:
+            if dialog.ShowModal() != wx.ID_OK:
+                return
+            path = dialog.GetPath()
+        self._run_bulk(
+            "가져오는 중",
+            lambda progress: import_file(
+                self.data_manager, path, progress=progress, dispatch=wx.CallAfter
+            ),
+            self._on_import_done,
+        )
+
+    def on_export(self, event) -> None:
+        """파일 메뉴 > 내보내기: 모든 항목을 CSV/TSV/JSONL 파일로 저장"""
+        if self.loading or self.bulk_running:
+            return
+        with wx.FileDialog(
+            self.frame,
+            "내보낼 파일 이름",
+            wildcard=BULK_FILE_WILDCARD,
+            style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT,
+        ) as dialog:
+            if dialog.ShowModal() != wx.ID_OK:
+                return
+            path = dialog.GetPath()
+            extension = BULK_FILE_EXTENSIONS[dialog.GetFilterIndex()]
+        if not path.lower().endswith(BULK_FILE_EXTENSIONS):
+            path += extension
+        self._run_bulk(
+            "내보내는 중",
+            lambda progress: export_file(
+                self.data_manager, path, progress=progress, dispatch=wx.CallAfter
+            ),
+            self._on_export_done,
+        )
+
+    def _run_bulk(self, label: str, work: Callable, on_done: Callable) -> None:
+        """가져오기/내보내기를 작업 스레드에서 실행합니다.
+
+        파일 읽기/쓰기는 작업 스레드에서, DataManager 호출은 청크 단위로
+        메인 스레드에서 실행되므로 진행하는 동안에도 창이 응답합니다.
+        끝나면 메인 스레드에서 on_done(결과, 오류)이 호출됩니다.
+        """
+        self._set_bulk_running(True)
+        self.frame.SetTitle(f"{WINDOW_TITLE} ({label})")
+
+        def progress(done: int, total: int) -> None:
+            wx.CallAfter(self._on_bulk_progress, label, done, total)
+
+        def run() -> None:
+            try:
+                result = work(progress)
+            except Exception as e:
+                wx.CallAfter(on_done, None, e)
+            else:
+                wx.CallAfter(on_done, result, None)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def _set_bulk_running(self, running: bool) -> None:
+        self.bulk_running = running
+        self.add_button.Enable(not running)
+        self.import_menu_item.Enable(not running)
+        self.export_menu_item.Enable(not running)
+
+    def _on_bulk_progress(self, label: str, done: int, total: int) -> None:
+        if self.frame and self.bulk_running and total:
+            self.frame.SetTitle(f"{WINDOW_TITLE} ({label} {done * 100 // total}%)")
+
+    def _finish_bulk(self) -> bool:
+        """진행 표시를 되돌립니다. 그 사이 창이 닫혔으면 False."""
+        if not self.frame:
+            return False
+        self._set_bulk_running(False)
+        self.frame.SetTitle(WINDOW_TITLE)
+        return True
+
+    def _on_import_done(
+        self, result: Optional[ImportResult], error: Optional[Exception]
+    ) -> None:
+        if not self._finish_bulk():
+            return
+        if error is not None:
+            wx.MessageBox(
+                f"파일을 가져올 수 없어 아무 항목도 추가하지 않았습니다.\n오류: {error}",
+                "가져오기 오류",
+                wx.OK | wx.ICON_ERROR,
+            )
+            return
+        if result.imported and not result.saved:
+            self.show_copy_status("❌ 저장 실패")
+        else:
+            self.show_copy_status(f"✅ {result.imported}개 가져옴")
+        if result.skipped or result.duplicates:
+            lines = []
+            if result.duplicates:
+                lines.append(f"이미 있는 키 {result.duplicates}개를 건너뛰었습니다.")
+            if result.skipped:
+                lines.append(f"{result.skipped}개 줄을 건너뛰었습니다.")
+                lines.extend(result.errors)
+            wx.MessageBox("\n".join(lines), "가져오기", wx.OK | wx.ICON_WARNING)
+
+    def _on_export_done(self, count: Optional[int], error: Optional[Exception]) -> None:
+        if not self._finish_bulk():
+            return
+        if error is not None:
+            wx.MessageBox(
+                f"파일을 내보낼 수 없습니다.\n오류: {error}",
+                "내보내기 오류",
+                wx.OK | wx.ICON_ERROR,
+            )
+            return
+        self.show_copy_status(f"✅ {count}개 내보냄")
+
+    def on_palette_hotkey(self, event) -> None:
+        """전역 단축키: 팔레트를 열거나 닫음"""
+        if self.palette is None:
+            return
+        if self.palette.IsShown():
+            self.palette.hide_palette()
+        else:
+            self.palette.show_palette()
+
+    def on_sys_colour_changed(self, event) -> None:
+        """시스템 테마가 바뀌면 캐시를 비우고 실행 중에 다시 테마를 적용"""
+        ThemeManager.invalidate()
+        self._apply_theme()
+        if self.palette is not None:
+            self.palette.apply_theme()
+        self.frame.Refresh()
+        event.Skip()
+
+    def on_frame_activate(self, event) -> None:
+        """창이 활성화될 때 다른 프로세스가 파일을 바꿨으면 다시 로드"""
+        if event.GetActive():
+            self.data_manager.reload_if_changed()
+        event.Skip()
 
     def on_listctrl_resize(self, event):
-        """리스트 컨트롤 크기 변경 시 컬럼 너비를 동적으로 조정"""
+        """리스트 컨트롤 크기 변경 시 컬럼 너비를 동적으로 조정
+
+        말줄임은 바로 다시 계산하지 않고, 크기 조정이 RESIZE_SETTLE_DELAY 동안
+        멈추면 on_resize_settled에서 한 번만 계산합니다. 그동안 다시 그려지는
+        행은 이전 너비의 (캐시된) 결과를 그대로 씁니다.
+        """
         total_width = self.data_list_ctrl.GetClientSize().GetWidth()
         key_width = int(total_width * KEY_COLUMN_RATIO)
         value_width = total_width - key_width
         self.data_list_ctrl.SetColumnWidth(0, key_width)
         self.data_list_ctrl.SetColumnWidth(1, value_width)
+        if value_width != self._value_width:
+            self.resize_timer.StartOnce(RESIZE_SETTLE_DELAY)
         event.Skip()
 
+    @timed("ui.resize_settled")
+    def on_resize_settled(self, event) -> None:
+        """크기 조정이 멈추면 새 너비로 화면에 보이는 행만 다시 자릅니다.
+
+        화면 밖의 행은 스크롤되어 보일 때 가상 리스트가 텍스트를 요청하면서
+        새 너비로 잘리므로, 항목 수와 관계없이 보이는 행 수만큼만 측정합니다.
+        """
+        value_width = self.data_list_ctrl.GetColumnWidth(1)
+        if value_width != self._value_width:
+            self._value_width = value_width
+            self.data_list_ctrl.refresh_visible()
+        history_width = self.history_list_ctrl.GetColumnWidth(0)
+        if history_width != self._history_width:
+            self._history_width = history_width
+            if self.history_list_ctrl.IsShown():
+                self.history_list_ctrl.refresh_visible()
+
+    @timed("ui.refresh_listctrl")
     def refresh_listctrl(self) -> None:
-        """리스트 컨트롤 새로고침 (가로 스크롤 없이, VALUE는 ... 처리)"""
-        self.data_list_ctrl.DeleteAllItems()
-        self.data_manager.refresh_data()
+        """리스트 컨트롤 새로고침 (가로 스크롤 없이, VALUE는 ... 처리)
+
+        가상 리스트이므로 행 개수만 갱신하고, 실제 텍스트는 화면에 보이는
+        행에 한해 _get_list_item_text에서 만들어집니다. 메모리의 DataManager
+        상태를 그대로 사용하며 파일을 다시 읽지 않습니다.
+        """
 
         # 컬럼 너비 측정 (항상 최신 크기로)
         total_width = self.data_list_ctrl.GetClientSize().GetWidth()
@@ -415,38 +739,112 @@ class UIManager:
         value_col_width = total_width - key_width
         self.data_list_ctrl.SetColumnWidth(0, key_width)
         self.data_list_ctrl.SetColumnWidth(1, value_col_width)
-        dc = wx.ClientDC(self.data_list_ctrl)
-        dc.SetFont(self.data_list_ctrl.GetFont())
+        # 전체를 다시 그리므로 말줄임 너비도 바로 맞춤
+        self._value_width = value_col_width
 
-        for item in self.data_manager.get_items():
-            idx = self.data_list_ctrl.InsertItem(
-                self.data_list_ctrl.GetItemCount(), item["key"]
-            )
-            value = item["value"]
-            # 텍스트 픽셀 길이 측정
-            text_width, _ = dc.GetTextExtent(value)
-            if text_width > value_col_width - 10:
-                # ...을 붙여서 잘라내기
-                ellipsis = "..."
-                max_width = value_col_width - dc.GetTextExtent(ellipsis)[0] - 10
-                short_value = ""
-                for ch in value:
-                    w, _ = dc.GetTextExtent(short_value + ch)
-                    if w > max_width:
-                        break
-                    short_value += ch
-                value = short_value + ellipsis
-            self.data_list_ctrl.SetItem(idx, 1, value)
+        self.data_list_ctrl.set_row_count(self._row_count())
 
         # 가로 스크롤바가 나오지 않도록 스타일을 강제
         self.data_list_ctrl.SetScrollbar(wx.HORIZONTAL, 0, 0, 0, True)
 
+    def _on_data_changed(self, event: str, index: int) -> None:
+        """DataManager 변경 알림: 단일 항목 변경은 해당 행만 패치하고,
+        일괄 변경은 전체를 다시 그립니다."""
+        self._follow_selection()
+        if self._visible_rows is not None:
+            # 필터 중에는 색인으로 결과를 다시 구해 행 매핑을 바꿈
+            self._apply_filter()
+            return
+        count = self.data_manager.get_item_count()
+        if event == CHANGE_ADD:
+            self.data_list_ctrl.insert_row(index, count)
+            self.data_list_ctrl.EnsureVisible(index)
+        elif event == CHANGE_UPDATE:
+            self.data_list_ctrl.refresh_row(index)
+        elif event == CHANGE_DELETE:
+            self.data_list_ctrl.remove_row(index, count)
+        else:
+            self.refresh_listctrl()
+
+    def _select_index(self, index: Optional[int]) -> None:
+        """편집할 항목을 정하고 그 행 ID를 기억합니다."""
+        row_ids = self.data_manager.row_ids
+        if index is None or not 0 <= index < len(row_ids.ids):
+            self.selected_index = None
+            self.selected_row_id = None
+        else:
+            self.selected_index = index
+            self.selected_row_id = row_ids.id_at(index)
+
+    def _follow_selection(self) -> None:
+        """변경 뒤 편집 중인 항목의 새 위치를 찾고, 삭제되었으면 편집을 끝냅니다."""
+        if self.selected_row_id is None:
+            return
+        index = self.data_manager.row_ids.position(self.selected_row_id)
+        if index is not None:
+            # 다시 로드되었으면 새 행 ID로 바꿔 둠
+            self._select_index(index)
+            return
+        self._select_index(None)
+        if self.is_edit_mode:
+            self.is_edit_mode = False
+            self.show_copy_status("⚠️ 편집 중인 항목이 삭제됨")
+
+    def on_filter_text(self, event) -> None:
+        """검색어 입력 시 리스트를 필터링"""
+        self._apply_filter()
+
+    def on_filter_cancel(self, event) -> None:
+        """검색어 지우기 버튼"""
+        self.filter_text.SetValue("")
+
+    def _apply_filter(self) -> None:
+        """현재 검색어로 행 매핑을 다시 구하고 리스트 행 개수를 갱신합니다."""
+        query = self.filter_text.GetValue().strip()
+        self._visible_rows = self.data_manager.filter_items(query)
+        # 행 매핑이 바뀌므로 기존 선택 해제
+        selected_row = self.data_list_ctrl.GetFirstSelected()
+        if selected_row != -1:
+            self.data_list_ctrl.Select(selected_row, False)
+        self.data_list_ctrl.set_row_count(self._row_count())
+
+    def _row_count(self) -> int:
+        """리스트에 표시할 행 개수"""
+        if self._visible_rows is not None:
+            return len(self._visible_rows)
+        return self.data_manager.get_item_count()
+
+    def _row_to_index(self, row: int) -> Optional[int]:
+        """리스트 행 번호를 DataManager 인덱스로 바꿉니다."""
+        if self._visible_rows is None:
+            return row
+        if 0 <= row < len(self._visible_rows):
+            return self._visible_rows[row]
+        return None
+
+    def _get_list_item_text(self, row: int, column: int) -> str:
+        """가상 리스트에 표시할 셀 텍스트를 반환합니다."""
+        index = self._row_to_index(row)
+        item = None if index is None else self.data_manager.get_preview(index)
+        if item is None:
+            return ""
+        if column == 0:
+            return item["key"]
+        return self._truncate_value(item["value"])
+
+    def _truncate_value(self, value: str) -> str:
+        """VALUE 컬럼 너비에 맞게 ...을 붙여 잘라냅니다."""
+        dc = wx.ClientDC(self.data_list_ctrl)
+        dc.SetFont(self.data_list_ctrl.GetFont())
+        width = self._value_width or self.data_list_ctrl.GetColumnWidth(1)
+        return self.truncator.truncate(dc, value, width)
+
     def on_add_button_click(self, event) -> None:
         """Add 버튼 클릭 이벤트"""
         if self.input_panel.IsShown():
             self.input_panel.Hide()
             self.add_button.SetLabel("Add")
-            self.selected_index = None
+            self._select_index(None)
             self.is_edit_mode = False
         else:
             self.input_panel.Show()
@@ -458,7 +856,7 @@ class UIManager:
         """New 버튼 클릭 시 입력창을 비우고 새 항목 추가 모드로 전환"""
         self.key_text.SetValue("")
         self.value_text.SetValue("")
-        self.selected_index = None
+        self._select_index(None)
         self.is_edit_mode = False
         self.key_text.SetFocus()
 
@@ -480,41 +878,136 @@ class UIManager:
             if success:
                 self.key_text.Clear()
                 self.value_text.Clear()
-                self.selected_index = None
+                self._select_index(None)
                 self.is_edit_mode = False
-                self.refresh_listctrl()
                 self.key_text.SetFocus()
                 self.show_copy_status("✅ 저장됨")
+            elif self.data_manager.unique_keys and self.data_manager.is_duplicate_key(
+                key, self.selected_index if self.is_edit_mode else None
+            ):
+                self.show_copy_status("❌ 이미 있는 키")
             else:
                 self.show_copy_status("❌ 저장 실패")
 
     def on_listctrl_click(self, event) -> None:
         """리스트 항목 클릭 이벤트"""
-        self.selected_index = event.GetIndex()
+        row = event.GetIndex()
+        self._select_index(self._row_to_index(row))
         self.show_input_fields()
 
-        # 클립보드에 복사
-        key = self.data_list_ctrl.GetItemText(self.selected_index)
-        value = self.data_list_ctrl.GetItem(self.selected_index, 1).GetText()
-
-        if wx.TheClipboard.Open():
-            wx.TheClipboard.SetData(wx.TextDataObject(value))
-            wx.TheClipboard.Close()
+        # 화면의 잘린 문자열이 아닌 저장된 값 전체를 클립보드에 복사
+        value = None
+        if self.selected_index is not None:
+            value = self.data_manager.get_value(self.selected_index)
+        if value is not None:
+            self.copy_to_clipboard(value)
+
+    def copy_to_clipboard(self, value: str) -> bool:
+        """값을 클립보드에 복사하고 결과를 상태 메시지로 표시합니다."""
+        if self.clipboard_history is not None:
+            # 이 앱에서 복사한 값은 클립보드 기록에 다시 넣지 않음
+            self.clipboard_history.ignore(value)
+        with span("ui.clipboard_write") as s:
+            opened = wx.TheClipboard.Open()
+            if opened:
+                wx.TheClipboard.SetData(wx.TextDataObject(value))
+                wx.TheClipboard.Close()
+                if s:
+                    s.add_bytes(len(value.encode("utf-8")))
+        if opened:
             self.show_copy_status("✅ 복사됨")
+            return True
+        wx.MessageBox("클립보드에 접근할 수 없습니다.", "오류", wx.OK | wx.ICON_ERROR)
+        return False
+
+    def enable_clipboard_history(self) -> None:
+        """클립보드 기록 모드를 켭니다.
+
+        다른 프로그램에서 복사한 텍스트를 주기적으로 확인해 저장된 항목 아래의
+        기록 리스트에 보여줍니다. 운영체제가 클립보드 변경 번호를 제공하면
+        번호가 바뀐 경우에만 클립보드를 엽니다.
+        """
+        if self.clipboard_history is not None:
+            return
+        self.clipboard_history = ClipboardHistory(
+            change_counter=clipboard_change_counter()
+        )
+        self.clipboard_timer = wx.Timer(self.frame)
+        self.frame.Bind(wx.EVT_TIMER, self.on_clipboard_poll, self.clipboard_timer)
+        self.clipboard_timer.Start(CLIPBOARD_POLL_INTERVAL)
+
+        self.history_label.Show()
+        self.history_list_ctrl.Show()
+        self.main_panel.Layout()
+
+    def on_clipboard_poll(self, event) -> None:
+        """클립보드가 바뀌었으면 텍스트를 읽어 기록에 추가합니다."""
+        if self.clipboard_history.poll(self._read_clipboard_text):
+            # 새 항목이 맨 위에 오면서 행이 밀리므로 선택 해제
+            selected_row = self.history_list_ctrl.GetFirstSelected()
+            if selected_row != -1:
+                self.history_list_ctrl.Select(selected_row, False)
+            self.history_list_ctrl.set_row_count(len(self.clipboard_history))
+
+    def _read_clipboard_text(self) -> Optional[str]:
+        """클립보드의 텍스트를 읽습니다. 텍스트가 없거나 열 수 없으면 None."""
+        with span("ui.clipboard_read"):
+            if not wx.TheClipboard.Open():
+                return None
+            try:
+                if not wx.TheClipboard.IsSupported(wx.DataFormat(wx.DF_UNICODETEXT)):
+                    return None
+                data = wx.TextDataObject()
+                if not wx.TheClipboard.GetData(data):
+                    return None
+                return data.GetText()
+            finally:
+                wx.TheClipboard.Close()
+
+    def _get_history_item_text(self, row: int, column: int) -> str:
+        """기록 리스트에 표시할 텍스트 (첫 줄만, 너비에 맞게 ... 처리)"""
+        entry = self.clipboard_history.get(row) if self.clipboard_history else None
+        if entry is None:
+            return ""
+        lines = entry.text.strip().splitlines()
+        dc = wx.ClientDC(self.history_list_ctrl)
+        dc.SetFont(self.history_list_ctrl.GetFont())
+        width = self._history_width or self.history_list_ctrl.GetColumnWidth(0)
+        return self.truncator.truncate(dc, lines[0] if lines else "", width)
+
+    def on_history_resize(self, event) -> None:
+        """기록 리스트 크기 변경 시 컬럼을 전체 너비로 맞춤"""
+        width = self.history_list_ctrl.GetClientSize().GetWidth()
+        self.history_list_ctrl.SetColumnWidth(0, width)
+        if width != self._history_width:
+            self.resize_timer.StartOnce(RESIZE_SETTLE_DELAY)
+        event.Skip()
+
+    def on_history_click(self, event) -> None:
+        """기록 항목 클릭: 전체 텍스트를 다시 복사"""
+        entry = self.clipboard_history.get(event.GetIndex())
+        if entry is not None:
+            self.copy_to_clipboard(entry.text)
+
+    def on_history_activate(self, event) -> None:
+        """기록 항목 더블클릭: 첫 줄을 키로 저장소에 추가하고 기록에서 뺌"""
+        entry = self.clipboard_history.get(event.GetIndex())
+        if entry is None:
+            return
+        if self.data_manager.add_item(entry.suggested_key(), entry.text):
+            self.clipboard_history.remove(entry)
+            self.history_list_ctrl.Select(event.GetIndex(), False)
+            self.history_list_ctrl.set_row_count(len(self.clipboard_history))
+            self.show_copy_status("✅ 저장됨")
         else:
-            wx.MessageBox(
-                "클립보드에 접근할 수 없습니다.", "오류", wx.OK | wx.ICON_ERROR
-            )
+            self.show_copy_status("❌ 저장 실패")
 
     def on_delete(self, event) -> None:
         """Delete 버튼 클릭 이벤트"""
-        selected_index = self.data_list_ctrl.GetFirstSelected()
-        if selected_index != -1:
+        selected_row = self.data_list_ctrl.GetFirstSelected()
+        selected_index = self._row_to_index(selected_row)
+        if selected_row != -1 and selected_index is not None:
             if self.data_manager.delete_data(selected_index):
-                self.refresh_listctrl()
-                if self.selected_index == selected_index:
-                    self.selected_index = None
-                    self.is_edit_mode = False
                 self.show_copy_status("🗑️ 삭제됨")
             else:
                 self.show_copy_status("❌ 삭제 실패")
@@ -526,11 +1019,12 @@ class UIManager:
         self.save_button.Show()
 
         # 선택된 항목이 있으면 입력창에 값 채우기
+        item = None
         if self.selected_index is not None:
-            key = self.data_list_ctrl.GetItemText(self.selected_index)
-            value = self.data_list_ctrl.GetItem(self.selected_index, 1).GetText()
-            self.key_text.SetValue(key)
-            self.value_text.SetValue(value)
+            item = self.data_manager.get_item(self.selected_index)
+        if item is not None:
+            self.key_text.SetValue(item["key"])
+            self.value_text.SetValue(item["value"])
             self.is_edit_mode = True
         else:
             self.key_text.SetValue("")
@@ -540,12 +1034,7 @@ class UIManager:
         self.key_text.SetFocus()
 
     def show_copy_status(self, message: str) -> None:
-        """복사 상태 메시지 표시"""
-        if self.status_frame is not None:
-            try:
-                self.status_frame.Close()
-            except Exception:
-                pass
-            self.status_frame = None
-        self.status_frame = StatusFrame(self.frame, message, self.font_size)
-        self.status_frame.show_temporarily(STATUS_DISPLAY_TIME)
+        """복사 상태 메시지 표시 (토스트 창은 처음 한 번만 만들고 재사용)"""
+        if self.status_frame is None:
+            self.status_frame = StatusFrame(self.frame, self.font_size)
+        self.status_frame.show_message(message, STATUS_DISPLAY_TIME)
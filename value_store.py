@@ -0,0 +1,164 @@
+"""
+큰 값을 별도 파일(blob 파일)에 보관하는 모듈입니다.
+값은 파일 끝에 이어 붙이고 (오프셋, 길이)로 참조하며,
+읽을 때는 mmap으로 필요한 부분만 가져옵니다.
+"""
+
+import mmap
+import os
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+# 항목에 저장되는 blob 참조: [오프셋, 바이트 길이] (JSON에 그대로 기록됨)
+BlobRef = List[int]
+
+
+class BlobStore:
+    """append-only blob 파일 관리 클래스
+
+    put()은 파일 끝에 값을 쓰고 참조를 반환합니다. 쓰기는 버퍼를 비우기만
+    하므로, 참조를 스냅샷이나 저널에 기록하기 전에 sync()를 호출해야 합니다.
+    삭제되거나 바뀐 값이 차지하던 공간은 rewrite()로 새 파일에 옮길 때
+    회수됩니다. read_only=True면 파일을 만들거나 쓰지 않고 읽기만 합니다.
+    """
+
+    def __init__(self, path: str, read_only: bool = False):
+        self.path = path
+        self.read_only = read_only
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._size = 0
+        self._unsynced = False
+
+    def _open(self):
+        if self._file is None:
+            if self.read_only:
+                self._file = open(self.path, "rb")
+                self._size = os.fstat(self._file.fileno()).st_size
+                return self._file
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "a+b")
+            self._file.seek(0, os.SEEK_END)
+            self._size = self._file.tell()
+        return self._file
+
+    def size(self) -> int:
+        """파일 크기(바이트)"""
+        self._open()
+        return self._size
+
+    def put(self, raw: bytes) -> BlobRef:
+        """UTF-8로 인코딩된 값을 파일 끝에 추가하고 참조를 반환합니다."""
+        f = self._open()
+        f.write(raw)
+        f.flush()
+        # 추가 모드이므로 쓰기 직후 위치가 파일 끝
+        self._size = f.tell()
+        self._unsynced = True
+        return [self._size - len(raw), len(raw)]
+
+    def read(self, ref: Sequence[int], limit: Optional[int] = None) -> bytes:
+        """참조가 가리키는 바이트를 읽습니다 (limit이 있으면 앞부분만)."""
+        offset, length = ref
+        if limit is not None:
+            length = min(length, limit)
+        if length <= 0:
+            return b""
+        end = offset + length
+        if self._mmap is None or end > len(self._mmap):
+            self._remap(end)
+        return self._mmap[offset:end]
+
+    def get(self, ref: Sequence[int]) -> str:
+        """참조가 가리키는 값 전체"""
+        return self.read(ref).decode("utf-8")
+
+    def preview(self, ref: Sequence[int], length: int) -> str:
+        """값의 앞부분 length글자 (값 전체를 읽지 않음)"""
+        # UTF-8은 한 글자가 최대 4바이트이고, 잘린 마지막 글자는 버림
+        raw = self.read(ref, limit=length * 4)
+        return raw.decode("utf-8", errors="ignore")[:length]
+
+    def _remap(self, end: int) -> None:
+        """파일이 커졌으면 mmap을 다시 만듭니다."""
+        f = self._open()
+        if end > self._size:
+            # 같은 파일을 공유하는 다른 인스턴스가 추가한 값일 수 있음
+            self._size = os.fstat(f.fileno()).st_size
+        if end > self._size:
+            raise ValueError(f"blob 참조가 파일 범위를 벗어났습니다: {self.path}")
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap = mmap.mmap(f.fileno(), self._size, access=mmap.ACCESS_READ)
+
+    def sync(self) -> None:
+        """추가한 값들을 디스크에 기록합니다 (put()에서 버퍼는 이미 비움)."""
+        if self._file is not None and self._unsynced:
+            # fsync 도중 추가된 값은 다음 sync()에서 기록되도록 먼저 표시를 지움
+            self._unsynced = False
+            os.fsync(self._file.fileno())
+
+    def rewrite(
+        self, path: str, refs: Sequence[Sequence[int]]
+    ) -> Tuple["BlobStore", List[BlobRef]]:
+        """refs가 가리키는 값들만 새 blob 파일에 복사합니다.
+
+        새 저장소와, refs와 같은 순서의 새 참조 목록을 반환합니다.
+        """
+        if os.path.exists(path):
+            os.remove(path)
+        target = BlobStore(path)
+        new_refs = [target.put(self.read(ref)) for ref in refs]
+        target.sync()
+        return target, new_refs
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ValueCache:
+    """blob 값 LRU 캐시
+
+    항목 수가 아니라 값의 바이트 수 합계를 max_bytes 이하로 유지합니다.
+    예산보다 큰 값은 캐시하지 않습니다.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[int, int], str]" = OrderedDict()
+        self._size = 0
+
+    def get(self, ref: Sequence[int]) -> Optional[str]:
+        key = (ref[0], ref[1])
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, ref: Sequence[int], value: str) -> None:
+        size = ref[1]
+        if size > self.max_bytes:
+            return
+        key = (ref[0], ref[1])
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return
+        self._entries[key] = value
+        self._size += size
+        while self._size > self.max_bytes:
+            (_, evicted_size), _ = self._entries.popitem(last=False)
+            self._size -= evicted_size
+
+    def size(self) -> int:
+        """캐시된 값들의 바이트 수 합계"""
+        return self._size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
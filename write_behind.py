@@ -0,0 +1,158 @@
+"""
+백그라운드 저장(write-behind)을 담당하는 모듈입니다.
+변경 시 저장 요청만 표시하고, 별도 스레드가 짧은 시간 동안 모인 요청을
+한 번의 쓰기로 합쳐 처리합니다.
+"""
+
+import os
+import stat
+import tempfile
+import threading
+import time
+from typing import Callable, Optional
+from constants import WRITE_BEHIND_DELAY
+
+
+def _current_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# 스레드에서 umask를 바꾸지 않도록 시작 시 한 번만 읽음
+_UMASK = _current_umask()
+
+
+def atomic_write(path: str, raw: bytes) -> None:
+    """임시 파일에 쓰고 fsync한 뒤 os.replace로 교체합니다.
+
+    쓰는 도중 프로세스가 죽어도 기존 파일은 그대로 남습니다.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp는 0600으로 만들므로 기존 파일(없으면 umask)의 권한을 따름
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except OSError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_directory(directory)
+
+
+def _fsync_directory(directory: str) -> None:
+    """rename 결과가 디스크에 남도록 디렉토리를 fsync합니다 (POSIX 전용)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class WriteBehindSaver:
+    """저장 요청을 모아 백그라운드 스레드에서 처리하는 클래스
+
+    mark_dirty()는 바로 반환되며, 스레드가 delay초 동안 추가 요청을 기다린 뒤
+    write_fn을 한 번 호출합니다. flush()를 호출하면 대기 없이 즉시 기록하고
+    끝날 때까지 기다립니다.
+    """
+
+    def __init__(self, write_fn: Callable[[], None], delay: float = WRITE_BEHIND_DELAY):
+        self.write_fn = write_fn
+        self.delay = delay
+        self._cond = threading.Condition()
+        self._dirty = False
+        self._writing = False
+        self._urgent = False
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="write-behind", daemon=True
+        )
+        self._thread.start()
+
+    def mark_dirty(self) -> None:
+        """저장이 필요함을 표시합니다."""
+        with self._cond:
+            self._dirty = True
+            self._cond.notify_all()
+
+    def is_idle(self) -> bool:
+        """대기 중이거나 진행 중인 쓰기가 없는지 반환합니다."""
+        with self._cond:
+            return not self._dirty and not self._writing
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """대기 중인 쓰기를 즉시 수행하고 끝날 때까지 기다립니다."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._urgent = True
+            self._cond.notify_all()
+            try:
+                while self._dirty or self._writing:
+                    if deadline is None:
+                        self._cond.wait()
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+                return True
+            finally:
+                # 시간 초과로 끝나도 이후 쓰기는 다시 모아서 처리
+                self._urgent = False
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """남은 쓰기를 마치고 스레드를 종료합니다."""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return flushed
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._dirty and not self._stopped:
+                    self._cond.wait()
+                if not self._dirty:
+                    return
+                # 짧게 기다리며 연속된 변경을 한 번의 쓰기로 합침
+                deadline = time.monotonic() + self.delay
+                while not self._urgent and not self._stopped:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                self._dirty = False
+                self._writing = True
+
+            try:
+                self.write_fn()
+            except Exception as e:
+                print(f"백그라운드 저장 중 오류 발생: {e}")
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()